@@ -1,13 +1,49 @@
 """Azure DevOps python SDK."""
 
+from __future__ import annotations
+
+
 __version__ = "v0"
 
-from .build import Build
-from .core import _BaseClient, api
-from .distributed_task import DistributedTask
-from .git import Git
-from .pipelines import Pipelines
-from .work_item_tracking import Wit
+import importlib
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .core import DEFAULT_CONCURRENCY, _BaseClient, api
+
+
+if TYPE_CHECKING:
+    from .build import Build
+    from .distributed_task import DistributedTask
+    from .git import Git
+    from .multi import FanOutResult, MultiClient, ProjectKey
+    from .pipelines import Pipelines
+    from .work_item_tracking import Wit
+
+
+_LAZY_ATTRIBUTES = {
+    "Build": ".build",
+    "DistributedTask": ".distributed_task",
+    "Git": ".git",
+    "MultiClient": ".multi",
+    "Pipelines": ".pipelines",
+    "Wit": ".work_item_tracking",
+}
+"""Attributes imported from their submodule on first access, keeping ``import ado``
+cheap.
+"""
+
+_R = TypeVar("_R")
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily loaded attributes on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
 
 
 class Client(_BaseClient):
@@ -32,3 +68,21 @@ class Client(_BaseClient):
     @api
     def wit(self) -> Wit:
         """Work item tracking API."""
+
+    def fan_out(
+        self,
+        fn: Callable[[Client], _R],
+        *,
+        projects: Iterable[str | ProjectKey],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[FanOutResult[_R]]:
+        """Call ``fn`` with a client for each project concurrently, yielding results
+        tagged with their project as they complete. Projects are names within this
+        client's organization or ``(organization, project)`` pairs.
+        """
+        from .multi import fan_out  # noqa: PLC0415
+
+        return fan_out(self, fn, projects, concurrency)
+
+
+__all__ = ["Client", "MultiClient"]
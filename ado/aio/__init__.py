@@ -0,0 +1,36 @@
+"""Asyncio Azure DevOps client.
+
+Requires the ``aio`` extra (``httpx``).
+"""
+
+from ..core import api
+from .build import Build
+from .core import _AsyncBaseClient
+from .distributed_task import DistributedTask
+from .git import Git
+from .pipelines import Pipelines
+from .work_item_tracking import Wit
+
+
+class AsyncClient(_AsyncBaseClient):
+    """Async Azure DevOps client."""
+
+    @api
+    def distributed_task(self) -> DistributedTask:
+        """Distributed task API."""
+
+    @api
+    def pipelines(self) -> Pipelines:
+        """Pipelines API."""
+
+    @api
+    def git(self) -> Git:
+        """Repositories API."""
+
+    @api
+    def build(self) -> Build:
+        """Build API."""
+
+    @api
+    def wit(self) -> Wit:
+        """Work item tracking API."""
@@ -0,0 +1,126 @@
+"""Async build API."""
+
+import functools
+from collections.abc import AsyncIterator
+from http import HTTPMethod
+from typing import TYPE_CHECKING, Unpack
+
+from .. import build
+from ..build.definitions import DefinitionInfo, DefinitionsParameters
+from ..build.export import DefinitionCache, ExportResult, _exporter
+from ..core import DEFAULT_CONCURRENCY, endpoint
+from ..download import Destination, DownloadOptions, DownloadResult
+from .core import AsyncEndpoint, concurrent_map
+from .download import AsyncDownloadEndpoint
+
+
+class Builds(AsyncDownloadEndpoint, build.Builds):
+    """Async builds endpoint."""
+
+    if TYPE_CHECKING:
+
+        async def download_log(
+            self,
+            build_id: int,
+            log_id: int,
+            /,
+            dest: Destination,
+            **kwargs: Unpack[DownloadOptions],
+        ) -> DownloadResult:
+            """Stream a build log to ``dest``."""
+
+        async def download_artifact(
+            self,
+            build_id: int,
+            artifact_name: str,
+            /,
+            dest: Destination,
+            **kwargs: Unpack[DownloadOptions],
+        ) -> DownloadResult:
+            """Stream a build artifact to ``dest`` as a zip archive."""
+
+
+class Definitions(AsyncEndpoint, build.Definitions):
+    """Async definitions endpoint."""
+
+    if TYPE_CHECKING:
+
+        async def list_all(
+            self,
+            **params: Unpack[DefinitionsParameters],
+        ) -> list[DefinitionInfo]:
+            """List all definitions."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+            **params: Unpack[DefinitionsParameters],
+        ) -> AsyncIterator[DefinitionInfo]:
+            """Lazily iterate over all definitions."""
+
+    async def export(
+        self,
+        dest: Destination,
+        /,
+        *,
+        cache: DefinitionCache | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **params: Unpack[DefinitionsParameters],
+    ) -> ExportResult:
+        """Stream full definitions to ``dest`` as NDJSON, in listing order.
+
+        Definitions are listed lazily and the full definition of each is fetched,
+        by revision, concurrently. With a ``cache``, definitions whose revision has
+        not changed since they were cached are written from it instead of fetched,
+        and the others are stored in it.
+
+        Args:
+            dest: A file path, or a binary file-like object.
+            cache: Full definitions of previous exports.
+            concurrency: Number of definitions fetched at once.
+            **params: Query parameters for listing the definitions to export.
+
+        Raises:
+            httpx.HTTPStatusError: If a definition could not be fetched.
+        """
+        endpoint = self._untyped()
+        revisions = {} if cache is None else cache.revisions()
+        with _exporter(dest, cache) as exporter:
+            async for entry in concurrent_map(
+                functools.partial(endpoint._export_entry, revisions),
+                endpoint.iter_all(**params),
+                concurrency=concurrency,
+            ):
+                exporter.write(*entry)
+        return exporter.result
+
+    async def _export_entry(
+        self,
+        revisions: dict[int, int],
+        definition: DefinitionInfo,
+    ) -> tuple[int, int, bytes | None]:
+        definition_id, revision = definition["id"], definition["revision"]
+        if revisions.get(definition_id) == revision:
+            return definition_id, revision, None
+        return definition_id, revision, await self._definition(definition_id, revision)
+
+    async def _definition(self, definition_id: int, revision: int) -> bytes:
+        _, response = await self._exchange(
+            HTTPMethod.GET, definition_id, params={"revision": revision}
+        )
+        response.raise_for_status()
+        return response.content
+
+
+class Build(build.Build):
+    """Async build API."""
+
+    @endpoint
+    def builds(self) -> Builds:
+        """Builds endpoint."""
+
+    @endpoint
+    def definitions(self) -> Definitions:
+        """Definitions endpoint."""
@@ -0,0 +1,455 @@
+"""Core async endpoint utilities."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+)
+from http import HTTPMethod, HTTPStatus
+from typing import Any, TypeVar, Unpack
+
+import httpx
+
+from ..core import (
+    CONTINUATION_TOKEN_HEADER,
+    DEFAULT_CONCURRENCY,
+    ClientConfiguration,
+    Endpoint,
+    ListResponse,
+    _BaseClient,
+    _environ,
+)
+from ..instrumentation import RequestStart, RequestTimer
+from ..rate_limit import RETRY_AFTER_STATUSES
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+async def aiterate(  # noqa: UP047
+    items: Iterable[_T] | AsyncIterable[_T],
+) -> AsyncIterator[_T]:
+    """Iterate over a sync or async iterable asynchronously."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def batched(  # noqa: UP047
+    items: Iterable[_T] | AsyncIterable[_T],
+    n: int,
+) -> AsyncIterator[tuple[_T, ...]]:
+    """Async counterpart of ``itertools.batched``."""
+    batch: list[_T] = []
+    async for item in aiterate(items):
+        batch.append(item)
+        if len(batch) == n:
+            yield tuple(batch)
+            batch = []
+    if batch:
+        yield tuple(batch)
+
+
+async def chain(  # noqa: UP047
+    *iterables: Iterable[_T] | AsyncIterable[_T],
+) -> AsyncIterator[_T]:
+    """Async counterpart of ``itertools.chain``."""
+    for items in iterables:
+        async for item in aiterate(items):
+            yield item
+
+
+async def concurrent_map(  # noqa: UP047
+    fn: Callable[[_T], Awaitable[_R]],
+    items: Iterable[_T] | AsyncIterable[_T],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[_R]:
+    """Lazily map ``fn`` over ``items`` as tasks, yielding results in input order. At
+    most ``concurrency`` calls are in flight or buffered at once.
+    """
+    pending: deque[asyncio.Future[_R]] = deque()
+    try:
+        async for item in aiterate(items):
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+            pending.append(asyncio.ensure_future(fn(item)))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class AsyncClientConfiguration(ClientConfiguration, total=False):
+    """Async client configuration items."""
+
+    max_concurrency: int
+    """Maximum number of requests in flight at once. Defaults to the pool size."""
+
+
+class AsyncSession:
+    """Async HTTP transport with a shared connection pool and bounded concurrency."""
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Create the underlying connection pool and concurrency limit."""
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+        )
+        self.client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=max_retries),
+            timeout=60,
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency or pool_size)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        auth: Any = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request once a concurrency slot is available. With ``stream=True``,
+        the slot is released once the response headers are received and the body is
+        left unread.
+        """
+        async with self.semaphore:
+            request = self.client.build_request(method, url, **kwargs)
+            return await self.client.send(request, auth=auth, stream=stream)
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self.client.aclose()
+
+
+class _AsyncBaseClient(_BaseClient):
+    # Async clients and endpoints replace the sync transport
+    session: AsyncSession  # type: ignore[assignment]
+
+    def __init__(self, **kwargs: Unpack[AsyncClientConfiguration]) -> None:
+        # max_concurrency is left in for _create_session
+        configuration: ClientConfiguration = kwargs
+        super().__init__(**configuration)
+
+    @staticmethod
+    def _create_session(**kwargs: Unpack[AsyncClientConfiguration]) -> AsyncSession:
+        return AsyncSession(
+            pool_size=kwargs.get("pool_size", 10),
+            max_retries=kwargs.get("max_retries", 3),
+            max_concurrency=kwargs.get("max_concurrency"),
+        )
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self.session.close()
+
+    async def __aenter__(self) -> _AsyncBaseClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+
+class AsyncEndpoint(Endpoint):
+    """An Azure DevOps endpoint whose calls are awaitable."""
+
+    session: AsyncSession  # type: ignore[assignment]
+
+    async def _call(
+        self,
+        method: HTTPMethod,
+        *url_parts: Any,
+        params: dict[str, Any] | None = None,
+        payload: Any | None = None,
+        headers: dict[str, Any] | None = None,
+        data: bytes | None = None,
+    ) -> Any:
+        value, _ = await self._fetch(
+            method,
+            *url_parts,
+            params=params,
+            payload=payload,
+            headers=headers,
+            data=data,
+        )
+        return value
+
+    async def _fetch(
+        self,
+        method: HTTPMethod,
+        *url_parts: Any,
+        params: dict[str, Any] | None = None,
+        payload: Any | None = None,
+        headers: dict[str, Any] | None = None,
+        data: bytes | None = None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Send a request, returning the decoded body and response headers. GET
+        requests go through the client's coalescer and response cache, if any.
+        """
+        if method != HTTPMethod.GET or (self.cache is None and self.coalescer is None):
+            value, response = await self._exchange(
+                method,
+                *url_parts,
+                params=params,
+                payload=payload,
+                headers=headers,
+                data=data,
+                decode=self.decoder.decode,
+            )
+            return value, response.headers
+
+        key = self._cache_key(*url_parts, params=params)
+        fetch = functools.partial(
+            self._get, key, *url_parts, params=params, headers=headers
+        )
+        if self.coalescer is None:
+            return await fetch()
+        return await self.coalescer.acall(key, fetch)
+
+    async def _get(
+        self,
+        key: str,
+        *url_parts: Any,
+        params: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        if self.cache is None:
+            value, response = await self._exchange(
+                HTTPMethod.GET,
+                *url_parts,
+                params=params,
+                headers=headers,
+                decode=self.decoder.decode,
+            )
+            return value, response.headers
+
+        entry, fresh = self.cache.lookup(key)
+        if entry is not None:
+            if fresh:
+                return entry["value"], entry["headers"]
+            headers = (headers or {}) | {"If-None-Match": entry["etag"]}
+
+        value, response = await self._exchange(
+            HTTPMethod.GET,
+            *url_parts,
+            params=params,
+            headers=headers,
+            decode=self.decoder.decode,
+        )
+        return self.cache.update(
+            key,
+            entry,
+            status=response.status_code,
+            headers=response.headers,
+            decode=lambda: value,
+            ttl=self.cache.ttl_for(type(self)),
+        )
+
+    async def _send(
+        self,
+        method: HTTPMethod,
+        *url_parts: Any,
+        params: dict[str, Any] | None = None,
+        payload: Any | None = None,
+        headers: dict[str, Any] | None = None,
+        data: bytes | None = None,
+    ) -> httpx.Response:
+        _, response = await self._exchange(
+            method,
+            *url_parts,
+            params=params,
+            payload=payload,
+            headers=headers,
+            data=data,
+        )
+        return response
+
+    async def _exchange(
+        self,
+        method: HTTPMethod,
+        *url_parts: Any,
+        params: dict[str, Any] | None = None,
+        payload: Any | None = None,
+        headers: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+        stream: bool = False,
+    ) -> tuple[Any, httpx.Response]:
+        """Send a request, retrying as directed by the rate limiter, and decode the
+        final response body with ``decode`` (unless it is a 304). With
+        ``stream=True``, the body of the final response is left unread instead. Every
+        attempt is reported to the request hooks, with a timing breakdown traced from
+        ``httpcore``.
+
+        Raises:
+            httpx.HTTPStatusError: If a body to decode is still throttled (429 or 503)
+                once retries are exhausted.
+        """
+        url = self._request_url(*url_parts)
+        attempt = 0
+        while True:
+            queued = 0.0
+            if self.rate_limiter is not None:
+                await asyncio.sleep(queued := self.rate_limiter.reserve())
+            extensions: dict[str, Any] = {}
+            if self.hooks:
+                timer = RequestTimer(
+                    self.hooks,
+                    RequestStart(
+                        endpoint=type(self),
+                        method=str(method),
+                        url=url,
+                        attempt=attempt,
+                    ),
+                    queued,
+                )
+                extensions["trace"] = timer.trace
+            response = await self.session.request(
+                str(method),
+                url,
+                params=self._request_params(params),
+                auth=("", _environ("AZURE_DEVOPS_PAT")),
+                headers={"Accept": "application/json"} | (headers or {}),
+                json=payload,
+                content=data,
+                extensions=extensions,
+                stream=stream,
+            )
+            if self.hooks:
+                timer.received()
+            delay = None
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.observe(
+                    response.status_code,
+                    response.headers,
+                    attempt,
+                )
+            # Retries are exhausted: the body is an error, not the expected value
+            throttled = (
+                delay is None
+                and decode is not None
+                and response.status_code in RETRY_AFTER_STATUSES
+            )
+            value = None
+            if (
+                delay is None
+                and decode is not None
+                and not throttled
+                and response.status_code != HTTPStatus.NOT_MODIFIED
+            ):
+                value = decode(response.content)
+            if self.hooks:
+                timer.end(
+                    status=response.status_code,
+                    headers=response.headers,
+                    bytes_in=int(response.headers.get("Content-Length", 0))
+                    if stream
+                    else len(response.content),
+                    bytes_out=len(response.request.content),
+                )
+            if throttled:
+                response.raise_for_status()
+            if delay is None:
+                return value, response
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def list_all(self, **params: Any) -> list[dict[str, Any]]:
+        """List all entities in endpoint."""
+        return [item async for item in self.iter_all(**params)]
+
+    async def iter_all(
+        self,
+        *,
+        page_size: int | None = None,
+        prefetch: bool = True,
+        **params: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Lazily iterate over all entities in endpoint, following continuation
+        tokens.
+
+        Args:
+            page_size: Number of entities to request per page (``$top``).
+            prefetch: Fetch the next page in the background while the current one is
+                being consumed. At most two pages are held in memory at once.
+            **params: Query parameters for the list request.
+        """
+        if page_size is not None:
+            params["$top"] = page_size
+
+        page: asyncio.Future[tuple[Iterable[dict[str, Any]], str | None]] | None
+        page = asyncio.ensure_future(self._list_page(params))
+        try:
+            while page is not None:
+                items, token = await page
+                next_params = params | {"continuationToken": token}
+                page = None
+                if token and prefetch:
+                    page = asyncio.ensure_future(self._list_page(next_params))
+                for item in items:
+                    yield item
+                if token and not prefetch:
+                    page = asyncio.ensure_future(self._list_page(next_params))
+        finally:
+            if page is not None:
+                page.cancel()
+
+    async def _list_page(
+        self,
+        params: dict[str, Any],
+    ) -> tuple[Iterable[dict[str, Any]], str | None]:
+        if self.cache is not None or self.coalescer is not None:
+            list_response: ListResponse
+            list_response, headers = await self._fetch(HTTPMethod.GET, params=params)
+            return (
+                self._records(list_response["value"]),
+                headers.get(CONTINUATION_TOKEN_HEADER),
+            )
+
+        items, response = await self._exchange(
+            HTTPMethod.GET,
+            params=params,
+            decode=lambda content: self.decoder.decode_items(content, self.item_type),
+        )
+        return (
+            self._records(items),
+            response.headers.get(CONTINUATION_TOKEN_HEADER),
+        )
+
+    async def get(self, id: int, /) -> dict[str, Any]:
+        """Get an entity by id."""
+        if self.cache is not None or self.coalescer is not None:
+            item = await self._call(HTTPMethod.GET, id)
+        else:
+            item, _ = await self._exchange(
+                HTTPMethod.GET,
+                id,
+                decode=lambda content: self.decoder.decode_item(
+                    content, self.item_type
+                ),
+            )
+        if self.records is None or self.item_type is None:
+            return item
+        return self.records.build(self.item_type, item)
@@ -0,0 +1,34 @@
+"""Async distributed task API."""
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from .. import distributed_task
+from ..core import endpoint
+from ..distributed_task.variable_groups import VariableGroupInfo
+from .core import AsyncEndpoint
+
+
+class VariableGroups(AsyncEndpoint, distributed_task.VariableGroups):
+    """Async variable groups endpoint."""
+
+    if TYPE_CHECKING:
+
+        async def list_all(self) -> list[VariableGroupInfo]:
+            """List all variable groups."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+        ) -> AsyncIterator[VariableGroupInfo]:
+            """Lazily iterate over all variable groups."""
+
+
+class DistributedTask(distributed_task.DistributedTask):
+    """Async distributed task API."""
+
+    @endpoint
+    def variable_groups(self) -> VariableGroups:
+        """Variable groups endpoint."""
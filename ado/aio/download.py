@@ -0,0 +1,121 @@
+"""Async streaming downloads of binary content."""
+
+import functools
+from collections.abc import Awaitable, Callable
+from http import HTTPMethod, HTTPStatus
+from pathlib import Path
+from typing import Any, BinaryIO, Unpack
+
+from ..download import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_PART_SIZE,
+    Destination,
+    DownloadEndpoint,
+    DownloadOptions,
+    DownloadResult,
+    _content_size,
+    _open,
+    _parts,
+    _range_headers,
+    _restarted,
+)
+from .core import AsyncEndpoint, concurrent_map
+
+
+class AsyncDownloadEndpoint(AsyncEndpoint, DownloadEndpoint):
+    """An endpoint serving binary content that is streamed in chunks, so downloads
+    of any size use constant memory.
+    """
+
+    async def _download(
+        self,
+        *url_parts: Any,
+        dest: Destination,
+        params: dict[str, Any] | None = None,
+        accept: str = "application/octet-stream",
+        **kwargs: Unpack[DownloadOptions],
+    ) -> DownloadResult:
+        """Stream content to ``dest``.
+
+        Parallel downloads fall back to a single request if the server answers the
+        first part with the whole content.
+
+        Raises:
+            httpx.HTTPStatusError: If the content could not be downloaded.
+            ValueError: If the server answers a later part of a parallel download with
+                the whole content.
+        """
+        resume = kwargs.get("resume", False)
+        parallel = kwargs.get("parallel", 1)
+        part_size = kwargs.get("part_size", DOWNLOAD_PART_SIZE)
+        download_range = functools.partial(
+            self._download_range,
+            *url_parts,
+            params=params,
+            accept=accept,
+            chunk_size=kwargs.get("chunk_size", DOWNLOAD_CHUNK_SIZE),
+        )
+        with _open(dest, resume=resume) as (file, path):
+            offset = file.tell() if resume else 0
+            split = parallel > 1 and path is not None and not offset
+            size, downloaded = await download_range(
+                file=file,
+                start=offset,
+                end=part_size - 1 if split else None,
+            )
+        if split and path is not None and downloaded < size:
+            # The first part confirmed range support: fetch the others concurrently
+            parts = concurrent_map(
+                functools.partial(self._download_part, download_range, path),
+                _parts(size, part_size),
+                concurrency=parallel,
+            )
+            downloaded += sum([part async for part in parts])
+        return DownloadResult(path=path, size=size, downloaded=downloaded)
+
+    @staticmethod
+    async def _download_part(
+        download_range: Callable[..., Awaitable[tuple[int, int]]],
+        path: str,
+        part: tuple[int, int],
+    ) -> int:
+        start, end = part
+        with Path(path).open("r+b") as file:
+            file.seek(start)
+            _, downloaded = await download_range(file=file, start=start, end=end)
+        return downloaded
+
+    async def _download_range(
+        self,
+        *url_parts: Any,
+        file: BinaryIO,
+        start: int,
+        end: int | None,
+        params: dict[str, Any] | None,
+        accept: str,
+        chunk_size: int,
+    ) -> tuple[int, int]:
+        """Stream bytes ``start`` to ``end`` of the content into ``file``, returning
+        the size of the content and the number of bytes written.
+        """
+        _, response = await self._exchange(
+            HTTPMethod.GET,
+            *url_parts,
+            params=params,
+            headers=_range_headers(accept, start, end),
+            stream=True,
+        )
+        try:
+            if response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                # Nothing left to resume
+                return start, 0
+            response.raise_for_status()
+            if _restarted(response.status_code, start, end):
+                file.seek(start := 0)
+                file.truncate()
+            downloaded = 0
+            async for chunk in response.aiter_bytes(chunk_size):
+                downloaded += file.write(chunk)
+        finally:
+            await response.aclose()
+        return _content_size(response.headers, start + downloaded), downloaded
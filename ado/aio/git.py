@@ -0,0 +1,144 @@
+"""Async git API."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from http import HTTPMethod
+from typing import TYPE_CHECKING, Unpack
+
+from .. import git
+from ..core import DEFAULT_CONCURRENCY, endpoint
+from ..download import Destination, DownloadOptions, DownloadResult
+from ..git import commits, refs
+from ..git.commits import CommitInfo
+from ..git.inventory import RepoStats, _RefCounter
+from ..git.refs import REFS_PAGE_SIZE, RefInfo, RefsParameters
+from ..git.repositories import RepoInfo, RepositoriesParameters, is_active
+from .core import AsyncEndpoint, concurrent_map
+from .download import AsyncDownloadEndpoint
+
+
+class Refs(AsyncEndpoint, refs.Refs):
+    """Async refs endpoint."""
+
+    if TYPE_CHECKING:
+
+        async def list_all(self, **params: Unpack[RefsParameters]) -> list[RefInfo]:
+            """List all refs."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+            **params: Unpack[RefsParameters],
+        ) -> AsyncIterator[RefInfo]:
+            """Lazily iterate over all refs."""
+
+
+class Commits(AsyncEndpoint, commits.Commits):
+    """Async commits endpoint."""
+
+    async def latest(self, branch: str | None = None) -> CommitInfo | None:
+        """Most recent commit on a branch (``refs/heads/`` prefix optional), or on the
+        default branch. ``None`` if the branch has no commits.
+        """
+        commits = await self._call(HTTPMethod.GET, params=self._latest_params(branch))
+        return next(iter(self._records(commits["value"])), None)
+
+
+class Repositories(AsyncDownloadEndpoint, git.Repositories):
+    """Async repositories endpoint."""
+
+    if TYPE_CHECKING:
+
+        async def list_all(
+            self,
+            **params: Unpack[RepositoriesParameters],
+        ) -> list[RepoInfo]:
+            """List all repositories."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+            **params: Unpack[RepositoriesParameters],
+        ) -> AsyncIterator[RepoInfo]:
+            """Lazily iterate over all repositories."""
+
+        async def download_item(
+            self,
+            repository_id: str,
+            path: str,
+            /,
+            dest: Destination,
+            *,
+            version: str | None = None,
+            **kwargs: Unpack[DownloadOptions],
+        ) -> DownloadResult:
+            """Stream the content of a file in a repository to ``dest``."""
+
+        async def download_blob(
+            self,
+            repository_id: str,
+            object_id: str,
+            /,
+            dest: Destination,
+            **kwargs: Unpack[DownloadOptions],
+        ) -> DownloadResult:
+            """Stream a blob, by its SHA-1 object id, to ``dest``."""
+
+    def refs(self, repository_id: str, /) -> Refs:
+        """Refs endpoint of a repository, by id or name."""
+        return Refs(*self.parts, str(repository_id), **self._configuration())
+
+    def commits(self, repository_id: str, /) -> Commits:
+        """Commits endpoint of a repository, by id or name."""
+        return Commits(*self.parts, str(repository_id), **self._configuration())
+
+    async def _stats(self, repository: RepoInfo) -> RepoStats:
+        counter = _RefCounter()
+        async for ref in self.refs(repository["id"]).iter_all(
+            page_size=REFS_PAGE_SIZE, prefetch=False
+        ):
+            counter.add(ref)
+        commit = None
+        if default_branch := repository.get("defaultBranch"):
+            commit = await self.commits(repository["id"]).latest(default_branch)
+        return counter.stats(repository, commit)
+
+
+class Git(git.Git):
+    """Async git API."""
+
+    @endpoint
+    def repositories(self) -> Repositories:
+        """Repositories endpoint."""
+
+    async def inventory(
+        self,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **params: Unpack[RepositoriesParameters],
+    ) -> AsyncIterator[RepoStats]:
+        """Lazily yield statistics of every repository, in listing order.
+
+        Repositories are listed lazily, skipping disabled repositories and those in
+        maintenance, and the refs and latest commit of each are fetched concurrently.
+        """
+        repositories = self.repositories._untyped()
+        async for stats in concurrent_map(
+            repositories._stats,
+            _active_repositories(repositories.iter_all(**params)),
+            concurrency=concurrency,
+        ):
+            yield stats
+
+
+async def _active_repositories(
+    repositories: AsyncIterator[RepoInfo],
+) -> AsyncIterator[RepoInfo]:
+    async for repository in repositories:
+        if is_active(repository):
+            yield repository
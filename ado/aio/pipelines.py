@@ -0,0 +1,104 @@
+"""Async pipelines API."""
+
+from collections.abc import Mapping
+from http import HTTPMethod
+from typing import Any
+
+from .. import pipelines
+from ..core import DEFAULT_CONCURRENCY, endpoint
+from ..pipelines import pipeline_permissions
+from ..pipelines.pipeline_permissions import (
+    GrantResult,
+    ResourcePermissionsPatch,
+    VariableGroupPermissionInfo,
+    VariableGroupPermissionResponse,
+)
+from .core import AsyncEndpoint, concurrent_map
+
+
+class VariableGroupPermissions(
+    AsyncEndpoint,
+    pipeline_permissions.VariableGroupPermissions,
+):
+    """Async variable group permissions endpoint."""
+
+    async def grant(
+        self,
+        variable_group_id: int,
+        /,
+        *,
+        pipeline_ids: list[int],
+        fetch_existing: bool = False,
+    ) -> VariableGroupPermissionResponse:
+        """Grant pipelines permissions to a variable group."""
+        existing = await self.get(variable_group_id) if fetch_existing else []
+        payload = self._grant_payload(pipeline_ids, existing)
+        return await self._call(HTTPMethod.PATCH, variable_group_id, payload=payload)
+
+    async def grant_many(
+        self,
+        grants: Mapping[int, list[int]],
+        /,
+        *,
+        fetch_existing: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[int, GrantResult]:
+        """Grant pipelines permissions to many variable groups."""
+        existing: dict[int, list[VariableGroupPermissionInfo]] = {}
+        if fetch_existing:
+            existing = dict(
+                zip(
+                    grants,
+                    [
+                        permissions
+                        async for permissions in concurrent_map(
+                            self.get, grants, concurrency=concurrency
+                        )
+                    ],
+                    strict=True,
+                )
+            )
+        batches = concurrent_map(
+            self._resource_batch().update,
+            self._grant_many_batches(grants, existing),
+            concurrency=concurrency,
+        )
+        return self._grant_results(grants, [batch async for batch in batches])
+
+    def _resource_batch(self) -> "PipelinePermissions":
+        return PipelinePermissions(*self.parts[:-2], **self._configuration())
+
+    async def get(
+        self,
+        variable_group_id: int,
+        /,
+    ) -> list[VariableGroupPermissionInfo]:
+        """Get variable group permissions."""
+        response: VariableGroupPermissionResponse = await super().get(  # type: ignore[assignment]
+            variable_group_id
+        )
+        return response["pipelines"]
+
+
+class PipelinePermissions(AsyncEndpoint, pipelines.PipelinePermissions):
+    """Async pipeline permissions endpoint."""
+
+    async def update(
+        self,
+        resources: list[ResourcePermissionsPatch],
+        /,
+    ) -> dict[str, Any]:
+        """Update the pipeline permissions of many resources in a single request."""
+        return await self._call(HTTPMethod.PATCH, payload=resources)
+
+    @endpoint
+    def variable_groups(self) -> VariableGroupPermissions:
+        """Variable group permissions endpoint."""
+
+
+class Pipelines(pipelines.Pipelines):
+    """Async pipelines API."""
+
+    @endpoint
+    def pipeline_permissions(self) -> PipelinePermissions:
+        """Pipeline permissions endpoint."""
@@ -0,0 +1,499 @@
+"""Async work item tracking (wit) API."""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from http import HTTPMethod, HTTPStatus
+from typing import TYPE_CHECKING, Any, BinaryIO, Unpack
+
+from .. import work_item_tracking
+from ..core import DEFAULT_CONCURRENCY, ListResponse, endpoint
+from ..download import Destination, DownloadOptions, DownloadResult
+from ..work_item_tracking import attachments, templates, work_items
+from ..work_item_tracking.attachments import (
+    AttachmentReference,
+    UploadOptions,
+    _chunks,
+)
+from ..work_item_tracking.graph import WorkItemGraph, WorkItemLink
+from ..work_item_tracking.wiql import WIQL_MAX_RESULTS, WorkItemReference
+from ..work_item_tracking.work_items import (
+    WORK_ITEMS_BATCH_SIZE,
+    BulkOperation,
+    BulkRequest,
+    BulkResult,
+    ItemType,
+    RelationshipName,
+    WorkItemParams,
+    WorkItemResponse,
+    WorkItemsBatchParams,
+    _now,
+)
+from .core import AsyncEndpoint, batched, chain, concurrent_map
+from .download import AsyncDownloadEndpoint
+
+
+if TYPE_CHECKING:
+    from ..work_item_tracking.snapshot import SnapshotStore, SyncResult
+
+
+class WorkItemsBatch(AsyncEndpoint, work_items.WorkItemsBatch):
+    """Async work items batch endpoint."""
+
+    async def fetch(
+        self,
+        ids: Iterable[int],
+        /,
+        **kwargs: Unpack[WorkItemsBatchParams],
+    ) -> list[WorkItemResponse]:
+        """Get up to 200 work items in one request, in the order of ``ids``."""
+        ids = list(ids)
+        items, _ = await self._exchange(
+            HTTPMethod.POST,
+            payload=self._payload(ids, **kwargs),
+            decode=lambda content: self.decoder.decode_items(content, self.item_type),
+        )
+        return self._ordered(ids, self._records(items))
+
+
+class WorkItemsBulk(AsyncEndpoint, work_items.WorkItemsBulk):
+    """Async work items $batch endpoint."""
+
+    async def send(
+        self,
+        requests: list[BulkRequest],
+        /,
+    ) -> list[tuple[int, Any]]:
+        """Send a batch of requests, returning a status code and body for each."""
+        response: ListResponse = await self._call(HTTPMethod.POST, payload=requests)
+        return self._results(response)
+
+    async def _send_encoded(
+        self,
+        requests: list[bytes],
+        /,
+    ) -> list[tuple[int, Any]]:
+        """Send a batch of requests already serialized to JSON."""
+        response: ListResponse = await self._call(
+            HTTPMethod.POST,
+            headers={"Content-Type": "application/json"},
+            data=self._batch_body(requests),
+        )
+        return self._results(response)
+
+
+class WorkItems(AsyncEndpoint, work_item_tracking.WorkItems):
+    """Async work items endpoint."""
+
+    def template(
+        self,
+        item_type: ItemType | None = None,
+        /,
+        **kwargs: Unpack[WorkItemParams],
+    ) -> WorkItemTemplate:
+        """Compile a reusable template for creating or updating many work items that
+        share an item type and static values, e.g. area, iteration and common tags.
+        """
+        return WorkItemTemplate(self, item_type, **kwargs)
+
+    @functools.cached_property
+    def attachments(self) -> Attachments:
+        """Attachments endpoint."""
+        return self._sibling(Attachments)
+
+    async def attach(
+        self,
+        work_item_id: int,
+        source: str | os.PathLike[str] | BinaryIO,
+        /,
+        *,
+        comment: str | None = None,
+        **kwargs: Unpack[UploadOptions],
+    ) -> WorkItemResponse:
+        """Upload a file or binary stream and attach it to a work item."""
+        reference = await self.attachments.upload(source, **kwargs)
+        return await self.update(
+            work_item_id,
+            relations=[self._attached_file(reference, comment)],
+        )
+
+    async def get_many(
+        self,
+        ids: Iterable[int] | AsyncIterable[int],
+        /,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **kwargs: Unpack[WorkItemsBatchParams],
+    ) -> AsyncIterator[WorkItemResponse]:
+        """Lazily get many work items, in the order of ``ids``.
+
+        Ids are split into chunks of 200 that are fetched concurrently through the
+        workitemsbatch API.
+        """
+        batch_endpoint = self._sibling(WorkItemsBatch)
+        batches = concurrent_map(
+            lambda chunk: batch_endpoint.fetch(chunk, **kwargs),
+            batched(ids, WORK_ITEMS_BATCH_SIZE),
+            concurrency=concurrency,
+        )
+        async for batch in batches:
+            for item in batch:
+                yield item
+
+    async def bulk(
+        self,
+        operations: Iterable[BulkOperation],
+        /,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult]:
+        """Lazily create or update many work items through the $batch API.
+
+        Operations are packed into batches of up to 200 that are sent concurrently.
+        A result is yielded for every operation, in input order, whether it
+        succeeded or not.
+        """
+        async for result in self._bulk(
+            (
+                json.dumps(self._bulk_request(operation)).encode()
+                for operation in operations
+            ),
+            concurrency=concurrency,
+        ):
+            yield result
+
+    async def _bulk(
+        self,
+        requests: Iterable[bytes],
+        /,
+        *,
+        concurrency: int,
+    ) -> AsyncIterator[BulkResult]:
+        """Send serialized $batch requests, yielding a result for each in order."""
+        bulk_endpoint = self._sibling(WorkItemsBulk)
+        batches = concurrent_map(
+            bulk_endpoint._send_encoded,
+            bulk_endpoint._pack(requests),
+            concurrency=concurrency,
+        )
+        index = itertools.count()
+        async for batch in batches:
+            for code, body in batch:
+                yield BulkResult(
+                    index=next(index),
+                    code=code,
+                    succeeded=code < HTTPStatus.BAD_REQUEST,
+                    body=body,
+                )
+
+    if TYPE_CHECKING:
+
+        async def create(
+            self,
+            item_type: ItemType,
+            **kwargs: Unpack[WorkItemParams],
+        ) -> WorkItemResponse:
+            """Create a work item."""
+
+        async def update(
+            self,
+            work_item_id: int,
+            **kwargs: Unpack[WorkItemParams],
+        ) -> WorkItemResponse:
+            """Update a work item."""
+
+    async def graph(
+        self,
+        root_ids: Iterable[int],
+        /,
+        *,
+        link_types: Iterable[RelationshipName] = ("Child",),
+        depth: int | None = None,
+        fields: list[str] | None = None,
+        hydrate: bool = True,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> WorkItemGraph:
+        """Load the graph of work items linked from ``root_ids``, level by level.
+
+        The links of each level are fetched with one-hop link queries and its work
+        items through the workitemsbatch API, in concurrent batches of 200. Every
+        work item is visited once, however many links lead to it.
+
+        Args:
+            root_ids: Work items to start from.
+            link_types: Links to follow, e.g. ``Child`` for a hierarchy or
+                ``Successor`` for dependencies.
+            depth: Maximum number of links between a root and a work item. Unlimited
+                by default.
+            fields: Fields of the hydrated work items. Defaults to all fields.
+            hydrate: Fetch the work items, not only their links.
+            concurrency: Number of requests in flight at once.
+        """
+        builder = self._graph_builder(root_ids, link_types)
+        endpoints = self._graph_endpoints()
+        level = 0
+        while builder.frontier:
+            calls = self._graph_calls(
+                builder,
+                endpoints,
+                expand=depth is None or level < depth,
+                hydrate=hydrate,
+                fields=fields,
+            )
+            records = (record for _, record in calls)
+            async for result in concurrent_map(
+                lambda call: call[0](), calls, concurrency=concurrency
+            ):
+                next(records)(result)
+            builder.advance()
+            level += 1
+        return builder.build()
+
+    def _graph_endpoints(self) -> tuple[Wiql, WorkItemsBatch]:
+        return self._sibling(Wiql), self._sibling(WorkItemsBatch)
+
+    async def sync(
+        self,
+        store: SnapshotStore,
+        /,
+        *,
+        fields: list[str] | None = None,
+        where: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> SyncResult:
+        """Incrementally mirror the project's work items into a local snapshot.
+
+        Only work items changed since the snapshot's watermark are queried and
+        fetched, in concurrent batches. Each batch is upserted as it arrives, and the
+        new watermark once every batch is written. Work items deleted since the query
+        ran are skipped. The first run loads every work item.
+
+        Args:
+            store: Snapshot to update.
+            fields: Fields to fetch. Defaults to all fields.
+            where: Additional wiql condition restricting the synced work items.
+            concurrency: Number of batches fetched at once.
+        """
+        wiql, work_items = self._sync_endpoints()
+        started = _now()
+        pages = wiql._pages(
+            query=self._sync_query(store.watermark, where), time_precision=True
+        )
+        first_page = await anext(pages)
+        with store.writer(first_page.get("asOf") or started) as writer:
+            items = work_items.get_many(
+                wiql._ids(chain([first_page], pages)),
+                concurrency=concurrency,
+                **self._sync_params(fields),
+            )
+            async for batch in batched(items, WORK_ITEMS_BATCH_SIZE):
+                writer.add(batch)
+        return writer.result
+
+    def _sync_endpoints(self) -> tuple[Wiql, WorkItems]:
+        return self._sibling(Wiql), self._untyped()
+
+
+class WorkItemTemplate(templates.WorkItemTemplate):
+    """Async JSON-Patch document for work items sharing an item type and static
+    values, compiled once.
+    """
+
+    work_items: WorkItems
+
+    if TYPE_CHECKING:
+
+        async def create(self, **kwargs: Unpack[WorkItemParams]) -> WorkItemResponse:
+            """Create a work item of the template's item type."""
+
+        async def update(
+            self,
+            work_item_id: int,
+            /,
+            **kwargs: Unpack[WorkItemParams],
+        ) -> WorkItemResponse:
+            """Update a work item."""
+
+        def bulk(
+            self,
+            operations: Iterable[BulkOperation],
+            /,
+            *,
+            concurrency: int = DEFAULT_CONCURRENCY,
+        ) -> AsyncIterator[BulkResult]:
+            """Lazily create or update many work items through the $batch API."""
+
+
+class Wiql(AsyncEndpoint, work_item_tracking.Wiql):
+    """Async wiql endpoint."""
+
+    if TYPE_CHECKING:
+
+        async def execute(
+            self,
+            *,
+            query: str,
+            top: int | None = None,
+            time_precision: bool = False,
+        ) -> Any:
+            """Execute a query."""
+
+    async def links(
+        self,
+        source_ids: Iterable[int],
+        link_types: Iterable[str],
+    ) -> list[WorkItemLink]:
+        """Get the links of the given types (reference names) from work items, with a
+        one-hop link query.
+        """
+        response = await self.execute(query=self._links_query(source_ids, link_types))
+        return response["workItemRelations"]
+
+    async def iter_ids(
+        self,
+        *,
+        query: str,
+        page_size: int = WIQL_MAX_RESULTS,
+        time_precision: bool = False,
+    ) -> AsyncIterator[int]:
+        """Lazily iterate over the ids matched by a flat query, in id order.
+
+        The query is run in pages of ``page_size`` keyed on ``[System.Id]``, so queries
+        matching more than the 20,000 result cap are split into id ranges.
+
+        Raises:
+            ValueError: If the query is ordered by anything other than ``[System.Id]``.
+        """
+        async for item_id in self._ids(
+            self._pages(query=query, page_size=page_size, time_precision=time_precision)
+        ):
+            yield item_id
+
+    async def _pages(
+        self,
+        *,
+        query: str,
+        page_size: int = WIQL_MAX_RESULTS,
+        time_precision: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Lazily run a flat query in pages of ids, yielding the responses."""
+        last_id = 0
+        while True:
+            response = await self.execute(
+                query=self._after_id(query, last_id),
+                top=page_size,
+                time_precision=time_precision,
+            )
+            yield response
+            references: list[WorkItemReference] = response["workItems"]
+            if len(references) < page_size:
+                return
+            last_id = references[-1]["id"]
+
+    @staticmethod
+    async def _ids(pages: AsyncIterable[Any]) -> AsyncIterator[int]:
+        async for page in pages:
+            for reference in page["workItems"]:
+                yield reference["id"]
+
+    async def stream(
+        self,
+        *,
+        query: str,
+        fields: list[str] | None = None,
+        page_size: int = WIQL_MAX_RESULTS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[WorkItemResponse]:
+        """Lazily run a flat query and hydrate the matching work items, in id order.
+
+        Ids are hydrated in concurrent batches while earlier batches are being
+        consumed, so memory stays bounded regardless of the number of results.
+
+        Raises:
+            ValueError: If the query is ordered by anything other than ``[System.Id]``.
+        """
+        async for item in self._sibling(WorkItems).get_many(
+            self.iter_ids(query=query, page_size=page_size),
+            concurrency=concurrency,
+            **self._batch_params(fields),
+        ):
+            yield item
+
+
+class Attachments(AsyncDownloadEndpoint, attachments.Attachments):
+    """Async attachments endpoint."""
+
+    async def upload(
+        self,
+        source: str | os.PathLike[str] | BinaryIO,
+        /,
+        **kwargs: Unpack[UploadOptions],
+    ) -> AttachmentReference:
+        """Upload a file or binary stream as an attachment, in chunks."""
+        with _chunks(source, **kwargs) as (chunks, size, file_name):
+            params = {"uploadType": "Chunked", "fileName": file_name}
+            response = await self._send(
+                HTTPMethod.POST,
+                params=params,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+            response.raise_for_status()
+            reference: AttachmentReference = self.decoder.decode(response.content)
+            async for _ in concurrent_map(
+                lambda chunk: self._upload_chunk(reference, params, size, *chunk),
+                chunks,
+                concurrency=kwargs.get("concurrency", DEFAULT_CONCURRENCY),
+            ):
+                pass
+        return reference
+
+    async def _upload_chunk(
+        self,
+        reference: AttachmentReference,
+        params: dict[str, Any],
+        size: int,
+        start: int,
+        chunk: bytes,
+    ) -> None:
+        response = await self._send(
+            HTTPMethod.PUT,
+            reference["id"],
+            params=params,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{size}",
+            },
+            data=chunk,
+        )
+        response.raise_for_status()
+
+    if TYPE_CHECKING:
+
+        async def download(
+            self,
+            attachment_id: str,
+            /,
+            dest: Destination,
+            **kwargs: Unpack[DownloadOptions],
+        ) -> DownloadResult:
+            """Stream a work item attachment to ``dest``."""
+
+
+class Wit(work_item_tracking.Wit):
+    """Async work item tracking API."""
+
+    @endpoint
+    def attachments(self) -> Attachments:
+        """Attachments endpoint."""
+
+    @endpoint
+    def work_items(self) -> WorkItems:
+        """Work items endpoint."""
+
+    @endpoint
+    def wiql(self) -> Wiql:
+        """Wiql endpoint."""
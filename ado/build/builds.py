@@ -0,0 +1,47 @@
+"""Builds endpoint."""
+
+from typing import ClassVar, Unpack
+
+from ..download import Destination, DownloadEndpoint, DownloadOptions, DownloadResult
+
+
+class Builds(DownloadEndpoint):
+    """[Builds endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/build/builds?view=azure-devops-rest-7.2)."""
+
+    api_version: ClassVar[str] = "7.2-preview.7"
+
+    def download_log(
+        self,
+        build_id: int,
+        log_id: int,
+        /,
+        dest: Destination,
+        **kwargs: Unpack[DownloadOptions],
+    ) -> DownloadResult:
+        """Stream a build log to ``dest``."""
+        return self._download(
+            build_id,
+            "logs",
+            log_id,
+            dest=dest,
+            accept="text/plain",
+            **kwargs,
+        )
+
+    def download_artifact(
+        self,
+        build_id: int,
+        artifact_name: str,
+        /,
+        dest: Destination,
+        **kwargs: Unpack[DownloadOptions],
+    ) -> DownloadResult:
+        """Stream a build artifact to ``dest`` as a zip archive."""
+        return self._download(
+            build_id,
+            "artifacts",
+            dest=dest,
+            params={"artifactName": artifact_name, "$format": "zip"},
+            accept="application/zip",
+            **kwargs,
+        )
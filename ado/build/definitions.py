@@ -1,10 +1,17 @@
 """Definitions endpoint."""
 
+from __future__ import annotations
+
 import datetime
+import functools
+from collections.abc import Iterator
+from http import HTTPMethod
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypedDict, Unpack
 
-from ..core import Endpoint
+from ..core import DEFAULT_CONCURRENCY, Endpoint, concurrent_map
+from ..download import Destination
 from ..models import AuthoredByInfo, ProjectInfo, QueueInfo
+from .export import DefinitionCache, ExportResult, _exporter
 
 
 class DefinitionInfo(TypedDict):
@@ -93,6 +100,7 @@ class Definitions(Endpoint):
     """[Definitions endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/build/definitions/list?view=azure-devops-rest-7.2)."""
 
     api_version: ClassVar[str] = "7.2-preview.7"
+    item_type: ClassVar[Any] = DefinitionInfo
 
     if TYPE_CHECKING:
 
@@ -101,3 +109,66 @@ class Definitions(Endpoint):
             **params: Unpack[DefinitionsParameters],
         ) -> list[DefinitionInfo]:
             """List all repositories."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+            **params: Unpack[DefinitionsParameters],
+        ) -> Iterator[DefinitionInfo]:
+            """Lazily iterate over all definitions."""
+
+    def export(
+        self,
+        dest: Destination,
+        /,
+        *,
+        cache: DefinitionCache | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **params: Unpack[DefinitionsParameters],
+    ) -> ExportResult:
+        """Stream full definitions to ``dest`` as NDJSON, in listing order.
+
+        Definitions are listed lazily and the full definition of each is fetched,
+        by revision, concurrently. With a ``cache``, definitions whose revision has
+        not changed since they were cached are written from it instead of fetched,
+        and the others are stored in it.
+
+        Args:
+            dest: A file path, or a binary file-like object.
+            cache: Full definitions of previous exports.
+            concurrency: Number of definitions fetched at once.
+            **params: Query parameters for listing the definitions to export.
+
+        Raises:
+            requests.HTTPError: If a definition could not be fetched.
+        """
+        endpoint = self._untyped()
+        revisions = {} if cache is None else cache.revisions()
+        with _exporter(dest, cache) as exporter:
+            for entry in concurrent_map(
+                functools.partial(endpoint._export_entry, revisions),
+                endpoint.iter_all(**params),
+                concurrency=concurrency,
+            ):
+                exporter.write(*entry)
+        return exporter.result
+
+    def _export_entry(
+        self,
+        revisions: dict[int, int],
+        definition: DefinitionInfo,
+    ) -> tuple[int, int, bytes | None]:
+        """Id and revision of a definition, with its content unless it is cached."""
+        definition_id, revision = definition["id"], definition["revision"]
+        if revisions.get(definition_id) == revision:
+            return definition_id, revision, None
+        return definition_id, revision, self._definition(definition_id, revision)
+
+    def _definition(self, definition_id: int, revision: int) -> bytes:
+        _, response = self._exchange(
+            HTTPMethod.GET, definition_id, params={"revision": revision}
+        )
+        response.raise_for_status()
+        return response.content
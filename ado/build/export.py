@@ -0,0 +1,143 @@
+"""Local cache of full build definitions for incremental exports."""
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, TypedDict
+
+
+class ExportResult(TypedDict):
+    """Outcome of an export."""
+
+    exported: int
+    """Number of definitions written."""
+
+    fetched: int
+    """Number of definitions fetched because they were new or had changed."""
+
+
+class DefinitionCacheWriter:
+    """Writes definitions within a single cache transaction."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Write through an open transaction on ``connection``."""
+        self._connection = connection
+
+    def get(self, definition_id: int) -> bytes | None:
+        """Cached JSON of a definition."""
+        return _content(self._connection, definition_id)
+
+    def put(self, definition_id: int, revision: int, content: bytes) -> None:
+        """Store a definition at ``revision``, replacing any other revision."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO definitions (id, revision, content) "
+            "VALUES (?, ?, ?)",
+            (definition_id, revision, content),
+        )
+
+
+class DefinitionCache:
+    """Sqlite cache of full build definitions, keyed on id and revision."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the cache database at ``path``."""
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS definitions ("
+                "id INTEGER PRIMARY KEY, revision INTEGER, content BLOB)"
+            )
+
+    def revisions(self) -> dict[int, int]:
+        """Cached revision of every definition, by id."""
+        with self._lock:
+            return dict(
+                self._connection.execute("SELECT id, revision FROM definitions")
+            )
+
+    def get(self, definition_id: int) -> bytes | None:
+        """Cached JSON of a definition."""
+        with self._lock:
+            return _content(self._connection, definition_id)
+
+    @contextlib.contextmanager
+    def writer(self) -> Iterator[DefinitionCacheWriter]:
+        """Open a transaction that is committed on exit, or rolled back on error."""
+        with self._lock, self._connection:
+            yield DefinitionCacheWriter(self._connection)
+
+    def __len__(self) -> int:
+        """Number of cached definitions."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM definitions"
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+
+def _content(connection: sqlite3.Connection, definition_id: int) -> bytes | None:
+    row = connection.execute(
+        "SELECT content FROM definitions WHERE id = ?",
+        (definition_id,),
+    ).fetchone()
+    return row[0] if row else None
+
+
+class _Exporter:
+    """Writes the definitions of an export as NDJSON lines, from the cache if they
+    are unchanged.
+    """
+
+    def __init__(self, file: BinaryIO, writer: DefinitionCacheWriter | None) -> None:
+        self._file = file
+        self._writer = writer
+        self.result = ExportResult(exported=0, fetched=0)
+
+    def write(self, definition_id: int, revision: int, content: bytes | None) -> None:
+        """Write a definition, given its content if it was fetched."""
+        if content is not None:
+            self.result["fetched"] += 1
+            if self._writer is not None:
+                self._writer.put(definition_id, revision, content)
+        elif (
+            self._writer is None or (content := self._writer.get(definition_id)) is None
+        ):
+            msg = f"Definition {definition_id} is missing from the cache."
+            raise LookupError(msg)
+        self._file.write(_ndjson_line(content))
+        self.result["exported"] += 1
+
+
+@contextlib.contextmanager
+def _exporter(
+    dest: str | os.PathLike[str] | BinaryIO,
+    cache: DefinitionCache | None,
+) -> Iterator[_Exporter]:
+    with contextlib.ExitStack() as stack:
+        writer = None if cache is None else stack.enter_context(cache.writer())
+        yield _Exporter(stack.enter_context(_open(dest)), writer)
+
+
+@contextlib.contextmanager
+def _open(dest: str | os.PathLike[str] | BinaryIO) -> Iterator[BinaryIO]:
+    if not isinstance(dest, str | os.PathLike):
+        yield dest
+        return
+    with Path(dest).open("wb") as file:
+        yield file
+
+
+def _ndjson_line(content: bytes) -> bytes:
+    """A JSON document as a single NDJSON line."""
+    if b"\n" in content:
+        content = json.dumps(json.loads(content)).encode()
+    return content + b"\n"
@@ -0,0 +1,250 @@
+"""Response caching for GET requests."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict
+
+
+if TYPE_CHECKING:
+    from .core import Endpoint
+
+
+class CacheEntry(TypedDict):
+    """A cached, decoded response."""
+
+    value: Any
+    headers: dict[str, str]
+    etag: str | None
+    expires: float
+    """Unix time after which the entry must be revalidated."""
+
+
+class CacheStats(TypedDict):
+    """Cache counters."""
+
+    hits: int
+    """Responses served from the cache without a request."""
+
+    misses: int
+    """Responses that had to be downloaded."""
+
+    revalidated: int
+    """Stale responses confirmed unchanged by the server (304)."""
+
+
+class CacheBackend(Protocol):
+    """Storage for cache entries."""
+
+    def get(self, key: str, /) -> CacheEntry | None:
+        """Get an entry."""
+
+    def set(self, key: str, entry: CacheEntry, /) -> None:
+        """Store an entry."""
+
+    def delete(self, key: str, /) -> None:
+        """Remove an entry."""
+
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemoryCache:
+    """In-memory, least-recently-used cache backend."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Create a cache holding at most ``max_entries`` responses."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, /) -> CacheEntry | None:
+        """Get an entry."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, /) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str, /) -> None:
+        """Remove an entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCache:
+    """On-disk cache backend stored in a sqlite database."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the cache database at ``path``."""
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT, headers TEXT, etag TEXT, "
+                "expires REAL)"
+            )
+
+    def get(self, key: str, /) -> CacheEntry | None:
+        """Get an entry."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, headers, etag, expires FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        value, headers, etag, expires = row
+        return CacheEntry(
+            value=json.loads(value),
+            headers=json.loads(headers),
+            etag=etag,
+            expires=expires,
+        )
+
+    def set(self, key: str, entry: CacheEntry, /) -> None:
+        """Store an entry."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    json.dumps(entry["value"]),
+                    json.dumps(entry["headers"]),
+                    entry["etag"],
+                    entry["expires"],
+                ),
+            )
+
+    def delete(self, key: str, /) -> None:
+        """Remove an entry."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+
+class ResponseCache:
+    """Opt-in cache for GET responses with TTL expiry and ETag revalidation.
+
+    Fresh entries are returned without a request. Once an entry's TTL has passed it
+    is revalidated with ``If-None-Match``; a ``304 Not Modified`` reuses the already
+    decoded value, skipping both the download and the JSON parse.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        ttl: float = 60,
+        ttls: Mapping[type[Endpoint], float] | None = None,
+    ) -> None:
+        """Create a cache.
+
+        Args:
+            backend: Where entries are stored. Defaults to a ``MemoryCache``.
+            ttl: Seconds a response is served without revalidation.
+            ttls: Per-endpoint overrides of ``ttl``, e.g. ``{Definitions: 600}``.
+        """
+        self.backend: CacheBackend = backend or MemoryCache()
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self._stats = CacheStats(hits=0, misses=0, revalidated=0)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss counters."""
+        with self._lock:
+            return CacheStats(**self._stats)
+
+    def ttl_for(self, endpoint_type: type[Endpoint]) -> float:
+        """TTL for responses from an endpoint type (or any of its bases)."""
+        return next(
+            (self.ttls[base] for base in endpoint_type.__mro__ if base in self.ttls),
+            self.ttl,
+        )
+
+    def lookup(self, key: str) -> tuple[CacheEntry | None, bool]:
+        """Get the entry for ``key`` and whether it is still fresh. Expired entries
+        without an ETag cannot be revalidated and are dropped.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, False
+        if time.time() < entry["expires"]:
+            self._count("hits")
+            return entry, True
+        if entry["etag"] is None:
+            self.backend.delete(key)
+            return None, False
+        return entry, False
+
+    def update(
+        self,
+        key: str,
+        entry: CacheEntry | None,
+        /,
+        *,
+        status: int,
+        headers: Mapping[str, str],
+        decode: Callable[[], Any],
+        ttl: float,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Handle the response to a request for ``key``, returning its decoded value
+        and headers. A ``304`` reuses the stale ``entry``; a ``200`` is decoded and
+        stored.
+        """
+        if status == HTTPStatus.NOT_MODIFIED and entry is not None:
+            self._count("revalidated")
+            self.backend.set(key, entry | {"expires": time.time() + ttl})
+            return entry["value"], entry["headers"]
+
+        self._count("misses")
+        value = decode()
+        if status == HTTPStatus.OK:
+            self.backend.set(
+                key,
+                CacheEntry(
+                    value=value,
+                    headers={k.lower(): v for k, v in headers.items()},
+                    etag=headers.get("ETag"),
+                    expires=time.time() + ttl,
+                ),
+            )
+        return value, headers
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.backend.clear()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1  # type: ignore[literal-required]
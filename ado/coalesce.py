@@ -0,0 +1,101 @@
+"""Single-flight coalescing of identical concurrent requests."""
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any, TypedDict, TypeVar
+
+
+_T = TypeVar("_T")
+
+
+class CoalescerStats(TypedDict):
+    """Coalescer counters."""
+
+    requests: int
+    """Calls that went to the network."""
+
+    coalesced: int
+    """Calls that shared the result of an identical call already in flight."""
+
+
+class RequestCoalescer:
+    """Opt-in single-flight for GET requests.
+
+    Identical GETs (same URL and params) issued while one is already in flight wait
+    for it and share its decoded result rather than sending their own request. This
+    works across threads and across asyncio tasks of the same event loop. Shared
+    results are the same object for every caller and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        """Create a coalescer."""
+        self._futures: dict[str, Future[Any]] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task[Any]] = {}
+        self._stats = CoalescerStats(requests=0, coalesced=0)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CoalescerStats:
+        """Request/coalesced counters."""
+        with self._lock:
+            return CoalescerStats(**self._stats)
+
+    def call(self, key: str, fn: Callable[[], _T], /) -> _T:
+        """Call ``fn``, or wait for the result of the call in flight for ``key``."""
+        with self._lock:
+            future = self._futures.get(key)
+            leader = future is None
+            if future is None:
+                future = self._futures[key] = Future()
+                self._stats["requests"] += 1
+            else:
+                self._stats["coalesced"] += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._discard(key)
+            future.set_exception(e)
+            raise
+        self._discard(key)
+        future.set_result(result)
+        return result
+
+    async def acall(
+        self,
+        key: str,
+        fn: Callable[[], Coroutine[Any, Any, _T]],
+        /,
+    ) -> _T:
+        """Await ``fn()``, or the result of the call in flight for ``key``.
+
+        The call runs as a task, so it completes for the remaining callers even if
+        the one that started it is cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get((loop, key))
+            if task is not None:
+                self._stats["coalesced"] += 1
+            else:
+                task = self._tasks[loop, key] = loop.create_task(fn())
+                task.add_done_callback(functools.partial(self._discard_task, loop, key))
+                self._stats["requests"] += 1
+        return await asyncio.shield(task)
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            del self._futures[key]
+
+    def _discard_task(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: str,
+        _: asyncio.Task[Any],
+    ) -> None:
+        with self._lock:
+            del self._tasks[loop, key]
@@ -3,19 +3,45 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import os
-from http import HTTPMethod
-from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, Unpack, get_type_hints
-
-import requests
-from dotenv import load_dotenv
-
-
-load_dotenv()
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPMethod, HTTPStatus
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    Self,
+    TypedDict,
+    TypeVar,
+    Unpack,
+    overload,
+)
+from urllib.parse import urlencode
+
+from .decoding import Decoder, default_decoder
+from .instrumentation import RequestHook, RequestStart, RequestTimer
+from .rate_limit import RETRY_AFTER_STATUSES
+from .transport import (
+    RETRY_STATUSES,
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+)
 
 
 if TYPE_CHECKING:
-    from . import Client
+    import requests
+
+    from .cache import ResponseCache
+    from .coalesce import RequestCoalescer
+    from .rate_limit import RateLimiter
+    from .records import RecordFactory
 
 
 class ListResponse(TypedDict):
@@ -38,13 +64,157 @@ class ClientConfiguration(TypedDict, total=False):
     organization: str
     project: str
 
+    base_url: str
+    """Root URL of the Azure DevOps service. Defaults to ``https://dev.azure.com/``."""
+
+    transport: Transport
+    """HTTP transport shared by every api/endpoint, e.g. ``HttpxTransport`` or
+    ``ReplayTransport``. A pooled ``requests`` session is created from the pool
+    settings below, on first request, if not provided.
+    """
+
+    session: Transport
+    """Same as ``transport``, typically a ``requests.Session``."""
+
+    pool_size: int
+    """Maximum number of keep-alive connections to hold open. Defaults to 10."""
+
+    max_retries: int
+    """Number of retries for connection errors and retryable status codes. Defaults to
+    3.
+    """
+
+    cache: ResponseCache | None
+    """Cache for GET responses. Disabled if not provided."""
+
+    coalescer: RequestCoalescer | None
+    """Shares one in-flight request between identical concurrent GETs. Disabled if not
+    provided.
+    """
+
+    hooks: Sequence[RequestHook]
+    """Notified of the start and end of every request attempt, with timings and
+    sizes. Requests are not timed if empty (the default).
+    """
+
+    rate_limiter: RateLimiter | None
+    """Governor pacing and retrying every request. When provided, throttled responses
+    are retried by it rather than by the session's transport adapter.
+    """
+
+    decoder: Decoder
+    """JSON decoder for response bodies. Defaults to the fastest one installed."""
+
+    records: RecordFactory | None
+    """Builds compact, immutable records instead of dicts for listed and fetched
+    items. Disabled if not provided.
+    """
+
+
+DEFAULT_BASE_URL = "https://dev.azure.com/"
+"""Root URL of Azure DevOps Services."""
+
+CONTINUATION_TOKEN_HEADER = "x-ms-continuationtoken"  # noqa: S105
+"""Response header holding the token for the next page of a list request."""
+
+DEFAULT_CONCURRENCY = 8
+"""Default number of concurrent requests for fan-out helpers. Kept below the default
+connection pool size so that every worker can hold a keep-alive connection.
+"""
+
+
+@functools.cache
+def _load_dotenv() -> None:
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv()
+
+
+def _environ(name: str) -> str:
+    """Read a setting from the environment, loaded from ``.env`` on first use."""
+    _load_dotenv()
+    return os.environ[name]
+
+
+def _return_type(fn: Callable[..., Any]) -> Any:
+    """Resolve the return annotation of ``fn``. String annotations are looked up as
+    attributes of its module, so lazily loaded names are imported on demand.
+    """
+    annotation = fn.__annotations__["return"]
+    if isinstance(annotation, str):
+        return getattr(sys.modules[fn.__module__], annotation)
+    return annotation
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+_A = TypeVar("_A", bound="Api")
+
+
+def concurrent_map(  # noqa: UP047
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Iterator[_R]:
+    """Lazily map ``fn`` over ``items`` in a thread pool, yielding results in input
+    order. At most ``concurrency`` calls are in flight or buffered at once.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending: deque[Future[_R]] = deque()
+        for item in items:
+            if len(pending) >= concurrency:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, item))
+        while pending:
+            yield pending.popleft().result()
+
 
 class _BaseClient:
     def __init__(self, **kwargs: Unpack[ClientConfiguration]) -> None:
-        self.organization = (
-            kwargs.get("organization") or os.environ["AZURE_DEVOPS_ORGANIZATION"]
+        self.organization = kwargs.get("organization") or _environ(
+            "AZURE_DEVOPS_ORGANIZATION"
+        )
+        self.project = kwargs.get("project") or _environ("AZURE_DEVOPS_PROJECT")
+        self.base_url = kwargs.get("base_url", DEFAULT_BASE_URL)
+        self.session: Transport = (
+            kwargs.get("transport")
+            or kwargs.get("session")
+            or self._create_session(**kwargs)
+        )
+        self.cache = kwargs.get("cache")
+        self.coalescer = kwargs.get("coalescer")
+        self.rate_limiter = kwargs.get("rate_limiter")
+        self.hooks = tuple(kwargs.get("hooks", ()))
+        self.decoder = kwargs.get("decoder") or default_decoder()
+        self.records = kwargs.get("records")
+
+    def _configuration(self) -> ClientConfiguration:
+        """Configuration shared with child apis/endpoints."""
+        return ClientConfiguration(
+            organization=self.organization,
+            project=self.project,
+            base_url=self.base_url,
+            session=self.session,
+            cache=self.cache,
+            coalescer=self.coalescer,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            decoder=self.decoder,
+            records=self.records,
+        )
+
+    @staticmethod
+    def _create_session(**kwargs: Unpack[ClientConfiguration]) -> Any:
+        return RequestsTransport(
+            pool_size=kwargs.get("pool_size", 10),
+            max_retries=kwargs.get("max_retries", 3),
+            retry_statuses=() if kwargs.get("rate_limiter") else RETRY_STATUSES,
         )
-        self.project = kwargs.get("project") or os.environ["AZURE_DEVOPS_PROJECT"]
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
 
 
 class Api(_BaseClient):
@@ -57,12 +227,12 @@ class Api(_BaseClient):
         super().__init__(**kwargs)
         self.parts = [*parts, self.path or type(self).__name__.lower()]
 
-    @property
+    @functools.cached_property
     def url(self) -> str:
         """Endpoint URL."""
         return "/".join(
             [
-                "https://dev.azure.com/",
+                self.base_url,
                 self.organization,
                 self.project,
                 "_apis",
@@ -70,10 +240,23 @@ class Api(_BaseClient):
             ]
         )
 
+    def _sibling(
+        self,
+        api_type: type[_A],
+        **overrides: Unpack[ClientConfiguration],
+    ) -> _A:
+        """Create an api/endpoint under the same parent path, sharing the session."""
+        return api_type(*self.parts[:-1], **(self._configuration() | overrides))
+
 
 class Endpoint(Api):
     """An Azure DevOps endpoint."""
 
+    item_type: ClassVar[Any] = None
+    """TypedDict describing the items of this endpoint, for typed decoders and
+    records.
+    """
+
     def _call(
         self,
         method: HTTPMethod,
@@ -83,55 +266,359 @@ class Endpoint(Api):
         headers: dict[str, Any] | None = None,
         data: requests.sessions._Data | None = None,
     ) -> Any:
-        response = requests.request(
-            str(method),
-            (sep := "/").join(
-                [
-                    self.url.strip(sep),
-                    *[str(url_part).strip(sep) for url_part in url_parts],
-                ]
-            ),
-            params={
-                k: v.isoformat() if isinstance(v, datetime.datetime) else v
-                for k, v in ((params or {}) | {"api-version": self.api_version}).items()
-            },
-            auth=("", os.environ["AZURE_DEVOPS_PAT"]),
-            headers={"Accept": "application/json"} | (headers or {}),
-            json=payload,
+        value, _ = self._fetch(
+            method,
+            *url_parts,
+            params=params,
+            payload=payload,
+            headers=headers,
+            data=data,
+        )
+        return value
+
+    def _fetch(
+        self,
+        method: HTTPMethod,
+        *url_parts: Any,
+        params: dict[str, Any] | None = None,
+        payload: Any | None = None,
+        headers: dict[str, Any] | None = None,
+        data: requests.sessions._Data | None = None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Send a request, returning the decoded body and response headers. GET
+        requests go through the client's coalescer and response cache, if any.
+        """
+        if method != HTTPMethod.GET or (self.cache is None and self.coalescer is None):
+            value, response = self._exchange(
+                method,
+                *url_parts,
+                params=params,
+                payload=payload,
+                headers=headers,
+                data=data,
+                decode=self.decoder.decode,
+            )
+            return value, response.headers
+
+        key = self._cache_key(*url_parts, params=params)
+        fetch = functools.partial(
+            self._get, key, *url_parts, params=params, headers=headers
+        )
+        if self.coalescer is None:
+            return fetch()
+        return self.coalescer.call(key, fetch)
+
+    def _get(
+        self,
+        key: str,
+        *url_parts: Any,
+        params: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        if self.cache is None:
+            value, response = self._exchange(
+                HTTPMethod.GET,
+                *url_parts,
+                params=params,
+                headers=headers,
+                decode=self.decoder.decode,
+            )
+            return value, response.headers
+
+        entry, fresh = self.cache.lookup(key)
+        if entry is not None:
+            if fresh:
+                return entry["value"], entry["headers"]
+            headers = (headers or {}) | {"If-None-Match": entry["etag"]}
+
+        value, response = self._exchange(
+            HTTPMethod.GET,
+            *url_parts,
+            params=params,
+            headers=headers,
+            decode=self.decoder.decode,
+        )
+        return self.cache.update(
+            key,
+            entry,
+            status=response.status_code,
+            headers=response.headers,
+            decode=lambda: value,
+            ttl=self.cache.ttl_for(type(self)),
+        )
+
+    def _send(
+        self,
+        method: HTTPMethod,
+        *url_parts: Any,
+        params: dict[str, Any] | None = None,
+        payload: Any | None = None,
+        headers: dict[str, Any] | None = None,
+        data: requests.sessions._Data | None = None,
+    ) -> TransportResponse:
+        _, response = self._exchange(
+            method,
+            *url_parts,
+            params=params,
+            payload=payload,
+            headers=headers,
             data=data,
-            timeout=60,
         )
-        return response.json()
+        return response
+
+    def _exchange(
+        self,
+        method: HTTPMethod,
+        *url_parts: Any,
+        params: dict[str, Any] | None = None,
+        payload: Any | None = None,
+        headers: dict[str, Any] | None = None,
+        data: requests.sessions._Data | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+        stream: bool = False,
+    ) -> tuple[Any, TransportResponse]:
+        """Send a request, retrying as directed by the rate limiter, and decode the
+        final response body with ``decode`` (unless it is a 304). With
+        ``stream=True``, the body of the final response is left unread instead. Every
+        attempt is reported to the request hooks, if any.
+
+        Raises:
+            requests.HTTPError: If a body to decode is still throttled (429 or 503)
+                once retries are exhausted. Raised by the transport's
+                ``raise_for_status``.
+        """
+        url = self._request_url(*url_parts)
+        attempt = 0
+        while True:
+            queued = 0.0
+            if self.rate_limiter is not None:
+                time.sleep(queued := self.rate_limiter.reserve())
+            if self.hooks:
+                timer = RequestTimer(
+                    self.hooks,
+                    RequestStart(
+                        endpoint=type(self),
+                        method=str(method),
+                        url=url,
+                        attempt=attempt,
+                    ),
+                    queued,
+                )
+            response = self.session.request(
+                str(method),
+                url,
+                params=self._request_params(params),
+                auth=("", _environ("AZURE_DEVOPS_PAT")),
+                headers={"Accept": "application/json"} | (headers or {}),
+                json=payload,
+                data=data,
+                timeout=60,
+                stream=stream,
+            )
+            if self.hooks:
+                timer.received()
+            delay = None
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.observe(
+                    response.status_code,
+                    response.headers,
+                    attempt,
+                )
+            # Retries are exhausted: the body is an error, not the expected value
+            throttled = (
+                delay is None
+                and decode is not None
+                and response.status_code in RETRY_AFTER_STATUSES
+            )
+            value = None
+            if (
+                delay is None
+                and decode is not None
+                and not throttled
+                and response.status_code != HTTPStatus.NOT_MODIFIED
+            ):
+                value = decode(response.content)
+            if self.hooks:
+                timer.end(
+                    status=response.status_code,
+                    headers=response.headers,
+                    bytes_in=int(response.headers.get("Content-Length", 0))
+                    if stream
+                    else len(response.content),
+                    bytes_out=len(response.request.body or b""),
+                    waiting=response.elapsed.total_seconds(),
+                )
+            if throttled:
+                response.raise_for_status()
+            if delay is None:
+                return value, response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _request_url(self, *url_parts: Any) -> str:
+        return (sep := "/").join(
+            [
+                self.url.strip(sep),
+                *[str(url_part).strip(sep) for url_part in url_parts],
+            ]
+        )
+
+    def _request_params(self, params: dict[str, Any] | None) -> dict[str, Any]:
+        return {
+            k: v.isoformat() if isinstance(v, datetime.datetime) else v
+            for k, v in ((params or {}) | {"api-version": self.api_version}).items()
+        }
+
+    def _cache_key(self, *url_parts: Any, params: dict[str, Any] | None) -> str:
+        query = sorted(self._request_params(params).items())
+        return f"{self._request_url(*url_parts)}?{urlencode(query, doseq=True)}"
 
     def list_all(self, **params: Any) -> list[dict[str, Any]]:
         """List all entities in endpoint."""
-        list_response: ListResponse = self._call(HTTPMethod.GET, params=params)
-        return list_response["value"]
+        return list(self.iter_all(**params))
+
+    def iter_all(
+        self,
+        *,
+        page_size: int | None = None,
+        prefetch: bool = True,
+        **params: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate over all entities in endpoint, following continuation
+        tokens.
+
+        Args:
+            page_size: Number of entities to request per page (``$top``).
+            prefetch: Fetch the next page in the background while the current one is
+                being consumed. At most two pages are held in memory at once.
+            **params: Query parameters for the list request.
+        """
+        if page_size is not None:
+            params["$top"] = page_size
+
+        if not prefetch:
+            while True:
+                items, token = self._list_page(params)
+                yield from items
+                if not token:
+                    return
+                params = params | {"continuationToken": token}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Future[tuple[Iterable[dict[str, Any]], str | None]] | None
+            future = executor.submit(self._list_page, params)
+            while future is not None:
+                items, token = future.result()
+                future = (
+                    executor.submit(
+                        self._list_page,
+                        params | {"continuationToken": token},
+                    )
+                    if token
+                    else None
+                )
+                yield from items
+
+    def _list_page(
+        self,
+        params: dict[str, Any],
+    ) -> tuple[Iterable[dict[str, Any]], str | None]:
+        if self.cache is not None or self.coalescer is not None:
+            list_response: ListResponse
+            list_response, headers = self._fetch(HTTPMethod.GET, params=params)
+            return (
+                self._records(list_response["value"]),
+                headers.get(CONTINUATION_TOKEN_HEADER),
+            )
+
+        items, response = self._exchange(
+            HTTPMethod.GET,
+            params=params,
+            decode=lambda content: self.decoder.decode_items(content, self.item_type),
+        )
+        return (
+            self._records(items),
+            response.headers.get(CONTINUATION_TOKEN_HEADER),
+        )
+
+    def _untyped(self) -> Self:
+        """This endpoint, listing plain dicts whatever the configured decoder and
+        records.
+        """
+        decoder = Decoder() if getattr(self.decoder, "typed", False) else self.decoder
+        return self._sibling(type(self), records=None, decoder=decoder)
+
+    def _records(self, items: Iterable[Any]) -> Iterable[Any]:
+        """Lazily turn items into records, if enabled."""
+        if self.records is None or self.item_type is None:
+            return items
+        return self.records.build_all(self.item_type, items)
 
     def get(self, id: int, /) -> dict[str, Any]:
         """Get an entity by id."""
-        return self._call(HTTPMethod.GET, id)
+        if self.cache is not None or self.coalescer is not None:
+            item = self._call(HTTPMethod.GET, id)
+        else:
+            item, _ = self._exchange(
+                HTTPMethod.GET,
+                id,
+                decode=lambda content: self.decoder.decode_item(
+                    content, self.item_type
+                ),
+            )
+        if self.records is None or self.item_type is None:
+            return item
+        return self.records.build(self.item_type, item)
+
+
+class endpoint(property, Generic[_A]):  # noqa: N801, UP046
+    """Property that returns an instance of the annotated type.
 
+    The instance is created on first access and memoized on the parent, so repeated
+    attribute chains such as ``client.wit.work_items`` cost one dict lookup per link.
+    Instances are memoized per property, so a property overridden in a subclass and
+    the one it overrides each create their own.
+    """
 
-class endpoint(property):  # noqa: N801
-    """Property that returns an instance of the annotated type."""
+    key: str
+    return_type: type[_A] | None = None
+
+    def __init__(self, fget: Callable[[Any], _A]) -> None:
+        """Wrap ``fget``, whose return annotation is the type to instantiate."""
+        super().__init__(fget)
+        self.factory = fget
+
+    def __set_name__(self, owner: type[_BaseClient], name: str) -> None:
+        """Remember the key to memoize instances under."""
+        self.key = f"{owner.__module__}.{owner.__qualname__}.{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: _BaseClient, owner: type[Any] | None = None) -> _A: ...
 
     def __get__(
         self,
-        instance: Client | Api | None,
-        owner: type[Client | Api],
-    ) -> Api:
+        instance: _BaseClient | None,
+        owner: type[Any] | None = None,
+    ) -> Self | _A:
         """Return the app/endpoint type."""
         if instance:
-            return_type: type[Api] = get_type_hints(self.fget)["return"]
+            try:
+                return instance.__dict__[self.key]
+            except KeyError:
+                pass
+
+            if self.return_type is None:
+                self.return_type = _return_type(self.factory)
             parts = instance.parts if isinstance(instance, Api) else []
-            return return_type(
-                *parts,
-                organization=instance.organization,
-                project=instance.project,
-            )
+            child = self.return_type(*parts, **instance._configuration())
+            instance.__dict__[self.key] = child
+            return child
 
-        return super().__get__(instance, owner)  # type: ignore[return-value]
+        return self
 
 
 api = endpoint
@@ -0,0 +1,149 @@
+"""JSON decoding backends."""
+
+import functools
+import json
+import types
+from collections.abc import Iterable
+from typing import (
+    Any,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+
+class Decoder:
+    """Decodes response bodies with the standard library ``json`` module."""
+
+    def decode(self, content: bytes, /) -> Any:
+        """Decode a response body."""
+        return json.loads(content)
+
+    def decode_items(self, content: bytes, item_type: Any = None, /) -> Iterable[Any]:  # noqa: ARG002
+        """Decode the ``value`` items of a list response.
+
+        Args:
+            content: Response body.
+            item_type: TypedDict describing each item. Only used by typed decoders.
+        """
+        return self.decode(content)["value"]
+
+    def decode_item(self, content: bytes, item_type: Any = None, /) -> Any:  # noqa: ARG002
+        """Decode a single item, e.g. the body of a get by id.
+
+        Args:
+            content: Response body.
+            item_type: TypedDict describing the item. Only used by typed decoders.
+        """
+        return self.decode(content)
+
+
+class OrjsonDecoder(Decoder):
+    """Decodes response bodies with ``orjson``."""
+
+    def __init__(self) -> None:
+        """Raise ``ImportError`` if ``orjson`` is not installed."""
+        import orjson  # noqa: PLC0415
+
+        self._loads = orjson.loads
+
+    def decode(self, content: bytes, /) -> Any:
+        """Decode a response body."""
+        return self._loads(content)
+
+
+class MsgspecDecoder(Decoder):
+    """Decodes response bodies with ``msgspec``.
+
+    Items of list responses are decoded lazily, one at a time as they are iterated.
+    With ``typed=True``, items (and entities got by id) are decoded into frozen
+    ``msgspec.Struct`` types derived from the endpoint's TypedDict (see
+    ``struct_type``) instead of dicts.
+    """
+
+    def __init__(self, *, typed: bool = False) -> None:
+        """Raise ``ImportError`` if ``msgspec`` is not installed."""
+        import msgspec  # noqa: PLC0415
+
+        class Page(msgspec.Struct):
+            value: list[msgspec.Raw]
+
+        self.typed = typed
+        self._decoder = msgspec.json.Decoder()
+        self._page_decoder = msgspec.json.Decoder(Page)
+        self._item_decoders: dict[Any, msgspec.json.Decoder[Any]] = {}
+
+    def decode(self, content: bytes, /) -> Any:
+        """Decode a response body."""
+        return self._decoder.decode(content)
+
+    def decode_items(self, content: bytes, item_type: Any = None, /) -> Iterable[Any]:
+        """Lazily decode the ``value`` items of a list response."""
+        return map(
+            self._item_decoder(item_type).decode,
+            self._page_decoder.decode(content).value,
+        )
+
+    def decode_item(self, content: bytes, item_type: Any = None, /) -> Any:
+        """Decode a single item, e.g. the body of a get by id."""
+        return self._item_decoder(item_type).decode(content)
+
+    def _item_decoder(self, item_type: Any) -> Any:
+        import msgspec  # noqa: PLC0415
+
+        key = item_type if self.typed else None
+        if (decoder := self._item_decoders.get(key)) is None:
+            # Items are null where a batch request omits missing ids
+            decoder = self._item_decoders[key] = msgspec.json.Decoder(
+                struct_type(item_type) | None if key is not None else Any
+            )
+        return decoder
+
+
+def default_decoder() -> Decoder:
+    """The fastest installed decoder: ``orjson``, then ``msgspec``, then ``json``."""
+    for decoder_type in (OrjsonDecoder, MsgspecDecoder):
+        try:
+            return decoder_type()
+        except ImportError:
+            continue
+    return Decoder()
+
+
+@functools.cache
+def struct_type(typed_dict: type) -> Any:
+    """Derive a frozen, slotted ``msgspec.Struct`` type from a TypedDict.
+
+    Nested TypedDicts become structs too. Every field is optional, since Azure DevOps
+    omits fields freely, and ``Literal`` fields are widened to their value type so
+    that new enum members do not fail decoding.
+    """
+    import msgspec  # noqa: PLC0415
+
+    return msgspec.defstruct(
+        typed_dict.__name__,
+        [
+            (name, _struct_field_type(annotation) | None, None)
+            for name, annotation in get_type_hints(typed_dict).items()
+        ],
+        frozen=True,
+        gc=False,
+        module=typed_dict.__module__,
+    )
+
+
+def _struct_field_type(annotation: Any) -> Any:
+    if is_typeddict(annotation):
+        return struct_type(annotation)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Literal:
+        return type(args[0])
+    if origin in {Union, types.UnionType}:
+        return Union[tuple(_struct_field_type(arg) for arg in args)]  # noqa: UP007
+    if origin is not None and args:
+        return origin[tuple(_struct_field_type(arg) for arg in args)]
+    return annotation
@@ -1,6 +1,7 @@
 """Variable groups endpoint."""
 
-from typing import TYPE_CHECKING, Any, TypedDict
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
 
 from ..core import Endpoint
 from ..models import UserInfo
@@ -30,7 +31,17 @@ class VariableGroupInfo(TypedDict):
 class VariableGroups(Endpoint):
     """Variable groups endpoint."""
 
+    item_type: ClassVar[Any] = VariableGroupInfo
+
     if TYPE_CHECKING:
 
         def list_all(self) -> list[VariableGroupInfo]:
             """List all variable groups."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+        ) -> Iterator[VariableGroupInfo]:
+            """Lazily iterate over all variable groups."""
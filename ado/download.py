@@ -0,0 +1,206 @@
+"""Streaming downloads of binary content."""
+
+import contextlib
+import functools
+import os
+import re
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPMethod, HTTPStatus
+from pathlib import Path
+from typing import Any, BinaryIO, TypeAlias, TypedDict, Unpack
+
+from .core import Endpoint
+
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+"""Bytes read from the network and written at a time."""
+
+DOWNLOAD_PART_SIZE = 64 << 20
+"""Bytes per range request of parallel downloads."""
+
+Destination: TypeAlias = str | os.PathLike[str] | BinaryIO  # noqa: UP040
+"""A file path, or a binary file-like object written from its current position."""
+
+_CONTENT_RANGE = re.compile(r"bytes \d+-\d+/(\d+)")
+
+
+class DownloadOptions(TypedDict, total=False):
+    """Options for downloads."""
+
+    resume: bool
+    """Continue a partial download with a range request, appending to the existing
+    file (or, for file-like objects, from their current position). Restarts from
+    scratch if the server does not honor the range.
+    """
+
+    parallel: int
+    """Number of concurrent range requests for large downloads to a file path.
+    Defaults to 1 (a single request).
+    """
+
+    chunk_size: int
+    """Bytes read and written at a time. Defaults to 1 MiB."""
+
+    part_size: int
+    """Bytes per range request of parallel downloads. Defaults to 64 MiB."""
+
+
+class DownloadResult(TypedDict):
+    """Outcome of a download."""
+
+    path: str | None
+    """Destination path, if downloaded to a file path."""
+
+    size: int
+    """Size of the downloaded content."""
+
+    downloaded: int
+    """Bytes transferred by this download; less than ``size`` if resumed."""
+
+
+class DownloadEndpoint(Endpoint):
+    """An endpoint serving binary content that is streamed in chunks, so downloads
+    of any size use constant memory.
+    """
+
+    def _download(
+        self,
+        *url_parts: Any,
+        dest: Destination,
+        params: dict[str, Any] | None = None,
+        accept: str = "application/octet-stream",
+        **kwargs: Unpack[DownloadOptions],
+    ) -> DownloadResult:
+        """Stream content to ``dest``.
+
+        Parallel downloads fall back to a single request if the server answers the
+        first part with the whole content.
+
+        Raises:
+            requests.HTTPError: If the content could not be downloaded.
+            ValueError: If the server answers a later part of a parallel download with
+                the whole content.
+        """
+        resume = kwargs.get("resume", False)
+        parallel = kwargs.get("parallel", 1)
+        part_size = kwargs.get("part_size", DOWNLOAD_PART_SIZE)
+        download_range = functools.partial(
+            self._download_range,
+            *url_parts,
+            params=params,
+            accept=accept,
+            chunk_size=kwargs.get("chunk_size", DOWNLOAD_CHUNK_SIZE),
+        )
+        with _open(dest, resume=resume) as (file, path):
+            offset = file.tell() if resume else 0
+            split = parallel > 1 and path is not None and not offset
+            size, downloaded = download_range(
+                file=file,
+                start=offset,
+                end=part_size - 1 if split else None,
+            )
+        if split and path is not None and downloaded < size:
+            # The first part confirmed range support: fetch the others concurrently
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                parts = executor.map(
+                    functools.partial(self._download_part, download_range, path),
+                    _parts(size, part_size),
+                )
+                downloaded += sum(parts)
+        return DownloadResult(path=path, size=size, downloaded=downloaded)
+
+    @staticmethod
+    def _download_part(
+        download_range: functools.partial[tuple[int, int]],
+        path: str,
+        part: tuple[int, int],
+    ) -> int:
+        start, end = part
+        with Path(path).open("r+b") as file:
+            file.seek(start)
+            _, downloaded = download_range(file=file, start=start, end=end)
+        return downloaded
+
+    def _download_range(
+        self,
+        *url_parts: Any,
+        file: BinaryIO,
+        start: int,
+        end: int | None,
+        params: dict[str, Any] | None,
+        accept: str,
+        chunk_size: int,
+    ) -> tuple[int, int]:
+        """Stream bytes ``start`` to ``end`` of the content into ``file``, returning
+        the size of the content and the number of bytes written.
+        """
+        _, response = self._exchange(
+            HTTPMethod.GET,
+            *url_parts,
+            params=params,
+            headers=_range_headers(accept, start, end),
+            stream=True,
+        )
+        with response:
+            if response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                # Nothing left to resume
+                return start, 0
+            response.raise_for_status()
+            if _restarted(response.status_code, start, end):
+                file.seek(start := 0)
+                file.truncate()
+            downloaded = 0
+            for chunk in response.iter_content(chunk_size):
+                downloaded += file.write(chunk)
+        return _content_size(response.headers, start + downloaded), downloaded
+
+
+@contextlib.contextmanager
+def _open(dest: Destination, *, resume: bool) -> Iterator[tuple[BinaryIO, str | None]]:
+    if not isinstance(dest, str | os.PathLike):
+        yield dest, None
+        return
+    path = Path(dest)
+    with path.open("r+b" if resume and path.exists() else "wb") as file:
+        file.seek(0, os.SEEK_END)
+        yield file, str(path)
+
+
+def _parts(size: int, part_size: int) -> list[tuple[int, int]]:
+    """Byte ranges of the parts after the first of a parallel download."""
+    return [
+        (start, min(start + part_size, size) - 1)
+        for start in range(part_size, size, part_size)
+    ]
+
+
+def _restarted(status_code: int, start: int, end: int | None) -> bool:
+    """Whether a response to a range request starting at ``start`` holds the whole
+    content, which is then written from the start of the file.
+
+    Raises:
+        ValueError: If the request was for a part of a parallel download, whose
+            file is shared with the other parts.
+    """
+    if not start or status_code == HTTPStatus.PARTIAL_CONTENT:
+        return False
+    if end is not None:
+        msg = f"The server ignored the range request for bytes {start}-{end}."
+        raise ValueError(msg)
+    return True
+
+
+def _range_headers(accept: str, start: int, end: int | None) -> dict[str, str]:
+    # Ranges apply to the encoded body, so ask for it unencoded
+    headers = {"Accept": accept, "Accept-Encoding": "identity"}
+    if start or end is not None:
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    return headers
+
+
+def _content_size(headers: Mapping[str, str], received: int) -> int:
+    """Size of the whole content, from ``Content-Range`` if the response is partial."""
+    if match := _CONTENT_RANGE.fullmatch(headers.get("Content-Range", "")):
+        return int(match.group(1))
+    return received
@@ -1,7 +1,11 @@
 """Git API."""
 
-from ..core import Api, endpoint
-from .repositories import Repositories
+from collections.abc import Iterator
+from typing import Unpack
+
+from ..core import DEFAULT_CONCURRENCY, Api, concurrent_map, endpoint
+from .inventory import RepoStats
+from .repositories import Repositories, RepositoriesParameters, is_active
 
 
 class Git(Api):
@@ -10,3 +14,25 @@ class Git(Api):
     @endpoint
     def repositories(self) -> Repositories:
         """Repositories endpoint."""
+
+    def inventory(
+        self,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **params: Unpack[RepositoriesParameters],
+    ) -> Iterator[RepoStats]:
+        """Lazily yield statistics of every repository, in listing order.
+
+        Repositories are listed lazily, skipping disabled repositories and those in
+        maintenance, and the refs and latest commit of each are fetched concurrently.
+
+        Args:
+            concurrency: Number of repositories scanned at once.
+            **params: Query parameters for listing the repositories.
+        """
+        repositories = self.repositories._untyped()
+        return concurrent_map(
+            repositories._stats,
+            filter(is_active, repositories.iter_all(**params)),
+            concurrency=concurrency,
+        )
@@ -0,0 +1,49 @@
+"""Commits endpoint."""
+
+from http import HTTPMethod
+from typing import Any, ClassVar, TypedDict
+
+from ..core import Endpoint
+
+
+class GitUserDate(TypedDict):
+    """Author or committer of a commit."""
+
+    name: str
+    email: str
+    date: str
+
+
+class CommitInfo(TypedDict):
+    """Commit info."""
+
+    commitId: str
+    author: GitUserDate
+    committer: GitUserDate
+    comment: str
+    url: str
+
+
+class Commits(Endpoint):
+    """[Commits endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/git/commits?view=azure-devops-rest-7.2)
+    of a repository.
+    """
+
+    api_version: ClassVar[str] = "7.2-preview.2"
+    item_type: ClassVar[Any] = CommitInfo
+
+    def latest(self, branch: str | None = None) -> CommitInfo | None:
+        """Most recent commit on a branch (``refs/heads/`` prefix optional), or on the
+        default branch. ``None`` if the branch has no commits.
+        """
+        commits = self._call(HTTPMethod.GET, params=self._latest_params(branch))
+        return next(iter(self._records(commits["value"])), None)
+
+    @staticmethod
+    def _latest_params(branch: str | None) -> dict[str, Any]:
+        params: dict[str, Any] = {"searchCriteria.$top": 1}
+        if branch is not None:
+            params["searchCriteria.itemVersion.version"] = branch.removeprefix(
+                "refs/heads/"
+            )
+        return params
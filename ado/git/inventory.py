@@ -0,0 +1,60 @@
+"""Per-repository statistics for inventories of many repositories."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypedDict
+
+
+if TYPE_CHECKING:
+    from .commits import CommitInfo
+    from .refs import RefInfo
+    from .repositories import RepoInfo
+
+
+class RepoStats(TypedDict):
+    """Row of an inventory: statistics of one repository."""
+
+    id: str
+    name: str
+    project: str
+    size: int
+    """Size of the repository in bytes."""
+
+    default_branch: str | None
+    """``None`` if the repository is empty."""
+
+    branches: int
+    tags: int
+    last_commit_id: str | None
+    """Most recent commit on the default branch."""
+
+    last_commit_date: str | None
+    last_commit_author: str | None
+
+
+class _RefCounter:
+    """Counts the branches and tags of a repository as its refs are listed."""
+
+    def __init__(self) -> None:
+        self.branches = 0
+        self.tags = 0
+
+    def add(self, ref: RefInfo) -> None:
+        """Count a ref."""
+        self.branches += ref["name"].startswith("refs/heads/")
+        self.tags += ref["name"].startswith("refs/tags/")
+
+    def stats(self, repository: RepoInfo, commit: CommitInfo | None) -> RepoStats:
+        """Row for ``repository``, with its latest commit."""
+        return RepoStats(
+            id=repository["id"],
+            name=repository["name"],
+            project=repository["project"]["name"],
+            size=repository.get("size", 0),
+            default_branch=repository.get("defaultBranch"),
+            branches=self.branches,
+            tags=self.tags,
+            last_commit_id=None if commit is None else commit["commitId"],
+            last_commit_date=None if commit is None else commit["committer"]["date"],
+            last_commit_author=None if commit is None else commit["author"]["name"],
+        )
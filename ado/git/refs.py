@@ -0,0 +1,60 @@
+"""Refs endpoint."""
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, Unpack
+
+from ..core import Endpoint
+
+
+REFS_PAGE_SIZE = 1000
+"""Maximum number of refs returned per page."""
+
+
+class RefsParameters(TypedDict, total=False):
+    """Parameters that are inputs for getting refs."""
+
+    filter: str
+    """A filter to apply to the refs (starts with), e.g. ``heads/``."""
+
+    filterContains: str
+    """A filter to apply to the refs (contains)."""
+
+    includeLinks: bool
+    """True to include reference links. The default value is false."""
+
+    includeStatuses: bool
+    """True to include up to the first 1000 commit statuses for each ref."""
+
+    peelTags: bool
+    """True to populate the peeled object id of annotated tags."""
+
+
+class RefInfo(TypedDict):
+    """Ref info."""
+
+    name: str
+    objectId: str
+    url: str
+
+
+class Refs(Endpoint):
+    """[Refs endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/git/refs?view=azure-devops-rest-7.2)
+    of a repository.
+    """
+
+    api_version: ClassVar[str] = "7.2-preview.2"
+    item_type: ClassVar[Any] = RefInfo
+
+    if TYPE_CHECKING:
+
+        def list_all(self, **params: Unpack[RefsParameters]) -> list[RefInfo]:
+            """List all refs."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+            **params: Unpack[RefsParameters],
+        ) -> Iterator[RefInfo]:
+            """Lazily iterate over all refs."""
@@ -1,9 +1,15 @@
 """Repositories endpoint."""
 
-from typing import TYPE_CHECKING, TypedDict, Unpack
+from __future__ import annotations
 
-from ..core import Endpoint
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, Unpack
+
+from ..download import Destination, DownloadEndpoint, DownloadOptions, DownloadResult
 from ..models import ProjectInfo
+from .commits import Commits
+from .inventory import RepoStats, _RefCounter
+from .refs import REFS_PAGE_SIZE, Refs
 
 
 class RepositoriesParameters(TypedDict, total=False):
@@ -35,10 +41,92 @@ class RepoInfo(TypedDict):
     webUrl: str
 
 
-class Repositories(Endpoint):
+def is_active(repository: RepoInfo) -> bool:
+    """Whether a repository can be read, i.e. is neither disabled nor in maintenance."""
+    return not (repository.get("isDisabled") or repository.get("isInMaintenance"))
+
+
+class Repositories(DownloadEndpoint):
     """[Repositories endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/git/repositories?view=azure-devops-rest-7.2)."""
 
+    item_type: ClassVar[Any] = RepoInfo
+
     if TYPE_CHECKING:
 
         def list_all(self, **params: Unpack[RepositoriesParameters]) -> list[RepoInfo]:
             """List all repositories."""
+
+        def iter_all(
+            self,
+            *,
+            page_size: int | None = None,
+            prefetch: bool = True,
+            **params: Unpack[RepositoriesParameters],
+        ) -> Iterator[RepoInfo]:
+            """Lazily iterate over all repositories."""
+
+    def download_item(
+        self,
+        repository_id: str,
+        path: str,
+        /,
+        dest: Destination,
+        *,
+        version: str | None = None,
+        **kwargs: Unpack[DownloadOptions],
+    ) -> DownloadResult:
+        """Stream the content of a file in a repository to ``dest``.
+
+        Args:
+            repository_id: Repository id or name.
+            path: Path of the file in the repository.
+            dest: File path or binary file-like object.
+            version: Branch name to download from. Defaults to the default branch.
+            **kwargs: Download options.
+        """
+        params = {"path": path, "download": True, "$format": "octetStream"}
+        if version is not None:
+            params["versionDescriptor.version"] = version
+        return self._download(
+            repository_id, "items", dest=dest, params=params, **kwargs
+        )
+
+    def download_blob(
+        self,
+        repository_id: str,
+        object_id: str,
+        /,
+        dest: Destination,
+        **kwargs: Unpack[DownloadOptions],
+    ) -> DownloadResult:
+        """Stream a blob, by its SHA-1 object id, to ``dest``."""
+        return self._download(
+            repository_id,
+            "blobs",
+            object_id,
+            dest=dest,
+            params={"download": True, "$format": "octetStream"},
+            **kwargs,
+        )
+
+    def refs(self, repository_id: str, /) -> Refs:
+        """Refs endpoint of a repository, by id or name."""
+        return Refs(*self.parts, str(repository_id), **self._configuration())
+
+    def commits(self, repository_id: str, /) -> Commits:
+        """Commits endpoint of a repository, by id or name."""
+        return Commits(*self.parts, str(repository_id), **self._configuration())
+
+    def _stats(self, repository: RepoInfo) -> RepoStats:
+        """Count the refs of a repository, following continuation tokens, and get the
+        latest commit on its default branch.
+        """
+        counter = _RefCounter()
+        for ref in self.refs(repository["id"]).iter_all(
+            page_size=REFS_PAGE_SIZE, prefetch=False
+        ):
+            counter.add(ref)
+        commit = None
+        if default_branch := repository.get("defaultBranch"):
+            commit = self.commits(repository["id"]).latest(default_branch)
+        return counter.stats(repository, commit)
@@ -0,0 +1,286 @@
+"""Request instrumentation hooks and exporters."""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict
+
+
+if TYPE_CHECKING:
+    from .core import Endpoint
+
+
+ACTIVITY_ID_HEADER = "ActivityId"
+"""Response header holding the server-side id of a request, for support cases."""
+
+
+class RequestStart(TypedDict):
+    """A request attempt about to be sent."""
+
+    endpoint: type[Endpoint]
+    method: str
+    url: str
+    attempt: int
+    """Number of earlier attempts of the same request, retried by the rate limiter."""
+
+
+class RequestEvent(RequestStart):
+    """A completed request attempt. Durations are in seconds."""
+
+    status: int
+    activity_id: str | None
+    started: float
+    """Unix time at which the attempt was sent."""
+
+    queued: float
+    """Time spent waiting for the rate limiter and, for the async client, a
+    connection slot.
+    """
+
+    connect: float | None
+    """Time spent opening a connection, including TLS; 0 for a reused connection.
+    ``None`` if the transport does not report it, in which case it is part of
+    ``waiting``.
+    """
+
+    waiting: float
+    """Time from sending the request to receiving the response headers."""
+
+    download: float
+    """Time spent receiving the response body."""
+
+    decode: float
+    """Time spent decoding the response body."""
+
+    duration: float
+    """Time from sending the request to the decoded response."""
+
+    bytes_in: int
+    bytes_out: int
+
+
+class RequestHook(Protocol):
+    """Receives request events. Called synchronously on the requesting thread."""
+
+    def on_request_start(self, event: RequestStart, /) -> None:
+        """Handle a request attempt about to be sent."""
+
+    def on_request_end(self, event: RequestEvent, /) -> None:
+        """Handle a completed request attempt."""
+
+
+class RequestTimer:
+    """Times a single request attempt and reports it to hooks."""
+
+    def __init__(
+        self, hooks: Sequence[RequestHook], start: RequestStart, queued: float
+    ) -> None:
+        """Notify ``hooks`` that the attempt is starting."""
+        self.hooks = hooks
+        self.start = start
+        self.queued = queued
+        self.marks: dict[str, float] = {}
+        for hook in hooks:
+            hook.on_request_start(start)
+        self._started = time.time()
+        self._sent = self._received = time.perf_counter()
+
+    def received(self) -> None:
+        """Mark the response as fully received."""
+        self._received = time.perf_counter()
+
+    async def trace(self, name: str, _: Mapping[str, Any]) -> None:
+        """``httpcore`` trace callback, recording when each phase completes."""
+        self.marks[name.partition(".")[2] if name.startswith("http") else name] = (
+            time.perf_counter()
+        )
+
+    def end(
+        self,
+        *,
+        status: int,
+        headers: Mapping[str, str],
+        bytes_in: int,
+        bytes_out: int,
+        waiting: float | None = None,
+    ) -> None:
+        """Notify hooks that the attempt completed, once its body is decoded.
+
+        Args:
+            status: Response status code.
+            headers: Response headers.
+            bytes_in: Size of the response body.
+            bytes_out: Size of the request body.
+            waiting: Time to the response headers, if not traced.
+        """
+        decoded = time.perf_counter()
+        network = self._received - self._sent
+        queued, connect = self.queued, None
+        if (
+            headers_received := self.marks.get("receive_response_headers.complete")
+        ) is not None:
+            first_mark = min(self.marks.values())
+            queued += first_mark - self._sent
+            connect = max(
+                self.marks.get("connection.start_tls.complete", first_mark),
+                self.marks.get("connection.connect_tcp.complete", first_mark),
+            ) - self.marks.get("connection.connect_tcp.started", first_mark)
+            waiting = headers_received - self.marks.get(
+                "send_request_headers.started", first_mark
+            )
+            network -= first_mark - self._sent
+        elif waiting is None:
+            waiting = network
+        event = RequestEvent(
+            **self.start,
+            status=status,
+            activity_id=headers.get(ACTIVITY_ID_HEADER),
+            started=self._started,
+            queued=queued,
+            connect=connect,
+            waiting=waiting,
+            download=max(network - waiting - (connect or 0), 0),
+            decode=decoded - self._received,
+            duration=network + decoded - self._received,
+            bytes_in=bytes_in,
+            bytes_out=bytes_out,
+        )
+        for hook in self.hooks:
+            hook.on_request_end(event)
+
+
+class HistogramSummary(TypedDict):
+    """Summary of the requests to one endpoint."""
+
+    count: int
+    errors: int
+    """Responses with a 4xx/5xx status."""
+
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    decode: float
+    """Total decode time."""
+
+    bytes_in: int
+    bytes_out: int
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = self.errors = self.bytes_in = self.bytes_out = 0
+        self.total = self.decode = 0.0
+
+
+class HistogramHook:
+    """In-process histograms of request durations, by endpoint.
+
+    Durations are counted in logarithmic buckets, so memory stays constant and
+    percentiles are accurate to within ``growth``.
+    """
+
+    def __init__(self, *, growth: float = 1.1) -> None:
+        """Create empty histograms.
+
+        Args:
+            growth: Ratio between the bounds of consecutive buckets.
+        """
+        self._log_growth = math.log(growth)
+        self._growth = growth
+        self._histograms: dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def on_request_start(self, event: RequestStart, /) -> None:
+        """Do nothing."""
+
+    def on_request_end(self, event: RequestEvent, /) -> None:
+        """Count a completed request attempt."""
+        bucket = math.ceil(math.log(max(event["duration"], 1e-6)) / self._log_growth)
+        with self._lock:
+            histogram = self._histograms.get(name := event["endpoint"].__name__)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram()
+            histogram.buckets[bucket] = histogram.buckets.get(bucket, 0) + 1
+            histogram.count += 1
+            histogram.errors += event["status"] >= HTTPStatus.BAD_REQUEST
+            histogram.total += event["duration"]
+            histogram.decode += event["decode"]
+            histogram.bytes_in += event["bytes_in"]
+            histogram.bytes_out += event["bytes_out"]
+
+    def summary(self) -> dict[str, HistogramSummary]:
+        """Summaries of the requests so far, by endpoint class name."""
+        with self._lock:
+            return {
+                name: HistogramSummary(
+                    count=histogram.count,
+                    errors=histogram.errors,
+                    mean=histogram.total / histogram.count,
+                    p50=self._quantile(histogram, 0.5),
+                    p90=self._quantile(histogram, 0.9),
+                    p99=self._quantile(histogram, 0.99),
+                    decode=histogram.decode,
+                    bytes_in=histogram.bytes_in,
+                    bytes_out=histogram.bytes_out,
+                )
+                for name, histogram in self._histograms.items()
+            }
+
+    def _quantile(self, histogram: _Histogram, q: float) -> float:
+        buckets = sorted(histogram.buckets.items())
+        cumulative = list(itertools.accumulate(count for _, count in buckets))
+        index = bisect.bisect_left(cumulative, q * histogram.count)
+        return self._growth ** buckets[min(index, len(buckets) - 1)][0]
+
+
+class OpenTelemetryHook:
+    """Exports request attempts as OpenTelemetry client spans.
+
+    Requires ``opentelemetry-api`` (the ``otel`` extra).
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        """Export spans with ``tracer``, or the global tracer provider's by default."""
+        from opentelemetry import trace  # noqa: PLC0415
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer(__package__)
+
+    def on_request_start(self, event: RequestStart, /) -> None:
+        """Do nothing: spans are exported once the attempt completes."""
+
+    def on_request_end(self, event: RequestEvent, /) -> None:
+        """Export a span for a completed request attempt."""
+        start_time = int(event["started"] * 1e9)
+        attributes: dict[str, str | int | float] = {
+            "http.request.method": event["method"],
+            "url.full": event["url"],
+            "http.response.status_code": event["status"],
+            "http.request.resend_count": event["attempt"],
+            "http.request.body.size": event["bytes_out"],
+            "http.response.body.size": event["bytes_in"],
+            "ado.endpoint": event["endpoint"].__name__,
+            "ado.activity_id": event["activity_id"] or "",
+            "ado.waiting": event["waiting"],
+            "ado.download": event["download"],
+            "ado.decode": event["decode"],
+        }
+        if event["connect"] is not None:
+            attributes["ado.connect"] = event["connect"]
+        span = self.tracer.start_span(
+            f"{event['method']} {event['endpoint'].__name__}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=start_time,
+            attributes=attributes,
+        )
+        if event["status"] >= HTTPStatus.BAD_REQUEST:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=start_time + int(event["duration"] * 1e9))
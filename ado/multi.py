@@ -0,0 +1,165 @@
+"""Fan calls out across many organizations and projects."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Self,
+    TypeAlias,
+    TypedDict,
+    TypeVar,
+    Unpack,
+)
+
+from .core import DEFAULT_CONCURRENCY, ClientConfiguration, _BaseClient
+
+
+if TYPE_CHECKING:
+    from . import Client
+    from .transport import Transport
+
+
+ProjectKey: TypeAlias = tuple[str, str]  # noqa: UP040
+"""An ``(organization, project)`` pair."""
+
+_R = TypeVar("_R")
+
+
+class FanOutResult(TypedDict, Generic[_R]):  # noqa: UP046
+    """Outcome of a call for one project."""
+
+    organization: str
+    project: str
+    result: _R | None
+    error: Exception | None
+    """The exception raised by the call, if it failed."""
+
+
+class MultiClient:
+    """Clients for many organization/project pairs.
+
+    Clients of the same organization share one connection pool, unless a
+    ``transport`` is configured, which is then shared by every client. Calls fanned
+    out across them run on a bounded worker pool, and a project that fails or is
+    slow does not hold up the results of the others.
+
+    Example:
+        >>> with MultiClient([("org-a", "project"), ("org-b", "project")]) as multi:
+        ...     results = list(multi.fan_out(lambda c: c.git.repositories.list_all()))
+    """
+
+    def __init__(
+        self,
+        projects: Iterable[ProjectKey],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        sessions: Mapping[str, Transport] | None = None,
+        **kwargs: Unpack[ClientConfiguration],
+    ) -> None:
+        """Create a client per project.
+
+        Args:
+            projects: ``(organization, project)`` pairs.
+            concurrency: Maximum number of calls in flight across all projects.
+            sessions: Existing transports to reuse, by organization. They are not
+                closed with this client.
+            **kwargs: Configuration shared by every client.
+        """
+        from . import Client  # noqa: PLC0415
+
+        self.concurrency = concurrency
+        self.sessions = dict(sessions or {})
+        self._owned: list[Transport] = []
+        self.clients: dict[ProjectKey, Client] = {}
+        shared = kwargs.get("transport") or kwargs.get("session")
+        for organization, project in projects:
+            if organization not in self.sessions:
+                self.sessions[organization] = shared or self._create_session(
+                    **(ClientConfiguration(pool_size=concurrency) | kwargs)
+                )
+            self.clients[organization, project] = Client(
+                **(
+                    kwargs
+                    | ClientConfiguration(
+                        organization=organization,
+                        project=project,
+                        transport=self.sessions[organization],
+                    )
+                )
+            )
+
+    def fan_out(self, fn: Callable[[Client], _R]) -> Iterator[FanOutResult[_R]]:
+        """Call ``fn`` with every project's client concurrently, yielding results as
+        they complete.
+
+        Example:
+            >>> for result in multi.fan_out(lambda c: c.git.repositories.list_all()):
+            ...     print(result["project"], len(result["result"] or []))
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {
+                executor.submit(fn, client): key for key, client in self.clients.items()
+            }
+            for future in as_completed(futures):
+                organization, project = futures[future]
+                try:
+                    result, error = future.result(), None
+                except Exception as e:  # noqa: BLE001
+                    result, error = None, e
+                yield FanOutResult(
+                    organization=organization,
+                    project=project,
+                    result=result,
+                    error=error,
+                )
+
+    def _create_session(self, **kwargs: Unpack[ClientConfiguration]) -> Transport:
+        session: Transport = _BaseClient._create_session(**kwargs)
+        self._owned.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close the connection pools created by this client."""
+        for session in self._owned:
+            session.close()
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:  # noqa: D105
+        self.close()
+
+
+def _as_project_keys(
+    organization: str,
+    projects: Iterable[str | ProjectKey],
+) -> list[ProjectKey]:
+    return [
+        (organization, project) if isinstance(project, str) else project
+        for project in projects
+    ]
+
+
+def fan_out(
+    client: Client,
+    fn: Callable[[Client], Any],
+    projects: Iterable[str | ProjectKey],
+    concurrency: int,
+) -> Iterator[FanOutResult[Any]]:
+    """Fan ``fn`` out from ``client`` to ``projects``, reusing its configuration and,
+    within its organization, its connection pool.
+    """
+    configuration = client._configuration()
+    del configuration["organization"], configuration["project"]
+    del configuration["session"]
+    with MultiClient(
+        _as_project_keys(client.organization, projects),
+        concurrency=concurrency,
+        sessions={client.organization: client.session},
+        **configuration,
+    ) as multi:
+        yield from multi.fan_out(fn)
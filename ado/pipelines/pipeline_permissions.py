@@ -1,12 +1,18 @@
 """Pipeline permissions endpoint."""
 
+import itertools
+from collections.abc import Iterable, Mapping
 from http import HTTPMethod
-from typing import ClassVar, TypedDict
+from typing import Any, ClassVar, NotRequired, TypedDict
 
-from ..core import Endpoint, Resource, endpoint
+from ..core import DEFAULT_CONCURRENCY, Endpoint, Resource, concurrent_map, endpoint
 from ..models import AuthorizedByInfo
 
 
+PIPELINE_PERMISSIONS_BATCH_SIZE = 100
+"""Maximum number of resources patched per resource-batch request."""
+
+
 class VariableGroupPermissionPatch(TypedDict):
     """Variable group permission patch setting."""
 
@@ -28,6 +34,24 @@ class VariableGroupPermissionResponse(TypedDict):
     resource: Resource
 
 
+class ResourcePermissionsPatch(TypedDict):
+    """Pipeline permissions patch for a single resource."""
+
+    pipelines: list[VariableGroupPermissionPatch]
+    resource: Resource
+    allPipelines: NotRequired[dict[str, Any]]
+
+
+class GrantResult(TypedDict):
+    """Outcome of a grant for a single variable group."""
+
+    pipelines: list[VariableGroupPermissionInfo]
+    """Pipeline permissions of the variable group after the grant."""
+
+    message: str | None
+    """Error message, if the grant failed."""
+
+
 class VariableGroupPermissions(Endpoint):
     """Variable group permissions endpoint."""
 
@@ -40,30 +64,131 @@ class VariableGroupPermissions(Endpoint):
         /,
         *,
         pipeline_ids: list[int],
+        fetch_existing: bool = False,
     ) -> VariableGroupPermissionResponse:
-        """Grant pipelines permissions to a variable group."""
-        # Get all the current permissions
-        payload = {
-            "pipelines": [
-                *[
-                    VariableGroupPermissionPatch(
-                        id=pipeline_id,
-                        authorized=True,
-                    )
-                    for pipeline_id in pipeline_ids
-                ],
-                [
-                    VariableGroupPermissionPatch(
-                        id=permissions_id,
-                        authorized=permissions["authorized"],
-                    )
-                    for permissions in self.get(variable_group_id)
-                    if (permissions_id := permissions["id"]) not in pipeline_ids
-                ],
-            ]
-        }
+        """Grant pipelines permissions to a variable group.
+
+        The server merges the patch into the existing permissions, so they are only
+        fetched and restated with ``fetch_existing=True``.
+        """
+        existing = self.get(variable_group_id) if fetch_existing else []
+        payload = self._grant_payload(pipeline_ids, existing)
         return self._call(HTTPMethod.PATCH, variable_group_id, payload=payload)
 
+    def grant_many(
+        self,
+        grants: Mapping[int, list[int]],
+        /,
+        *,
+        fetch_existing: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[int, GrantResult]:
+        """Grant pipelines permissions to many variable groups.
+
+        Grants are applied through the pipeline permissions resource-batch API, up
+        to 100 variable groups per request.
+
+        Args:
+            grants: Pipeline ids to authorize, by variable group id.
+            fetch_existing: Fetch and restate the existing permissions of each
+                variable group (concurrently). The server merges them otherwise.
+            concurrency: Maximum number of concurrent requests.
+
+        Returns:
+            The result of every grant, by variable group id.
+        """
+        existing: dict[int, list[VariableGroupPermissionInfo]] = {}
+        if fetch_existing:
+            existing = dict(
+                zip(
+                    grants,
+                    concurrent_map(self.get, grants, concurrency=concurrency),
+                    strict=True,
+                )
+            )
+        batches = concurrent_map(
+            self._resource_batch().update,
+            self._grant_many_batches(grants, existing),
+            concurrency=concurrency,
+        )
+        return self._grant_results(grants, batches)
+
+    def _resource_batch(self) -> "PipelinePermissions":
+        return PipelinePermissions(*self.parts[:-2], **self._configuration())
+
+    @classmethod
+    def _grant_payload(
+        cls,
+        pipeline_ids: list[int],
+        existing: list[VariableGroupPermissionInfo],
+    ) -> dict[str, Any]:
+        return {"pipelines": cls._grant_pipelines(pipeline_ids, existing)}
+
+    @staticmethod
+    def _grant_pipelines(
+        pipeline_ids: list[int],
+        existing: list[VariableGroupPermissionInfo],
+    ) -> list[VariableGroupPermissionPatch]:
+        return [
+            *[
+                VariableGroupPermissionPatch(
+                    id=pipeline_id,
+                    authorized=True,
+                )
+                for pipeline_id in pipeline_ids
+            ],
+            *[
+                VariableGroupPermissionPatch(
+                    id=permissions_id,
+                    authorized=permissions["authorized"],
+                )
+                for permissions in existing
+                if (permissions_id := permissions["id"]) not in pipeline_ids
+            ],
+        ]
+
+    @classmethod
+    def _grant_many_batches(
+        cls,
+        grants: Mapping[int, list[int]],
+        existing: Mapping[int, list[VariableGroupPermissionInfo]],
+    ) -> Iterable[list[ResourcePermissionsPatch]]:
+        patches = (
+            ResourcePermissionsPatch(
+                resource=Resource(id=variable_group_id, type="variablegroup"),
+                pipelines=cls._grant_pipelines(
+                    pipeline_ids,
+                    existing.get(variable_group_id, []),
+                ),
+            )
+            for variable_group_id, pipeline_ids in grants.items()
+        )
+        return map(list, itertools.batched(patches, PIPELINE_PERMISSIONS_BATCH_SIZE))
+
+    @staticmethod
+    def _grant_results(
+        grants: Mapping[int, list[int]],
+        batches: Iterable[dict[str, Any]],
+    ) -> dict[int, GrantResult]:
+        results: dict[int, GrantResult] = {}
+        for variable_group_ids, batch in zip(
+            itertools.batched(grants, PIPELINE_PERMISSIONS_BATCH_SIZE),
+            batches,
+            strict=True,
+        ):
+            # Error responses fail the whole batch and carry a message instead
+            message = batch.get("message", "Missing from the response.")
+            granted = {
+                int(permissions["resource"]["id"]): permissions["pipelines"]
+                for permissions in batch.get("value", [])
+            }
+            for variable_group_id in variable_group_ids:
+                results[variable_group_id] = GrantResult(
+                    pipelines=granted.get(variable_group_id, []),
+                    message=None if variable_group_id in granted else message,
+                )
+        return results
+
     def get(self, variable_group_id: int, /) -> list[VariableGroupPermissionInfo]:
         """Get variable group permissions."""
         response: VariableGroupPermissionResponse = super().get(variable_group_id)  # type: ignore[assignment]
@@ -74,6 +199,15 @@ class PipelinePermissions(Endpoint):
     """Pipeline permissions endpoint."""
 
     path: ClassVar[str] = "pipelinePermissions"
+    api_version: ClassVar[str] = "7.1-preview.1"
+
+    def update(
+        self,
+        resources: list[ResourcePermissionsPatch],
+        /,
+    ) -> dict[str, Any]:
+        """Update the pipeline permissions of many resources in a single request."""
+        return self._call(HTTPMethod.PATCH, payload=resources)
 
     @endpoint
     def variable_groups(self) -> VariableGroupPermissions:
@@ -0,0 +1,125 @@
+"""Client-side rate limiting."""
+
+import email.utils
+import random
+import threading
+import time
+from collections.abc import Mapping
+from http import HTTPStatus
+
+
+RETRY_AFTER_STATUSES = frozenset(
+    {HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE}
+)
+"""Status codes that are retried after backing off."""
+
+
+class RateLimiter:
+    """Token-bucket governor shared by every request made through a client.
+
+    Requests are paced at an adaptive rate: it is cut whenever Azure DevOps reports
+    that requests are being delayed (``X-RateLimit-Delay``) or that the remaining
+    budget is running low (``X-RateLimit-Remaining``), and grows back slowly while
+    responses are unthrottled. A ``Retry-After`` header pauses all requests, and
+    throttled requests are retried with jittered exponential backoff.
+
+    Thread safe. ``reserve`` and ``observe`` never block, so the same instance can
+    pace threads and asyncio tasks alike.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 20,
+        burst: int = 20,
+        min_rate: float = 1,
+        max_rate: float = 100,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 60,
+    ) -> None:
+        """Create a rate limiter.
+
+        Args:
+            rate: Initial number of requests per second.
+            burst: Number of requests that may be sent at once after being idle.
+            min_rate: Lower bound for the adaptive rate.
+            max_rate: Upper bound for the adaptive rate.
+            max_retries: Number of times a throttled request is retried.
+            backoff: Base delay, in seconds, for exponential backoff.
+            max_backoff: Upper bound, in seconds, for a single backoff.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a slot for one request, returning how many seconds to wait before
+        sending it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+            self._tokens -= 1
+            deficit = max(-self._tokens, 0) / self.rate
+            return max(self._paused_until - now, 0) + deficit
+
+    def observe(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        attempt: int,
+    ) -> float | None:
+        """Adapt to a response, returning the delay before retrying it, or ``None``
+        if it should not be retried.
+        """
+        retry_after = self._retry_after(headers)
+        with self._lock:
+            if retry_after is not None:
+                self._paused_until = max(
+                    self._paused_until,
+                    time.monotonic() + retry_after,
+                )
+            if status in RETRY_AFTER_STATUSES or float(
+                headers.get("X-RateLimit-Delay") or 0
+            ):
+                self.rate = max(self.min_rate, self.rate / 2)
+            elif self._running_low(headers):
+                self.rate = max(self.min_rate, self.rate * 0.75)
+            elif status < HTTPStatus.BAD_REQUEST:
+                self.rate = min(self.max_rate, self.rate + 1)
+
+        if status not in RETRY_AFTER_STATUSES or attempt >= self.max_retries:
+            return None
+        ceiling = min(self.max_backoff, self.backoff * 2**attempt)
+        return max(retry_after or 0, random.uniform(0, ceiling))  # noqa: S311
+
+    @staticmethod
+    def _running_low(headers: Mapping[str, str]) -> bool:
+        remaining = headers.get("X-RateLimit-Remaining")
+        limit = headers.get("X-RateLimit-Limit")
+        if remaining is None or limit is None:
+            return False
+        return float(remaining) < float(limit) / 10
+
+    @staticmethod
+    def _retry_after(headers: Mapping[str, str]) -> float | None:
+        if (value := headers.get("Retry-After")) is None:
+            return None
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            retry_at = email.utils.parsedate_to_datetime(value)
+            return max(retry_at.timestamp() - time.time(), 0)
@@ -0,0 +1,109 @@
+"""Compact, immutable records for response items."""
+
+import collections
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, get_args, get_origin, get_type_hints, is_typeddict
+
+
+_RecordType = tuple[type[tuple[Any, ...]], list[tuple[str, Callable[[Any], Any]]]]
+
+_namedtuple = collections.namedtuple
+"""``namedtuple``, typed as returning a tuple type for dynamic field names."""
+
+
+class RecordFactory:
+    """Builds immutable records from response dicts.
+
+    Each TypedDict gets a named tuple type with the same fields, which holds its
+    values in a single slotted tuple instead of a dict. Nested records that repeat
+    across items (such as the same ``ProjectInfo`` or ``UserInfo``) are interned, so
+    one instance is shared by every item that references it; the least recently used
+    are evicted once ``max_interned`` are held. Fields that are not declared on the
+    TypedDict are dropped.
+
+    Thread safe; a single factory may be shared by many clients.
+    """
+
+    def __init__(self, *, intern: bool = True, max_interned: int = 4096) -> None:
+        """Create a factory, optionally interning up to ``max_interned`` nested
+        records.
+        """
+        self.intern = intern
+        self.max_interned = max_interned
+        self._interned: OrderedDict[tuple[type, Any], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._record_types: dict[type, _RecordType] = {}
+
+    def build(self, typed_dict: type, value: Any, /) -> Any:
+        """Build a record of ``typed_dict`` from a decoded dict. Values that are not
+        dicts (e.g. already typed) are returned unchanged.
+        """
+        if not isinstance(value, dict):
+            return value
+        record_type, converters = self._record_type(typed_dict)
+        # As the named tuple's ``_make``
+        return tuple.__new__(
+            record_type,
+            (
+                convert(value[name]) if name in value else None
+                for name, convert in converters
+            ),
+        )
+
+    def build_all(self, typed_dict: type, values: Iterable[Any], /) -> Iterator[Any]:
+        """Lazily build records from many decoded dicts."""
+        return map(functools.partial(self.build, typed_dict), values)
+
+    def _build_nested(self, typed_dict: type, value: Any) -> Any:
+        record = self.build(typed_dict, value)
+        if not self.intern:
+            return record
+        key = (type(record), record)
+        try:
+            hash(key)
+        except TypeError:  # unhashable values, e.g. nested lists
+            return record
+        with self._lock:
+            if (interned := self._interned.get(key)) is not None:
+                self._interned.move_to_end(key)
+                return interned
+            self._interned[key] = record
+            while len(self._interned) > self.max_interned:
+                self._interned.popitem(last=False)
+        return record
+
+    def _record_type(self, typed_dict: type) -> _RecordType:
+        if (cached := self._record_types.get(typed_dict)) is not None:
+            return cached
+
+        hints = get_type_hints(typed_dict)
+        record_type = _namedtuple(
+            typed_dict.__name__,
+            hints,
+            defaults=[None] * len(hints),
+            module=typed_dict.__module__,
+        )
+        converters = [
+            (name, self._converter(annotation)) for name, annotation in hints.items()
+        ]
+        return self._record_types.setdefault(typed_dict, (record_type, converters))
+
+    def _converter(self, annotation: Any) -> Callable[[Any], Any]:
+        if is_typeddict(annotation):
+            return functools.partial(self._build_nested, annotation)
+
+        origin, args = get_origin(annotation), get_args(annotation)
+        if origin is list and args and is_typeddict(args[0]):
+            convert_item = self._converter(args[0])
+            return lambda values: tuple(map(convert_item, values))
+        if origin is dict and len(args) == 2 and is_typeddict(args[1]):  # noqa: PLR2004
+            convert_value = self._converter(args[1])
+            return lambda values: {k: convert_value(v) for k, v in values.items()}
+        return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
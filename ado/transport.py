@@ -0,0 +1,556 @@
+"""HTTP transports: how the client sends requests.
+
+A transport is anything with the subset of ``requests.Session`` used by endpoints. The
+default is a pooled ``requests`` session; ``HttpxTransport`` multiplexes requests over
+HTTP/2, and ``RecordingTransport``/``ReplayTransport`` capture traffic to a cassette
+and play it back offline, with the captured latencies.
+"""
+
+from __future__ import annotations
+
+import base64
+import collections
+import functools
+import json
+import threading
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, Self, TypedDict
+from urllib.parse import urlencode, urlsplit
+
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""Status codes that are retried by the session's transport adapter."""
+
+_CHUNK_SIZE = 1 << 16
+"""Bytes read at a time when a streamed body is read in full."""
+
+
+class TransportRequest(Protocol):
+    """The request a response answers."""
+
+    body: Any
+    """Request body as sent, if any."""
+
+
+class TransportResponse(Protocol):
+    """The subset of ``requests.Response`` used by endpoints."""
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code."""
+        ...
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers, looked up case-insensitively."""
+        ...
+
+    @property
+    def request(self) -> TransportRequest:
+        """The request this response answers."""
+        ...
+
+    @property
+    def elapsed(self) -> timedelta:
+        """Time between sending the request and receiving the response headers."""
+        ...
+
+    @property
+    def content(self) -> bytes:
+        """The whole body."""
+        ...
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the body in chunks."""
+        ...
+
+    def raise_for_status(self) -> object:
+        """Raise an error for 4xx and 5xx responses."""
+        ...
+
+    def close(self) -> None:
+        """Release the connection."""
+        ...
+
+    def __enter__(self) -> Any:  # noqa: D105
+        ...
+
+    def __exit__(self, *exc_info: object) -> Any:  # noqa: D105
+        ...
+
+
+class Transport(Protocol):
+    """Sends requests: the subset of ``requests.Session`` used by endpoints."""
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        auth: tuple[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        """Send a request. With ``stream=True``, the body is left unread."""
+        ...
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        ...
+
+
+def create_session(
+    *,
+    pool_size: int = 10,
+    max_retries: int = 3,
+    retry_statuses: Collection[int] = RETRY_STATUSES,
+) -> requests.Session:
+    """Create a connection-pooled, keep-alive session with retries."""
+    import requests  # noqa: PLC0415
+    from requests.adapters import HTTPAdapter  # noqa: PLC0415
+    from urllib3.util.retry import Retry  # noqa: PLC0415
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=retry_statuses,
+            # Otherwise urllib3 retries any 429 or 503 with a Retry-After header
+            respect_retry_after_header=bool(retry_statuses),
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RequestsTransport:
+    """Stands in for a session from ``create_session``, importing the HTTP stack and
+    creating the connection pool on first use rather than when the client is created.
+    Attributes are forwarded to the underlying session.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Defer ``create_session(**kwargs)``."""
+        self._kwargs = kwargs
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The underlying session, created on first access."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = create_session(**self._kwargs)
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward to the underlying session."""
+        return getattr(self.session, name)
+
+    def close(self) -> None:
+        """Close pooled connections, if any were opened."""
+        if self._session is not None:
+            self._session.close()
+
+
+class HttpxTransport:
+    """Sends requests with ``httpx``, multiplexing them over HTTP/2 connections.
+
+    Requires the ``http2`` extra (``httpx[http2]``). Only connection errors are retried;
+    use a rate limiter to retry throttled responses.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        pool_size: int = 10,
+        max_retries: int = 3,
+    ) -> None:
+        """Create the underlying connection pool."""
+        import httpx  # noqa: PLC0415
+
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+        )
+        self.client = httpx.Client(
+            http2=http2,
+            transport=httpx.HTTPTransport(
+                http2=http2,
+                limits=limits,
+                retries=max_retries,
+            ),
+            timeout=60,
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        auth: tuple[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> HttpxResponse:
+        """Send a request. With ``stream=True``, the body is left unread."""
+        request = self.client.build_request(
+            method,
+            url,
+            params=_query_params(params),
+            headers=headers,
+            json=json,
+            content=data,
+            timeout=timeout,
+        )
+        start = time.perf_counter()
+        response = self.client.send(request, auth=auth, stream=stream)
+        return HttpxResponse(response, time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.client.close()
+
+
+class HttpxResponse:
+    """An ``httpx`` response with the interface of a ``requests`` response."""
+
+    def __init__(self, response: httpx.Response, elapsed: float) -> None:
+        """Wrap ``response``, received ``elapsed`` seconds after it was sent."""
+        self.response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.elapsed = timedelta(seconds=elapsed)
+
+    @property
+    def request(self) -> _Request:
+        """The request this response answers."""
+        return _Request(self.response.request.content)
+
+    @property
+    def content(self) -> bytes:
+        """The whole body."""
+        return self.response.read()
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the body in chunks."""
+        return self.response.iter_bytes(chunk_size)
+
+    def raise_for_status(self) -> object:
+        """Raise ``httpx.HTTPStatusError`` for 4xx and 5xx responses."""
+        return self.response.raise_for_status()
+
+    def close(self) -> None:
+        """Release the connection."""
+        self.response.close()
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:  # noqa: D105
+        self.close()
+
+
+class Interaction(TypedDict):
+    """A request and its response, as recorded in a cassette."""
+
+    method: str
+    url: str
+    """Request URL, including its query string with parameters sorted."""
+
+    status: int
+    headers: dict[str, str]
+    body: str
+    """Base64-encoded response body."""
+
+    request_size: int
+    """Size of the request body."""
+
+    elapsed: float
+    """Seconds between sending the request and receiving the whole response."""
+
+
+class RecordingTransport:
+    """Sends requests with another transport, recording every request and response
+    to a cassette: a file with one JSON interaction per line.
+
+    Streamed response bodies are recorded chunk by chunk as they are read, once the
+    response is exhausted or closed. The authorization header is never recorded.
+    """
+
+    def __init__(self, transport: Transport, path: str | Path) -> None:
+        """Record requests sent through ``transport`` to the cassette at ``path``."""
+        self.transport = transport
+        self._file = Path(path).open("w", encoding="utf-8")  # noqa: SIM115
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        auth: tuple[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        """Send a request through the wrapped transport and record it."""
+        start = time.perf_counter()
+        response = self.transport.request(
+            method,
+            url,
+            params=params,
+            auth=auth,
+            headers=headers,
+            json=json,
+            data=data,
+            timeout=timeout,
+            stream=stream,
+        )
+        record = functools.partial(
+            self._record,
+            Interaction(
+                method=method,
+                url=_cassette_url(url, params),
+                status=response.status_code,
+                headers=dict(response.headers),
+                body="",
+                request_size=len(response.request.body or b""),
+                elapsed=0,
+            ),
+            start,
+        )
+        if stream:
+            return _RecordingResponse(response, record)
+        record([response.content])
+        return response
+
+    def _record(
+        self, interaction: Interaction, start: float, chunks: Iterable[bytes]
+    ) -> None:
+        interaction["body"] = base64.b64encode(b"".join(chunks)).decode()
+        interaction["elapsed"] = time.perf_counter() - start
+        line = json.dumps(interaction) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the cassette and the wrapped transport."""
+        with self._lock:
+            self._file.close()
+        self.transport.close()
+
+
+class _RecordingResponse:
+    """A streamed response whose body is recorded as it is read."""
+
+    def __init__(
+        self,
+        response: TransportResponse,
+        record: Callable[[Iterable[bytes]], None],
+    ) -> None:
+        self.response = response
+        self._record: Callable[[Iterable[bytes]], None] | None = record
+        self._chunks: list[bytes] = []
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward to the wrapped response."""
+        return getattr(self.response, name)
+
+    @property
+    def content(self) -> bytes:
+        """The rest of the body."""
+        return b"".join(self.iter_content(_CHUNK_SIZE))
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the body in chunks, recording it once exhausted."""
+        for chunk in self.response.iter_content(chunk_size):
+            self._chunks.append(chunk)
+            yield chunk
+        self._finish()
+
+    def close(self) -> None:
+        """Record the body read so far and release the connection."""
+        self._finish()
+        self.response.close()
+
+    def _finish(self) -> None:
+        if self._record is not None:
+            self._record(self._chunks)
+            self._record = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class ReplayTransport:
+    """Answers requests from a cassette, without any network access, waiting for the
+    recorded latency of each response.
+
+    Requests are matched on method, path and query string, so a cassette can be
+    replayed against any base URL. Responses to the same request are replayed in
+    recorded order, starting over once they have all been replayed.
+    """
+
+    def __init__(self, path: str | Path, *, speed: float = 1.0) -> None:
+        """Load the cassette at ``path``.
+
+        Args:
+            path: Cassette recorded with ``RecordingTransport``.
+            speed: Factor applied to recorded latencies, e.g. 2 to replay twice as
+                fast or 0 to replay without waiting.
+        """
+        self.speed = speed
+        self._interactions: dict[str, collections.deque[Interaction]] = {}
+        with Path(path).open(encoding="utf-8") as file:
+            for line in file:
+                interaction: Interaction = json.loads(line)
+                self._interactions.setdefault(
+                    _cassette_key(interaction["method"], interaction["url"]),
+                    collections.deque(),
+                ).append(interaction)
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        auth: tuple[str, str] | None = None,  # noqa: ARG002
+        headers: Mapping[str, str] | None = None,  # noqa: ARG002
+        json: Any = None,  # noqa: ARG002
+        data: Any = None,  # noqa: ARG002
+        timeout: float | None = None,  # noqa: ARG002
+        stream: bool = False,  # noqa: ARG002
+    ) -> ReplayResponse:
+        """Replay the next recorded response to the request.
+
+        Raises:
+            LookupError: If the cassette has no response to the request.
+        """
+        key = _cassette_key(method, _cassette_url(url, params))
+        with self._lock:
+            if not (interactions := self._interactions.get(key)):
+                msg = f"No recorded response to {key}."
+                raise LookupError(msg)
+            interaction = interactions[0]
+            interactions.rotate(-1)
+        if self.speed:
+            time.sleep(interaction["elapsed"] / self.speed)
+        return ReplayResponse(interaction)
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+class ReplayResponse:
+    """A response replayed from a cassette, with the interface of a ``requests``
+    response.
+    """
+
+    def __init__(self, interaction: Interaction) -> None:
+        """Replay ``interaction``."""
+        self.url = interaction["url"]
+        self.status_code = interaction["status"]
+        self.headers = _Headers(interaction["headers"])
+        self.content = base64.b64decode(interaction["body"])
+        self.request = _Request(b"\0" * interaction["request_size"])
+        self.elapsed = timedelta(seconds=interaction["elapsed"])
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the body in chunks."""
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def raise_for_status(self) -> None:
+        """Raise ``requests.HTTPError`` for 4xx and 5xx responses."""
+        import requests  # noqa: PLC0415
+
+        if self.status_code >= 400:  # noqa: PLR2004
+            msg = f"{self.status_code} Error for url: {self.url}"
+            raise requests.HTTPError(msg, response=self)  # type: ignore[arg-type]
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:  # noqa: D105
+        self.close()
+
+
+class _Request:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+
+class _Headers(dict[str, str]):
+    """Response headers, looked up case-insensitively."""
+
+    def __init__(self, headers: Mapping[str, str]) -> None:
+        super().__init__((name.lower(), value) for name, value in headers.items())
+
+    def __getitem__(self, name: str) -> str:
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and super().__contains__(name.lower())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return super().get(name.lower(), default)
+
+
+def _query_params(params: Mapping[str, Any] | None) -> dict[str, Any] | None:
+    """Query parameters as ``requests`` sends them: booleans spelled ``True`` and
+    ``False``, and ``None`` values left out.
+    """
+    if params is None:
+        return None
+    return {
+        k: str(v) if isinstance(v, bool) else v
+        for k, v in params.items()
+        if v is not None
+    }
+
+
+def _cassette_url(url: str, params: Mapping[str, Any] | None) -> str:
+    if not params:
+        return url
+    query = sorted((k, v) for k, v in (_query_params(params) or {}).items())
+    return f"{url}?{urlencode(query, doseq=True)}"
+
+
+def _cassette_key(method: str, url: str) -> str:
+    _, _, path, query, _ = urlsplit(url)
+    return f"{method.upper()} {path}?{query}"
@@ -1,6 +1,7 @@
 """Work item tracking (wit) API."""
 
 from ..core import Api, endpoint
+from .attachments import Attachments
 from .wiql import Wiql
 from .work_items import WorkItems
 
@@ -8,6 +9,10 @@ from .work_items import WorkItems
 class Wit(Api):
     """[Work item tracking API](https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/?view=azure-devops-rest-7.2)."""
 
+    @endpoint
+    def attachments(self) -> Attachments:
+        """Attachments endpoint."""
+
     @endpoint
     def work_items(self) -> WorkItems:
         """Work items endpoint."""
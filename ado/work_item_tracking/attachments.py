@@ -0,0 +1,144 @@
+"""Attachments endpoint."""
+
+import contextlib
+import os
+from collections.abc import Iterator
+from http import HTTPMethod
+from pathlib import Path
+from typing import Any, BinaryIO, ClassVar, TypedDict, Unpack
+
+from ..core import DEFAULT_CONCURRENCY, concurrent_map
+from ..download import Destination, DownloadEndpoint, DownloadOptions, DownloadResult
+
+
+ATTACHMENT_CHUNK_SIZE = 4 << 20
+"""Bytes per request of chunked attachment uploads."""
+
+
+class AttachmentReference(TypedDict):
+    """Reference to an uploaded attachment."""
+
+    id: str
+    url: str
+
+
+class UploadOptions(TypedDict, total=False):
+    """Options for attachment uploads."""
+
+    file_name: str
+    """Name of the attachment. Defaults to the name of the uploaded file."""
+
+    size: int
+    """Bytes to upload. Required for streams that are not seekable; defaults to the
+    rest of the file or stream otherwise.
+    """
+
+    chunk_size: int
+    """Bytes per request. Defaults to 4 MiB."""
+
+    concurrency: int
+    """Maximum number of chunks in flight at once."""
+
+
+class Attachments(DownloadEndpoint):
+    """[Attachments endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/attachments?view=azure-devops-rest-7.2)."""
+
+    api_version: ClassVar[str] = "7.1"
+
+    def download(
+        self,
+        attachment_id: str,
+        /,
+        dest: Destination,
+        **kwargs: Unpack[DownloadOptions],
+    ) -> DownloadResult:
+        """Stream a work item attachment to ``dest``."""
+        return self._download(
+            attachment_id,
+            dest=dest,
+            params={"download": True},
+            **kwargs,
+        )
+
+    def upload(
+        self,
+        source: str | os.PathLike[str] | BinaryIO,
+        /,
+        **kwargs: Unpack[UploadOptions],
+    ) -> AttachmentReference:
+        """Upload a file or binary stream as an attachment, in chunks.
+
+        The source is read one chunk at a time as chunks are sent, so at most
+        ``concurrency`` chunks are held in memory whatever the size of the upload.
+
+        Raises:
+            requests.HTTPError: If the upload could not be started or a chunk could
+                not be uploaded.
+        """
+        with _chunks(source, **kwargs) as (chunks, size, file_name):
+            params = {"uploadType": "Chunked", "fileName": file_name}
+            response = self._send(
+                HTTPMethod.POST,
+                params=params,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+            response.raise_for_status()
+            reference: AttachmentReference = self.decoder.decode(response.content)
+            for _ in concurrent_map(
+                lambda chunk: self._upload_chunk(reference, params, size, *chunk),
+                chunks,
+                concurrency=kwargs.get("concurrency", DEFAULT_CONCURRENCY),
+            ):
+                pass
+        return reference
+
+    def _upload_chunk(
+        self,
+        reference: AttachmentReference,
+        params: dict[str, Any],
+        size: int,
+        start: int,
+        chunk: bytes,
+    ) -> None:
+        response = self._send(
+            HTTPMethod.PUT,
+            reference["id"],
+            params=params,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{size}",
+            },
+            data=chunk,
+        )
+        response.raise_for_status()
+
+
+@contextlib.contextmanager
+def _chunks(
+    source: str | os.PathLike[str] | BinaryIO,
+    **kwargs: Unpack[UploadOptions],
+) -> Iterator[tuple[Iterator[tuple[int, bytes]], int, str]]:
+    """Lazily read ``source`` in chunks, yielding the chunks with their offsets, the
+    total size and the file name.
+    """
+    chunk_size = kwargs.get("chunk_size", ATTACHMENT_CHUNK_SIZE)
+    with contextlib.ExitStack() as stack:
+        if isinstance(source, str | os.PathLike):
+            source = stack.enter_context(Path(source).open("rb"))
+        file_name = kwargs.get("file_name") or Path(getattr(source, "name", "")).name
+        if not file_name:
+            msg = "A file name is required to upload a stream without a name."
+            raise ValueError(msg)
+        size = kwargs.get("size")
+        if size is None:
+            position = source.tell()
+            size = source.seek(0, os.SEEK_END) - position
+            source.seek(position)
+        yield (
+            (
+                (start, source.read(min(chunk_size, size - start)))
+                for start in range(0, size, chunk_size)
+            ),
+            size,
+            file_name,
+        )
@@ -0,0 +1,256 @@
+"""Compact graph of linked work items."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, TypedDict
+
+from .work_items import RELATIONSHIP_MAPPING, RelationshipName
+
+
+WORK_ITEM_LINKS_BATCH_SIZE = 200
+"""Work items whose links are queried at once, keeping each query well within the
+20,000 result cap.
+"""
+
+_UNVISITED, _VISITING, _VISITED = 0, 1, 2
+
+
+class WorkItemLinkReference(TypedDict):
+    """End of a link returned by a link query."""
+
+    id: int
+    url: str
+
+
+class WorkItemLink(TypedDict):
+    """Link between two work items returned by a link query. Rows for the source
+    work items themselves have no ``rel`` or ``source``.
+    """
+
+    rel: str | None
+    source: WorkItemLinkReference | None
+    target: WorkItemLinkReference
+
+
+class WorkItemGraph:
+    """Work items and the links between them, as a compressed sparse row (CSR)
+    adjacency index.
+
+    Nodes are numbered in discovery order: ``ids[n]`` is the id of node ``n``, and the
+    links from node ``n`` are ``targets[offsets[n]:offsets[n + 1]]`` (node numbers),
+    with the type of each link in ``link_types[edge_types[e]]``.
+    """
+
+    def __init__(
+        self,
+        ids: array[int],
+        *,
+        offsets: array[int],
+        targets: array[int],
+        edge_types: array[int],
+        link_types: Sequence[str],
+        items: Sequence[Any],
+    ) -> None:
+        """Wrap a CSR index. ``items`` holds the hydrated work item of each node, or
+        ``None`` if it was not hydrated.
+        """
+        self.ids = ids
+        self.offsets = offsets
+        self.targets = targets
+        self.edge_types = edge_types
+        self.link_types = list(link_types)
+        self.items = items
+        self._nodes = {work_item_id: node for node, work_item_id in enumerate(ids)}
+
+    def __len__(self) -> int:
+        """Number of work items in the graph."""
+        return len(self.ids)
+
+    def __contains__(self, work_item_id: object) -> bool:
+        """Whether a work item is in the graph."""
+        return work_item_id in self._nodes
+
+    def item(self, work_item_id: int) -> Any:
+        """The hydrated work item, or ``None`` if it was not hydrated."""
+        return self.items[self._nodes[work_item_id]]
+
+    def links(
+        self,
+        work_item_id: int,
+        link_type: RelationshipName | None = None,
+    ) -> list[int]:
+        """Ids of the work items linked from a work item, optionally of one type.
+
+        Raises:
+            KeyError: If the work item is not in the graph, or links of ``link_type``
+                were not followed when loading it.
+        """
+        node = self._nodes[work_item_id]
+        edges: Iterable[int] = range(self.offsets[node], self.offsets[node + 1])
+        if link_type is not None:
+            type_index = self._type_index(link_type)
+            edges = [edge for edge in edges if self.edge_types[edge] == type_index]
+        return [self.ids[self.targets[edge]] for edge in edges]
+
+    def _type_index(self, link_type: RelationshipName) -> int:
+        name = RELATIONSHIP_MAPPING[link_type]
+        if name not in self.link_types:
+            followed = ", ".join(
+                relationship
+                for relationship, reference_name in RELATIONSHIP_MAPPING.items()
+                if reference_name in self.link_types
+            )
+            msg = f"{link_type} links were not followed, only: {followed}."
+            raise KeyError(msg)
+        return self.link_types.index(name)
+
+    def descendants(self, work_item_id: int) -> list[int]:
+        """Ids of the work items reachable from a work item, in breadth-first order."""
+        start = self._nodes[work_item_id]
+        seen = bytearray(len(self.ids))
+        seen[start] = True
+        queue = deque([start])
+        descendants: list[int] = []
+        while queue:
+            node = queue.popleft()
+            for target in self.targets[self.offsets[node] : self.offsets[node + 1]]:
+                if not seen[target]:
+                    seen[target] = True
+                    descendants.append(self.ids[target])
+                    queue.append(target)
+        return descendants
+
+    def critical_path(
+        self,
+        work_item_id: int,
+        weight: Callable[[Any], float] | None = None,
+    ) -> list[int]:
+        """Ids of the heaviest chain of links starting at a work item, e.g. the
+        longest chain of successors.
+
+        Args:
+            work_item_id: First work item of the path.
+            weight: Weight of a hydrated work item (``None`` if not hydrated), e.g.
+                its remaining work. Defaults to 1 for every work item, giving the
+                longest path.
+
+        Raises:
+            ValueError: If the links reachable from the work item form a cycle.
+        """
+        cost = [0.0] * len(self.ids)
+        following = [-1] * len(self.ids)
+        for node in self._post_order(self._nodes[work_item_id]):
+            for target in self.targets[self.offsets[node] : self.offsets[node + 1]]:
+                if following[node] < 0 or cost[target] > cost[following[node]]:
+                    following[node] = target
+            cost[node] = (1.0 if weight is None else weight(self.items[node])) + (
+                cost[following[node]] if following[node] >= 0 else 0.0
+            )
+
+        path = [self._nodes[work_item_id]]
+        while following[path[-1]] >= 0:
+            path.append(following[path[-1]])
+        return [self.ids[node] for node in path]
+
+    def _post_order(self, start: int) -> Iterator[int]:
+        """Nodes reachable from ``start``, each after all of its targets."""
+        state = bytearray(len(self.ids))
+        state[start] = _VISITING
+        stack = [(start, self.offsets[start])]
+        while stack:
+            node, edge = stack[-1]
+            if edge == self.offsets[node + 1]:
+                stack.pop()
+                state[node] = _VISITED
+                yield node
+                continue
+            stack[-1] = (node, edge + 1)
+            target = self.targets[edge]
+            if state[target] == _VISITING:
+                msg = f"Links from work item {self.ids[start]} form a cycle."
+                raise ValueError(msg)
+            if state[target] == _UNVISITED:
+                state[target] = _VISITING
+                stack.append((target, self.offsets[target]))
+
+
+class WorkItemGraphBuilder:
+    """Accumulates the links and work items found by a breadth-first traversal."""
+
+    def __init__(
+        self,
+        root_ids: Iterable[int],
+        link_types: Iterable[RelationshipName],
+    ) -> None:
+        """Start from ``root_ids``, following links of ``link_types``."""
+        self.link_types = [RELATIONSHIP_MAPPING[link_type] for link_type in link_types]
+        self._type_indexes = {name: i for i, name in enumerate(self.link_types)}
+        self._ids: array[int] = array("q")
+        self._nodes: dict[int, int] = {}
+        self._sources: array[int] = array("q")
+        self._targets: array[int] = array("q")
+        self._edge_types: array[int] = array("B")
+        self._items: dict[int, Any] = {}
+        self.frontier: list[int] = []
+        for work_item_id in root_ids:
+            self._node(work_item_id, self.frontier)
+        self._next_frontier: list[int] = []
+
+    def add_links(self, links: Iterable[WorkItemLink]) -> None:
+        """Record links from the current frontier, adding unvisited targets to the
+        next one.
+        """
+        for link in links:
+            if link["rel"] is None or link["source"] is None:
+                continue
+            self._sources.append(self._nodes[link["source"]["id"]])
+            self._targets.append(self._node(link["target"]["id"], self._next_frontier))
+            self._edge_types.append(self._type_indexes[link["rel"]])
+
+    def add_items(self, items: Iterable[Any]) -> None:
+        """Record hydrated work items."""
+        for item in items:
+            self._items[item["id"] if isinstance(item, dict) else item.id] = item
+
+    def advance(self) -> list[int]:
+        """Move on to the next level, returning its ids."""
+        self.frontier, self._next_frontier = self._next_frontier, []
+        return self.frontier
+
+    def build(self) -> WorkItemGraph:
+        """Index the links by source node."""
+        offsets = array("q", bytes(8 * (len(self._ids) + 1)))
+        for source in self._sources:
+            offsets[source + 1] += 1
+        for node in range(len(self._ids)):
+            offsets[node + 1] += offsets[node]
+
+        position = offsets[:-1]
+        targets = array("q", bytes(8 * len(self._sources)))
+        edge_types = array("B", bytes(len(self._sources)))
+        for source, target, edge_type in zip(
+            self._sources, self._targets, self._edge_types, strict=True
+        ):
+            targets[position[source]] = target
+            edge_types[position[source]] = edge_type
+            position[source] += 1
+
+        return WorkItemGraph(
+            self._ids,
+            offsets=offsets,
+            targets=targets,
+            edge_types=edge_types,
+            link_types=self.link_types,
+            items=[self._items.get(work_item_id) for work_item_id in self._ids],
+        )
+
+    def _node(self, work_item_id: int, discovered: list[int]) -> int:
+        """Node number of a work item, adding it to ``discovered`` if unvisited."""
+        if (node := self._nodes.get(work_item_id)) is None:
+            node = self._nodes[work_item_id] = len(self._ids)
+            self._ids.append(work_item_id)
+            discovered.append(work_item_id)
+        return node
@@ -0,0 +1,175 @@
+"""Local snapshot of work items for incremental sync."""
+
+import contextlib
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import TypedDict
+
+from .work_items import CHANGED_DATE_FIELD, WorkItemResponse
+
+
+class SyncResult(TypedDict):
+    """Outcome of a sync run."""
+
+    upserted: int
+    """Number of work items fetched and written (including unchanged revisions)."""
+
+    watermark: str | None
+    """Time up to which the snapshot has every change: when the synced changes were
+    queried, or the latest ``System.ChangedDate`` of upserted work items.
+    """
+
+
+class SnapshotWriter:
+    """Writes batches of work items to a snapshot, each in a short transaction."""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        lock: threading.Lock,
+        watermark: str | None,
+        *,
+        track_changes: bool = True,
+    ) -> None:
+        """Write to ``connection`` while holding ``lock``. Unless ``track_changes`` is
+        false, the watermark advances to the latest ``System.ChangedDate`` written.
+        """
+        self._connection = connection
+        self._lock = lock
+        self._track_changes = track_changes
+        self._latest = None if watermark is None else _parse_date(watermark)
+        self.result = SyncResult(upserted=0, watermark=watermark)
+
+    def add(self, items: Iterable[WorkItemResponse]) -> None:
+        """Upsert a batch of work items, keeping the newest revision of each.
+
+        ``items`` are read (and fetched, if lazy) before the snapshot is locked.
+        """
+        rows = list(map(self._row, items))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO work_items (id, rev, changed_date, fields, url) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET rev = excluded.rev, "
+                "changed_date = excluded.changed_date, fields = excluded.fields, "
+                "url = excluded.url "
+                "WHERE excluded.rev > work_items.rev",
+                rows,
+            )
+
+    def _row(self, item: WorkItemResponse) -> tuple[int, int, str | None, str, str]:
+        changed_date = item["fields"].get(CHANGED_DATE_FIELD)
+        if self._track_changes and changed_date:
+            parsed = _parse_date(changed_date)
+            if self._latest is None or parsed > self._latest:
+                self._latest = parsed
+                self.result["watermark"] = changed_date
+        self.result["upserted"] += 1
+        return (
+            item["id"],
+            item["rev"],
+            changed_date,
+            json.dumps(item["fields"]),
+            item["url"],
+        )
+
+
+class SnapshotStore:
+    """Sqlite snapshot of work items, with the watermark of the last sync."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the snapshot database at ``path``."""
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS work_items ("
+                "id INTEGER PRIMARY KEY, rev INTEGER, changed_date TEXT, fields TEXT, "
+                "url TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    @property
+    def watermark(self) -> str | None:
+        """Time up to which the snapshot has every change."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM sync_state WHERE key = 'watermark'"
+            ).fetchone()
+        return row[0] if row else None
+
+    @contextlib.contextmanager
+    def writer(self, watermark: str | None = None) -> Iterator[SnapshotWriter]:
+        """Write batches of work items, each committed as it is added, and commit the
+        new watermark on exit, unless an error is raised.
+
+        The snapshot is only locked while a batch is written, so batches can be
+        fetched in between. Upserts keep the newest revision, so batches written
+        before an error are kept, and are rewritten harmlessly by the next sync.
+
+        Args:
+            watermark: New watermark, typically the time at which the written
+                changes were queried. Defaults to the latest ``System.ChangedDate``
+                of the snapshot and the written work items.
+        """
+        track_changes = watermark is None
+        writer = SnapshotWriter(
+            self._connection,
+            self._lock,
+            watermark or self.watermark,
+            track_changes=track_changes,
+        )
+        yield writer
+        if writer.result["watermark"] is not None:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES ('watermark', ?)",
+                    (writer.result["watermark"],),
+                )
+
+    def upsert(self, items: Iterable[WorkItemResponse]) -> SyncResult:
+        """Upsert work items in a single transaction, then advance the watermark."""
+        with self.writer() as writer:
+            writer.add(items)
+        return writer.result
+
+    def get(self, work_item_id: int) -> WorkItemResponse | None:
+        """Get a work item from the snapshot."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, rev, fields, url FROM work_items WHERE id = ?",
+                (work_item_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        work_item_id, rev, fields, url = row
+        return WorkItemResponse(
+            id=work_item_id,
+            rev=rev,
+            fields=json.loads(fields),
+            url=url,
+        )
+
+    def __len__(self) -> int:
+        """Number of work items in the snapshot."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM work_items"
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse an Azure DevOps date, whatever the number of fractional digits."""
+    return datetime.fromisoformat(value)
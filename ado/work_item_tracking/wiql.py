@@ -1,9 +1,33 @@
 """Wiql endpoint."""
 
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
 from http import HTTPMethod
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
+
+from ..core import DEFAULT_CONCURRENCY, Endpoint
+from .work_items import WorkItemResponse, WorkItems, WorkItemsBatchParams
+
+
+if TYPE_CHECKING:
+    from .graph import WorkItemLink
+
+WIQL_MAX_RESULTS = 20_000
+"""Maximum number of work items a single wiql query may return."""
+
+_WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b.*$", re.IGNORECASE | re.DOTALL)
+_ASOF = re.compile(r"\bASOF\b.*$", re.IGNORECASE | re.DOTALL)
+_ID_ORDER = re.compile(r"ORDER\s+BY\s+\[System\.Id\](\s+ASC)?", re.IGNORECASE)
 
-from ..core import Endpoint
+
+class WorkItemReference(TypedDict):
+    """Reference to a work item returned by a query."""
+
+    id: int
+    url: str
 
 
 class Wiql(Endpoint):
@@ -12,6 +36,134 @@ class Wiql(Endpoint):
     api_version: ClassVar[str] = "7.1"
     path: ClassVar[str] = "wiql"
 
-    def execute(self, *, query: str) -> Any:
-        """Execute a query."""
-        return self._call(HTTPMethod.POST, payload={"query": query})
+    def execute(
+        self,
+        *,
+        query: str,
+        top: int | None = None,
+        time_precision: bool = False,
+    ) -> Any:
+        """Execute a query.
+
+        Args:
+            query: The wiql query.
+            top: Maximum number of results to return.
+            time_precision: Compare dates in the query by time, not only by day.
+        """
+        params: dict[str, Any] = {}
+        if time_precision:
+            params["timePrecision"] = time_precision
+        if top is not None:
+            params["$top"] = top
+        return self._call(HTTPMethod.POST, payload={"query": query}, params=params)
+
+    def links(
+        self,
+        source_ids: Iterable[int],
+        link_types: Iterable[str],
+    ) -> list[WorkItemLink]:
+        """Get the links of the given types (reference names) from work items, with a
+        one-hop link query.
+        """
+        response = self.execute(query=self._links_query(source_ids, link_types))
+        return response["workItemRelations"]
+
+    def iter_ids(
+        self,
+        *,
+        query: str,
+        page_size: int = WIQL_MAX_RESULTS,
+        time_precision: bool = False,
+    ) -> Iterator[int]:
+        """Lazily iterate over the ids matched by a flat query, in id order.
+
+        The query is run in pages of ``page_size`` keyed on ``[System.Id]``, so queries
+        matching more than the 20,000 result cap are split into id ranges.
+
+        Raises:
+            ValueError: If the query is ordered by anything other than ``[System.Id]``.
+        """
+        return self._ids(
+            self._pages(query=query, page_size=page_size, time_precision=time_precision)
+        )
+
+    def _pages(
+        self,
+        *,
+        query: str,
+        page_size: int = WIQL_MAX_RESULTS,
+        time_precision: bool = False,
+    ) -> Iterator[Any]:
+        """Lazily run a flat query in pages of ids, yielding the responses."""
+        last_id = 0
+        while True:
+            response = self.execute(
+                query=self._after_id(query, last_id),
+                top=page_size,
+                time_precision=time_precision,
+            )
+            yield response
+            references: list[WorkItemReference] = response["workItems"]
+            if len(references) < page_size:
+                return
+            last_id = references[-1]["id"]
+
+    @staticmethod
+    def _ids(pages: Iterable[Any]) -> Iterator[int]:
+        return (reference["id"] for page in pages for reference in page["workItems"])
+
+    def stream(
+        self,
+        *,
+        query: str,
+        fields: list[str] | None = None,
+        page_size: int = WIQL_MAX_RESULTS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[WorkItemResponse]:
+        """Lazily run a flat query and hydrate the matching work items, in id order.
+
+        Ids are hydrated in concurrent batches while earlier batches are being
+        consumed, so memory stays bounded regardless of the number of results.
+
+        Raises:
+            ValueError: If the query is ordered by anything other than ``[System.Id]``.
+        """
+        yield from self._sibling(WorkItems).get_many(
+            self.iter_ids(query=query, page_size=page_size),
+            concurrency=concurrency,
+            **self._batch_params(fields),
+        )
+
+    @staticmethod
+    def _batch_params(fields: list[str] | None) -> WorkItemsBatchParams:
+        return WorkItemsBatchParams(fields=fields) if fields else WorkItemsBatchParams()
+
+    @staticmethod
+    def _links_query(source_ids: Iterable[int], link_types: Iterable[str]) -> str:
+        ids = ", ".join(map(str, source_ids))
+        types = ", ".join(f"'{link_type}'" for link_type in link_types)
+        return (
+            "SELECT [System.Id] FROM WorkItemLinks "  # noqa: S608
+            f"WHERE [Source].[System.Id] IN ({ids}) "
+            f"AND [System.Links.LinkType] IN ({types}) "
+            "MODE (MustContain)"
+        )
+
+    @staticmethod
+    def _after_id(query: str, last_id: int) -> str:
+        """Restrict a query to ids after ``last_id``, ordered by id."""
+        asof = match.group(0) if (match := _ASOF.search(query)) else ""
+        query = _ASOF.sub("", query).strip()
+        if (order := _ORDER_BY.search(query)) and not _ID_ORDER.fullmatch(
+            order.group(0).strip()
+        ):
+            msg = f"Queries run in pages are ordered by [System.Id], not {order[0]!r}."
+            raise ValueError(msg)
+        query = _ORDER_BY.sub("", query).strip()
+        condition = f"[System.Id] > {last_id}"
+        if match := _WHERE.search(query):
+            where = query[match.end() :].strip()
+            query = f"{query[: match.start()]}WHERE {condition} AND ({where})"
+        else:
+            query = f"{query} WHERE {condition}"
+        return f"{query} ORDER BY [System.Id] {asof}".strip()
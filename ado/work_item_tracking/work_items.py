@@ -1,9 +1,36 @@
 """Work items endpoint."""
 
-from http import HTTPMethod
-from typing import Any, ClassVar, Literal, TypeAlias, TypedDict, Unpack
+from __future__ import annotations
 
-from ..core import Endpoint
+import datetime
+import functools
+import itertools
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from http import HTTPMethod, HTTPStatus
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    ClassVar,
+    Literal,
+    NotRequired,
+    TypeAlias,
+    TypedDict,
+    Unpack,
+)
+from urllib.parse import urlencode
+
+from ..core import DEFAULT_CONCURRENCY, Endpoint, ListResponse, concurrent_map
+from .attachments import AttachmentReference, Attachments, UploadOptions
+
+
+if TYPE_CHECKING:
+    from .graph import WorkItemGraph, WorkItemGraphBuilder
+    from .snapshot import SnapshotStore, SyncResult
+    from .templates import WorkItemTemplate
+    from .wiql import Wiql
 
 
 RelationshipName: TypeAlias = Literal[  # noqa: UP040
@@ -53,10 +80,14 @@ ItemType: TypeAlias = Literal["Task", "Bug", "Feature", "User Story"]  # noqa: U
 
 
 class Relationship(TypedDict):
-    """How one work item relates to another work item."""
+    """How one work item relates to another work item, or to another resource."""
 
-    work_item_id: int
+    work_item_id: NotRequired[int]
     relationship_type: RelationshipName
+    url: NotRequired[str]
+    """URL of the related resource, e.g. an attachment, instead of a work item."""
+
+    comment: NotRequired[str]
 
 
 class PatchOperation(TypedDict):
@@ -93,10 +124,172 @@ class WorkItemResponse(TypedDict):
     url: str
 
 
+class WorkItemsBatchParams(TypedDict, total=False):
+    """Parameters for getting a batch of work items."""
+
+    fields: list[str]
+    """Work item fields to return. Cannot be combined with ``expand``."""
+
+    as_of: datetime.datetime
+    """Return the work items as they were at this point in time."""
+
+    expand: Literal["none", "relations", "fields", "links", "all"]
+    """Which attributes of the work items to expand."""
+
+    error_policy: Literal["fail", "omit"]
+    """Whether missing/inaccessible ids fail the request or are omitted from it."""
+
+
+CHANGED_DATE_FIELD = "System.ChangedDate"
+
+WORK_ITEMS_BATCH_SIZE = 200
+"""Maximum number of ids the workitemsbatch API accepts per request."""
+
+
+class WorkItemsBatch(Endpoint):
+    """[Work items batch endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/get-work-items-batch?view=azure-devops-rest-7.2)."""
+
+    path: ClassVar[str] = "workitemsbatch"
+    api_version: ClassVar[str] = "7.1"
+    item_type: ClassVar[Any] = WorkItemResponse
+
+    def fetch(
+        self,
+        ids: Iterable[int],
+        /,
+        **kwargs: Unpack[WorkItemsBatchParams],
+    ) -> list[WorkItemResponse]:
+        """Get up to 200 work items in one request, in the order of ``ids``."""
+        ids = list(ids)
+        items, _ = self._exchange(
+            HTTPMethod.POST,
+            payload=self._payload(ids, **kwargs),
+            decode=lambda content: self.decoder.decode_items(content, self.item_type),
+        )
+        return self._ordered(ids, self._records(items))
+
+    @staticmethod
+    def _payload(ids: list[int], **kwargs: Unpack[WorkItemsBatchParams]) -> Any:
+        payload: dict[str, Any] = {"ids": ids}
+        if fields := kwargs.get("fields"):
+            payload["fields"] = fields
+        if as_of := kwargs.get("as_of"):
+            payload["asOf"] = as_of.isoformat()
+        if expand := kwargs.get("expand"):
+            payload["$expand"] = expand
+        if error_policy := kwargs.get("error_policy"):
+            payload["errorPolicy"] = error_policy
+        return payload
+
+    @staticmethod
+    def _ordered(ids: list[int], value: Iterable[Any]) -> list[WorkItemResponse]:
+        by_id = {
+            item["id"] if isinstance(item, dict) else item.id: item
+            for item in value
+            if item
+        }
+        return [by_id[item_id] for item_id in ids if item_id in by_id]
+
+
+class BulkOperation(WorkItemParams, total=False):
+    """A create or update operation for ``WorkItems.bulk``. Exactly one of
+    ``item_type`` (create) or ``work_item_id`` (update) must be given.
+    """
+
+    item_type: ItemType
+    work_item_id: int
+
+
+class BulkRequest(TypedDict):
+    """A single request within a $batch request."""
+
+    method: str
+    uri: str
+    headers: dict[str, str]
+    body: list[PatchOperation]
+
+
+class BulkResult(TypedDict):
+    """Outcome of a single operation sent through ``WorkItems.bulk``."""
+
+    index: int
+    """Position of the operation in the input."""
+
+    code: int
+    """HTTP status code of the operation."""
+
+    succeeded: bool
+    body: Any
+    """The work item on success, otherwise the error returned by the server."""
+
+
+WORK_ITEMS_BULK_SIZE = 200
+"""Maximum number of operations the $batch API accepts per request."""
+
+WORK_ITEMS_BULK_MAX_BYTES = 4 * 1024 * 1024
+"""Conservative upper bound on the serialized size of a single $batch request."""
+
+
+class WorkItemsBulk(Endpoint):
+    """[Work items $batch endpoint](https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/update?view=azure-devops-rest-4.1#update-work-items-in-batch)."""
+
+    path: ClassVar[str] = "$batch"
+    api_version: ClassVar[str] = "4.1"
+
+    @functools.cached_property
+    def url(self) -> str:
+        """Endpoint URL. The $batch API is scoped to the organization."""
+        return "/".join([self.base_url, self.organization, "_apis", *self.parts])
+
+    def send(self, requests: list[BulkRequest], /) -> list[tuple[int, Any]]:
+        """Send a batch of requests, returning a status code and body for each."""
+        response: ListResponse = self._call(HTTPMethod.POST, payload=requests)
+        return self._results(response)
+
+    def _send_encoded(self, requests: list[bytes], /) -> list[tuple[int, Any]]:
+        """Send a batch of requests already serialized to JSON."""
+        response: ListResponse = self._call(
+            HTTPMethod.POST,
+            headers={"Content-Type": "application/json"},
+            data=self._batch_body(requests),
+        )
+        return self._results(response)
+
+    @staticmethod
+    def _results(response: ListResponse) -> list[tuple[int, Any]]:
+        return [
+            (result["code"], json.loads(body) if (body := result.get("body")) else None)
+            for result in response["value"]
+        ]
+
+    @staticmethod
+    def _batch_body(requests: list[bytes]) -> bytes:
+        return b"[" + b", ".join(requests) + b"]"
+
+    @staticmethod
+    def _pack(requests: Iterable[bytes]) -> Iterator[list[bytes]]:
+        """Pack serialized requests into batches within the count and size limits."""
+        batch: list[bytes] = []
+        size = 0
+        for request in requests:
+            request_size = len(request)
+            if batch and (
+                len(batch) >= WORK_ITEMS_BULK_SIZE
+                or size + request_size > WORK_ITEMS_BULK_MAX_BYTES
+            ):
+                yield batch
+                batch, size = [], 0
+            batch.append(request)
+            size += request_size
+        if batch:
+            yield batch
+
+
 class WorkItems(Endpoint):
     """Work items endpoint."""
 
     path: ClassVar[str] = "workitems"
+    item_type: ClassVar[Any] = WorkItemResponse
 
     def _create_or_update(
         self,
@@ -104,6 +297,17 @@ class WorkItems(Endpoint):
         *url_parts: Any,
         **kwargs: Unpack[WorkItemParams],
     ) -> WorkItemResponse:
+        return self._call(
+            method,
+            *url_parts,
+            headers={"Content-Type": "application/json-patch+json"},
+            payload=self._patch_operations(**kwargs) or None,
+            params=self._patch_params(**kwargs),
+        )
+
+    def _patch_operations(
+        self, **kwargs: Unpack[WorkItemParams]
+    ) -> list[PatchOperation]:
         ops: list[PatchOperation] = []
 
         if (tags := kwargs.get("tags")) is not None:
@@ -121,10 +325,7 @@ class WorkItems(Endpoint):
                     PatchOperation(
                         op="add",
                         path="/relations/-",
-                        value={
-                            "rel": RELATIONSHIP_MAPPING[relation["relationship_type"]],
-                            "url": "/".join([self.url, str(relation["work_item_id"])]),
-                        },
+                        value=self._relation(relation),
                     )
                     for relation in relations
                 ]
@@ -161,17 +362,25 @@ class WorkItems(Endpoint):
                 op = PatchOperation(op="add", path=f"/fields/System.{k}", value=v)
                 ops.append(op)
 
-        return self._call(
-            method,
-            *url_parts,
-            headers={"Content-Type": "application/json-patch+json"},
-            payload=ops or None,
-            params={
-                "validateOnly": kwargs.get("validate_only", False),
-                "bypassRules": kwargs.get("bypass_rules", False),
-                "suppressNotifications": kwargs.get("suppress_notifications", False),
-            },
-        )
+        return ops
+
+    def _relation(self, relation: Relationship) -> dict[str, Any]:
+        value: dict[str, Any] = {
+            "rel": RELATIONSHIP_MAPPING[relation["relationship_type"]],
+            "url": relation.get("url")
+            or "/".join([self.url, str(relation["work_item_id"])]),
+        }
+        if comment := relation.get("comment"):
+            value["attributes"] = {"comment": comment}
+        return value
+
+    @staticmethod
+    def _patch_params(**kwargs: Unpack[WorkItemParams]) -> dict[str, Any]:
+        return {
+            "validateOnly": kwargs.get("validate_only", False),
+            "bypassRules": kwargs.get("bypass_rules", False),
+            "suppressNotifications": kwargs.get("suppress_notifications", False),
+        }
 
     def create(
         self,
@@ -188,3 +397,316 @@ class WorkItems(Endpoint):
     ) -> WorkItemResponse:
         """Update a work item."""
         return self._create_or_update(HTTPMethod.PATCH, work_item_id, **kwargs)
+
+    def template(
+        self,
+        item_type: ItemType | None = None,
+        /,
+        **kwargs: Unpack[WorkItemParams],
+    ) -> WorkItemTemplate:
+        """Compile a reusable template for creating or updating many work items that
+        share an item type and static values, e.g. area, iteration and common tags.
+        """
+        from .templates import WorkItemTemplate  # noqa: PLC0415
+
+        return WorkItemTemplate(self, item_type, **kwargs)
+
+    @functools.cached_property
+    def attachments(self) -> Attachments:
+        """Attachments endpoint."""
+        return self._sibling(Attachments)
+
+    def attach(
+        self,
+        work_item_id: int,
+        source: str | os.PathLike[str] | BinaryIO,
+        /,
+        *,
+        comment: str | None = None,
+        **kwargs: Unpack[UploadOptions],
+    ) -> WorkItemResponse:
+        """Upload a file or binary stream and attach it to a work item."""
+        reference = self.attachments.upload(source, **kwargs)
+        return self.update(
+            work_item_id, relations=[self._attached_file(reference, comment)]
+        )
+
+    @staticmethod
+    def _attached_file(
+        reference: AttachmentReference,
+        comment: str | None,
+    ) -> Relationship:
+        relation = Relationship(relationship_type="Attached File", url=reference["url"])
+        if comment:
+            relation["comment"] = comment
+        return relation
+
+    def get_many(
+        self,
+        ids: Iterable[int],
+        /,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **kwargs: Unpack[WorkItemsBatchParams],
+    ) -> Iterator[WorkItemResponse]:
+        """Lazily get many work items, in the order of ``ids``.
+
+        Ids are split into chunks of 200 that are fetched concurrently through the
+        workitemsbatch API.
+        """
+        batches = concurrent_map(
+            functools.partial(self._sibling(WorkItemsBatch).fetch, **kwargs),
+            itertools.batched(ids, WORK_ITEMS_BATCH_SIZE),
+            concurrency=concurrency,
+        )
+        for batch in batches:
+            yield from batch
+
+    def bulk(
+        self,
+        operations: Iterable[BulkOperation],
+        /,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[BulkResult]:
+        """Lazily create or update many work items through the $batch API.
+
+        Operations are packed into batches of up to 200 that are sent concurrently.
+        A result is yielded for every operation, in input order, whether it
+        succeeded or not.
+        """
+        return self._bulk(
+            (
+                json.dumps(self._bulk_request(operation)).encode()
+                for operation in operations
+            ),
+            concurrency=concurrency,
+        )
+
+    def _bulk(
+        self,
+        requests: Iterable[bytes],
+        /,
+        *,
+        concurrency: int,
+    ) -> Iterator[BulkResult]:
+        """Send serialized $batch requests, yielding a result for each in order."""
+        bulk_endpoint = self._sibling(WorkItemsBulk)
+        batches = concurrent_map(
+            bulk_endpoint._send_encoded,
+            bulk_endpoint._pack(requests),
+            concurrency=concurrency,
+        )
+        index = itertools.count()
+        for batch in batches:
+            for code, body in batch:
+                yield BulkResult(
+                    index=next(index),
+                    code=code,
+                    succeeded=code < HTTPStatus.BAD_REQUEST,
+                    body=body,
+                )
+
+    def _bulk_request(self, operation: BulkOperation) -> BulkRequest:
+        item_type, work_item_id, params = _bulk_operation_params(operation)
+        if item_type is not None:
+            method, url_part = HTTPMethod.POST, f"${item_type}"
+        elif work_item_id is not None:
+            method, url_part = HTTPMethod.PATCH, str(work_item_id)
+        else:
+            msg = "Bulk operations require either 'item_type' or 'work_item_id'."
+            raise ValueError(msg)
+
+        return BulkRequest(
+            method=str(method),
+            uri=self._bulk_uri(url_part, self._patch_params(**params)),
+            headers={"Content-Type": "application/json-patch+json"},
+            body=self._patch_operations(**params),
+        )
+
+    def _bulk_uri(self, url_part: str, params: dict[str, Any]) -> str:
+        return f"{self._bulk_path}/{url_part}?{urlencode(self._request_params(params))}"
+
+    @functools.cached_property
+    def _bulk_path(self) -> str:
+        """Organization-relative path of the endpoint within a $batch request."""
+        return "/".join(["", self.project, "_apis", *self.parts])
+
+    def graph(
+        self,
+        root_ids: Iterable[int],
+        /,
+        *,
+        link_types: Iterable[RelationshipName] = ("Child",),
+        depth: int | None = None,
+        fields: list[str] | None = None,
+        hydrate: bool = True,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> WorkItemGraph:
+        """Load the graph of work items linked from ``root_ids``, level by level.
+
+        The links of each level are fetched with one-hop link queries and its work
+        items through the workitemsbatch API, in concurrent batches of 200. Every
+        work item is visited once, however many links lead to it.
+
+        Args:
+            root_ids: Work items to start from.
+            link_types: Links to follow, e.g. ``Child`` for a hierarchy or
+                ``Successor`` for dependencies.
+            depth: Maximum number of links between a root and a work item. Unlimited
+                by default.
+            fields: Fields of the hydrated work items. Defaults to all fields.
+            hydrate: Fetch the work items, not only their links.
+            concurrency: Number of requests in flight at once.
+        """
+        builder = self._graph_builder(root_ids, link_types)
+        endpoints = self._graph_endpoints()
+        level = 0
+        while builder.frontier:
+            calls = self._graph_calls(
+                builder,
+                endpoints,
+                expand=depth is None or level < depth,
+                hydrate=hydrate,
+                fields=fields,
+            )
+            for (_, record), result in zip(
+                calls,
+                concurrent_map(lambda call: call[0](), calls, concurrency=concurrency),
+                strict=True,
+            ):
+                record(result)
+            builder.advance()
+            level += 1
+        return builder.build()
+
+    def _graph_builder(
+        self,
+        root_ids: Iterable[int],
+        link_types: Iterable[RelationshipName],
+    ) -> WorkItemGraphBuilder:
+        from .graph import WorkItemGraphBuilder  # noqa: PLC0415
+
+        return WorkItemGraphBuilder(root_ids, link_types)
+
+    def _graph_endpoints(self) -> tuple[Wiql, WorkItemsBatch]:
+        from .wiql import Wiql  # noqa: PLC0415
+
+        return self._sibling(Wiql), self._sibling(WorkItemsBatch)
+
+    @staticmethod
+    def _graph_calls(
+        builder: WorkItemGraphBuilder,
+        endpoints: tuple[Wiql, WorkItemsBatch],
+        *,
+        expand: bool,
+        hydrate: bool,
+        fields: list[str] | None,
+    ) -> list[tuple[Callable[[], Any], Callable[[Any], None]]]:
+        """Requests for the current level of a traversal, each paired with the
+        builder method recording its result.
+        """
+        from .graph import WORK_ITEM_LINKS_BATCH_SIZE  # noqa: PLC0415
+
+        wiql, batch_endpoint = endpoints
+        calls: list[tuple[Callable[[], Any], Callable[[Any], None]]] = []
+        if expand:
+            calls.extend(
+                (
+                    functools.partial(wiql.links, batch, builder.link_types),
+                    builder.add_links,
+                )
+                for batch in itertools.batched(
+                    builder.frontier, WORK_ITEM_LINKS_BATCH_SIZE
+                )
+            )
+        if hydrate:
+            params = WorkItemsBatchParams(error_policy="omit")
+            if fields:
+                params["fields"] = fields
+            calls.extend(
+                (
+                    functools.partial(batch_endpoint.fetch, batch, **params),
+                    builder.add_items,
+                )
+                for batch in itertools.batched(builder.frontier, WORK_ITEMS_BATCH_SIZE)
+            )
+        return calls
+
+    def sync(
+        self,
+        store: SnapshotStore,
+        /,
+        *,
+        fields: list[str] | None = None,
+        where: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> SyncResult:
+        """Incrementally mirror the project's work items into a local snapshot.
+
+        Only work items changed since the snapshot's watermark are queried and
+        fetched, in concurrent batches. Each batch is upserted as it arrives, and the
+        new watermark once every batch is written. Work items deleted since the query
+        ran are skipped. The first run loads every work item.
+
+        The new watermark is the time the query ran at (its ``asOf``), not the latest
+        change fetched, so changes made while the query's pages are being fetched
+        are picked up by the next run.
+
+        Args:
+            store: Snapshot to update.
+            fields: Fields to fetch. Defaults to all fields.
+            where: Additional wiql condition restricting the synced work items.
+            concurrency: Number of batches fetched at once.
+        """
+        wiql, work_items = self._sync_endpoints()
+        started = _now()
+        pages = wiql._pages(
+            query=self._sync_query(store.watermark, where), time_precision=True
+        )
+        first_page = next(pages)
+        with store.writer(first_page.get("asOf") or started) as writer:
+            items = work_items.get_many(
+                wiql._ids(itertools.chain([first_page], pages)),
+                concurrency=concurrency,
+                **self._sync_params(fields),
+            )
+            for batch in itertools.batched(items, WORK_ITEMS_BATCH_SIZE):
+                writer.add(batch)
+        return writer.result
+
+    def _sync_endpoints(self) -> tuple[Wiql, WorkItems]:
+        """Endpoints for syncing, returning plain dicts whatever the configuration."""
+        from .wiql import Wiql  # noqa: PLC0415
+
+        return self._sibling(Wiql), self._untyped()
+
+    @staticmethod
+    def _sync_query(watermark: str | None, where: str | None) -> str:
+        conditions = ["[System.TeamProject] = @project"]
+        if watermark:
+            conditions.append(f"[{CHANGED_DATE_FIELD}] >= '{watermark}'")
+        if where:
+            conditions.append(f"({where})")
+        return f"SELECT [System.Id] FROM WorkItems WHERE {' AND '.join(conditions)}"  # noqa: S608
+
+    @staticmethod
+    def _sync_params(fields: list[str] | None) -> WorkItemsBatchParams:
+        # Work items deleted since the query ran would fail their whole batch
+        params = WorkItemsBatchParams(error_policy="omit")
+        if fields:
+            params["fields"] = list({*fields, CHANGED_DATE_FIELD})
+        return params
+
+
+def _bulk_operation_params(
+    operation: BulkOperation,
+) -> tuple[ItemType | None, int | None, WorkItemParams]:
+    """Split the target of a bulk operation from its work item parameters."""
+    params = operation.copy()
+    return params.pop("item_type", None), params.pop("work_item_id", None), params
+
+
+def _now() -> str:
+    """Current time, formatted as Azure DevOps formats dates."""
+    return datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
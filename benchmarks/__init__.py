@@ -0,0 +1 @@
+"""Offline benchmarks against a local Azure DevOps stub server."""
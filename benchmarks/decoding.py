@@ -0,0 +1,98 @@
+"""Benchmark response decoders on a large synthetic build definitions page.
+
+Usage: ``python -m benchmarks.decoding [--items N]``
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from ado.build.definitions import DefinitionInfo
+from ado.decoding import Decoder, MsgspecDecoder, OrjsonDecoder
+
+
+def definition(definition_id: int) -> dict[str, Any]:
+    """A build definition as returned with ``includeAllProperties``."""
+    user = {
+        "displayName": "Build Service",
+        "id": "00000000-0000-0000-0000-000000000001",
+        "uniqueName": "build@example.com",
+        "descriptor": "svc.descriptor",
+        "imageUrl": "https://example.com/image",
+        "url": "https://example.com/user",
+    }
+    project = {
+        "description": "Project",
+        "id": "00000000-0000-0000-0000-000000000002",
+        "lastUpdateTime": "2024-01-01T00:00:00Z",
+        "name": "project",
+        "revision": 1,
+        "state": "wellFormed",
+        "url": "https://example.com/project",
+        "visibility": "private",
+    }
+    return {
+        "authoredBy": user,
+        "createdDate": "2024-01-01T00:00:00Z",
+        "drafts": [],
+        "id": definition_id,
+        "name": f"definition-{definition_id}",
+        "path": "\\",
+        "project": project,
+        "quality": "definition",
+        "queue": {
+            "id": 1,
+            "name": "Azure Pipelines",
+            "pool": {"id": 1, "isHosted": True, "name": "Azure Pipelines"},
+            "url": "https://example.com/queue",
+        },
+        "revision": 3,
+        "type": "build",
+        "uri": f"vstfs:///Build/Definition/{definition_id}",
+        "url": f"https://example.com/definitions/{definition_id}",
+    }
+
+
+def measure(decoder: Decoder, content: bytes) -> tuple[float, float]:
+    """Return seconds taken and peak traced MB to decode and hold every item."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = list(decoder.decode_items(content, DefinitionInfo))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Decode the same page with every available decoder and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20_000)
+    args = parser.parse_args()
+
+    content = json.dumps(
+        {"count": args.items, "value": [definition(i) for i in range(args.items)]}
+    ).encode()
+    decoders: dict[str, Callable[[], Decoder]] = {
+        "json": Decoder,
+        "orjson": OrjsonDecoder,
+        "msgspec": MsgspecDecoder,
+        "msgspec (typed)": lambda: MsgspecDecoder(typed=True),
+    }
+    print(f"payload: {len(content) / 2**20:.1f} MB")  # noqa: T201
+    print(f"{'decoder':<18}{'seconds':>10}{'peak MB':>10}")  # noqa: T201
+    for name, decoder_type in decoders.items():
+        try:
+            decoder = decoder_type()
+        except ImportError:
+            continue
+        elapsed, peak = measure(decoder, content)
+        print(f"{name:<18}{elapsed:>10.3f}{peak:>10.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
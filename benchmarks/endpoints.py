@@ -0,0 +1,31 @@
+"""Micro-benchmark of endpoint attribute chains.
+
+Usage: ``python -m benchmarks.endpoints [--number N]``
+"""
+
+import argparse
+import timeit
+from types import SimpleNamespace
+
+from ado import Client
+
+
+def main() -> None:
+    """Compare ``client.wit.work_items`` with a plain attribute chain."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    client = Client(organization="benchmark", project="benchmark")
+    plain = SimpleNamespace(wit=SimpleNamespace(work_items=object()))
+    for name, stmt in {
+        "plain attribute chain": lambda: plain.wit.work_items,
+        "client.wit.work_items": lambda: client.wit.work_items,
+        "client.wit.work_items.url": lambda: client.wit.work_items.url,
+    }.items():
+        seconds = min(timeit.repeat(stmt, number=args.number, repeat=5))
+        print(f"{name:<28}{seconds / args.number * 1e9:>10.1f} ns")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Micro-benchmark of JSON-Patch generation for work items, serialized to bytes.
+
+Usage: ``python -m benchmarks.patches [--number N]``
+"""
+
+import argparse
+import json
+import timeit
+
+from ado import Client
+from ado.work_item_tracking.work_items import (
+    BulkOperation,
+    Relationship,
+    WorkItemParams,
+)
+
+
+STATIC = WorkItemParams(
+    area="Project\\Team",
+    iteration="Project\\Sprint 1",
+    tags=["imported", "migration"],
+    relations=[Relationship(work_item_id=1, relationship_type="Parent")],
+)
+"""Values shared by every work item."""
+
+ITEM = WorkItemParams(
+    title="Imported work item", description="Imported from the tracker."
+)
+"""Values specific to each work item."""
+
+
+def main() -> None:
+    """Compare building patch operations per item with a compiled template."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    work_items = Client(organization="benchmark", project="benchmark").wit.work_items
+    template = work_items.template("Task", **STATIC)
+    operation = BulkOperation(item_type="Task", **STATIC, **ITEM)
+    template_operation = BulkOperation(**ITEM)
+    for name, stmt in {
+        "single: patch operations": lambda: json.dumps(
+            work_items._patch_operations(**(STATIC | ITEM))
+        ).encode(),
+        "single: template": lambda: template.patch(**ITEM),
+        "bulk: patch operations": lambda: json.dumps(
+            work_items._bulk_request(operation)
+        ).encode(),
+        "bulk: template": lambda: template._bulk_request(template_operation),
+    }.items():
+        seconds = min(timeit.repeat(stmt, number=args.number, repeat=5))
+        print(f"{name:<28}{args.number / seconds:>12,.0f} ops/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark memory held by build definitions as dicts versus records.
+
+Usage: ``python -m benchmarks.records [--items N]``
+"""
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from ado.build.definitions import DefinitionInfo
+from ado.records import RecordFactory
+
+from .decoding import definition
+
+
+def retained_mb(load: Callable[[], Any]) -> float:
+    """Traced MB still allocated once ``load`` has returned."""
+    tracemalloc.start()
+    items = load()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current / 2**20
+
+
+def main() -> None:
+    """Print the memory retained by each representation."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    content = json.dumps([definition(i) for i in range(args.items)]).encode()
+    representations: dict[str, Callable[[], Any]] = {
+        "dicts": lambda: json.loads(content),
+        "records": lambda: list(
+            RecordFactory(intern=False).build_all(DefinitionInfo, json.loads(content))
+        ),
+        "records (interned)": lambda: list(
+            RecordFactory().build_all(DefinitionInfo, json.loads(content))
+        ),
+    }
+    print(f"{'representation':<22}{'retained MB':>12}")  # noqa: T201
+    for name, load in representations.items():
+        print(f"{name:<22}{retained_mb(load):>12.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
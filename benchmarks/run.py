@@ -0,0 +1,119 @@
+"""Run the SDK benchmarks against the local stub server.
+
+Usage: ``python -m benchmarks.run [--latency SECONDS] [--items N] [--iterations N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, TypedDict
+
+from ado import Client
+from ado.rate_limit import RateLimiter
+
+from .stub_server import StubServer
+
+
+class BenchmarkResult(TypedDict):
+    """Measurements for one benchmark."""
+
+    name: str
+    requests_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_mb: float
+
+
+BENCHMARKS: dict[str, Callable[[Client], Any]] = {
+    "definitions.list_all": lambda client: client.build.definitions.list_all(),
+    "work_items.create": lambda client: client.wit.work_items.create(
+        "Task",
+        title="Benchmark",
+        tags=["benchmark"],
+    ),
+    "wiql.execute": lambda client: client.wit.wiql.execute(
+        query="SELECT [System.Id] FROM WorkItems",
+    ),
+    "work_items.graph": lambda client: client.wit.work_items.graph([1]),
+}
+"""Benchmarked calls, by name."""
+
+
+def measure(
+    name: str,
+    fn: Callable[[Client], Any],
+    client: Client,
+    server: StubServer,
+    iterations: int,
+) -> BenchmarkResult:
+    """Call ``fn`` repeatedly, measuring throughput, latency and peak memory."""
+    fn(client)  # warm up connections
+    latencies = []
+    requests_before = server.requests
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        fn(client)
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return BenchmarkResult(
+        name=name,
+        requests_per_second=(server.requests - requests_before) / elapsed,
+        p50_ms=quantiles[49] * 1000,
+        p99_ms=quantiles[98] * 1000,
+        peak_memory_mb=peak / 2**20,
+    )
+
+
+def main() -> None:
+    """Run every benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("-k", dest="filter", default="")
+    args = parser.parse_args()
+
+    os.environ.setdefault("AZURE_DEVOPS_PAT", "benchmark")
+    with StubServer(
+        latency=args.latency,
+        items=args.items,
+        page_size=args.page_size,
+        throttle_every=args.throttle_every,
+    ) as server:
+        client = Client(
+            organization="benchmark",
+            project="benchmark",
+            base_url=server.base_url,
+            rate_limiter=RateLimiter(max_rate=10_000) if args.throttle_every else None,
+        )
+        print(  # noqa: T201
+            f"{'benchmark':<24}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}"
+        )
+        for name, fn in BENCHMARKS.items():
+            if args.filter not in name:
+                continue
+            result = measure(name, fn, client, server, args.iterations)
+            print(  # noqa: T201
+                f"{result['name']:<24}"
+                f"{result['requests_per_second']:>10.1f}"
+                f"{result['p50_ms']:>10.2f}"
+                f"{result['p99_ms']:>10.2f}"
+                f"{result['peak_memory_mb']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Startup benchmark: import time of the SDK, measured with ``python -X importtime``.
+
+Usage: ``python -m benchmarks.startup [--repeat N]``
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+SCENARIOS = {
+    "import ado": "import ado",
+    "Client().wit.work_items": (
+        "import ado; ado.Client(organization='o', project='p').wit.work_items"
+    ),
+    "with the HTTP stack and dotenv": "import ado, requests, dotenv",
+    "every api package (eager)": (
+        "import ado, ado.build, ado.distributed_task, ado.git, ado.pipelines, "
+        "ado.work_item_tracking, requests, dotenv"
+    ),
+}
+
+
+def import_time(code: str) -> int:
+    """Microseconds spent importing modules while running ``code``, excluding the
+    interpreter's own startup imports.
+    """
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    lines = [line.split("|") for line in stderr.splitlines()[1:]]
+    # Interpreter startup ends with importing ``site``
+    startup = next(i for i, (*_, name) in enumerate(lines) if name.strip() == "site")
+    return sum(
+        int(cumulative)
+        for _, cumulative, name in lines[startup + 1 :]
+        # Nested imports are included in the cumulative time of their importer
+        if not name.startswith("  ")
+    )
+
+
+def main() -> None:
+    """Report the best import time of each scenario over several runs."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        microseconds = min(import_time(code) for _ in range(args.repeat))
+        print(f"{name:<36}{microseconds / 1000:>8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
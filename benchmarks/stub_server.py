@@ -0,0 +1,515 @@
+"""Local stub of the Azure DevOps REST routes used by the SDK."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+import threading
+import time
+import zlib
+from datetime import UTC, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar, TypedDict, Unpack
+from urllib.parse import parse_qs, urlsplit
+
+
+class StubConfiguration(TypedDict, total=False):
+    """Stub server behaviour."""
+
+    latency: float
+    """Seconds to wait before answering each request."""
+
+    items: int
+    """Number of entities behind every list route and wiql query."""
+
+    page_size: int
+    """Entities per page for list routes, when ``$top`` is not given."""
+
+    throttle_every: int
+    """Answer every n-th request with a 429 and ``Retry-After``. 0 disables it."""
+
+    retry_after: float
+    """Seconds sent in ``Retry-After`` for injected 429s."""
+
+    content_size: int
+    """Bytes served by download routes (build logs and artifacts, git items and
+    blobs, attachments).
+    """
+
+    ignore_range: bool
+    """Answer range requests of download routes with the whole content, like servers
+    without range support.
+    """
+
+    revision: int
+    """Revision of every listed entity. Change it to simulate edits."""
+
+    changed_date: str
+    """``System.ChangedDate`` of every work item. Change it to simulate edits: wiql
+    queries for changes since a later date match no work items.
+    """
+
+
+class RecordedRequest(TypedDict):
+    """A request received by the stub."""
+
+    method: str
+    path: str
+    """Path below ``_apis``."""
+
+    query: dict[str, str]
+    headers: dict[str, str]
+    payload: Any
+    """Decoded JSON body, if any."""
+
+
+_ID_FILTER = re.compile(r"\[System\.Id\]\s*>\s*(\d+)")
+_CHANGED_SINCE = re.compile(r"\[System\.ChangedDate\]\s*>=\s*'([^']+)'")
+_LINK_SOURCES = re.compile(r"\[Source\]\.\[System\.Id\] IN \(([\d, ]*)\)")
+_LINK_TYPE = re.compile(r"\[System\.Links\.LinkType\] IN \('([^']+)'")
+_LINK_FANOUT = 4
+_INACTIVE_EVERY = 50
+_REFS_PAGE_SIZE = 100
+_RANGE = re.compile(r"bytes=(\d+)-(\d*)")
+_PATTERN = bytes(range(251))
+_CHUNK_SIZE = 1 << 20
+
+
+def content(start: int, stop: int) -> bytes:
+    """Bytes ``start`` to ``stop`` of the content served by download routes."""
+    offset = start % len(_PATTERN)
+    repeats = (offset + stop - start) // len(_PATTERN) + 1
+    return (_PATTERN * repeats)[offset : offset + stop - start]
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering Azure DevOps routes with synthetic data."""
+
+    daemon_threads = True
+
+    def __init__(self, **kwargs: Unpack[StubConfiguration]) -> None:
+        """Bind to a free localhost port."""
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = kwargs.get("latency", 0)
+        self.items = kwargs.get("items", 1000)
+        self.page_size = kwargs.get("page_size", 100)
+        self.throttle_every = kwargs.get("throttle_every", 0)
+        self.retry_after = kwargs.get("retry_after", 0)
+        self.content_size = kwargs.get("content_size", 1 << 20)
+        self.ignore_range = kwargs.get("ignore_range", False)
+        self.revision = kwargs.get("revision", 1)
+        self.changed_date = kwargs.get("changed_date", "2024-01-01T00:00:00Z")
+        # Revisions of single entities, overriding ``revision`` to simulate one edit
+        self.revisions: dict[int, int] = {}
+        self.requests = 0
+        self.history: list[RecordedRequest] = []
+        self.uploads: dict[str, dict[str, int]] = {}
+        self._faults: dict[tuple[str, str], tuple[HTTPStatus, int]] = {}
+        self._ids = itertools.count(self.items + 1)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to configure the client with."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def __enter__(self) -> StubServer:
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop serving."""
+        self.shutdown()
+        self.server_close()
+
+    def count_request(self, request: RecordedRequest) -> bool:
+        """Count a request, returning whether it should be throttled."""
+        with self._lock:
+            self.requests += 1
+            self.history.append(request)
+            return (
+                bool(self.throttle_every) and self.requests % self.throttle_every == 0
+            )
+
+    def fail(
+        self, method: str, path: str, status: HTTPStatus, *, after: int = 0
+    ) -> None:
+        """Answer requests to ``path``, or below it, with ``status`` once ``after``
+        of them have succeeded.
+        """
+        with self._lock:
+            self._faults[method, path] = (status, after)
+
+    def fault(self, request: RecordedRequest) -> HTTPStatus | None:
+        """Status to fail a request with, if any."""
+        with self._lock:
+            for (method, path), (status, after) in self._faults.items():
+                if method == request["method"] and (
+                    request["path"] == path or request["path"].startswith(f"{path}/")
+                ):
+                    if after:
+                        self._faults[method, path] = (status, after - 1)
+                        return None
+                    return status
+        return None
+
+    def received(self, method: str, path: str) -> list[RecordedRequest]:
+        """Requests received for a route, in order."""
+        with self._lock:
+            return [
+                request
+                for request in self.history
+                if request["method"] == method and request["path"] == path
+            ]
+
+    def count_upload(
+        self, attachment_id: str, content_range: str, chunk: bytes
+    ) -> None:
+        """Record an uploaded chunk, by its ``Content-Range``, with a checksum."""
+        with self._lock:
+            self.uploads.setdefault(attachment_id, {})[content_range] = zlib.crc32(
+                chunk
+            )
+
+    def next_id(self) -> int:
+        """Id for a newly created work item."""
+        with self._lock:
+            return next(self._ids)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StubServer
+    query: dict[str, str]
+    body: bytes
+    """Raw request body."""
+
+    payload: Any
+    """Decoded JSON request body, if any."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    routes: ClassVar[dict[tuple[str, str], str]] = {
+        ("GET", "build/builds"): "_content",
+        ("GET", "build/definitions"): "_list",
+        ("GET", "git/repositories"): "_list",
+        ("GET", "distributedtask/variablegroups"): "_list",
+        ("GET", "pipelines/pipelinePermissions/variablegroup"): "_permissions",
+        ("PATCH", "pipelines/pipelinePermissions/variablegroup"): "_permissions",
+        ("PATCH", "pipelines/pipelinePermissions"): "_echo",
+        ("GET", "wit/attachments"): "_content",
+        ("POST", "wit/attachments"): "_attachment",
+        ("PUT", "wit/attachments"): "_attachment",
+        ("POST", "wit/wiql"): "_wiql",
+        ("POST", "wit/workitems"): "_work_item",
+        ("PATCH", "wit/workitems"): "_work_item",
+        ("GET", "wit/workitems"): "_work_item",
+        ("POST", "wit/workitemsbatch"): "_work_items_batch",
+        ("POST", "wit/$batch"): "_bulk",
+    }
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: ARG002
+        return
+
+    def do_GET(self) -> None:
+        self._dispatch()
+
+    def do_POST(self) -> None:
+        self._dispatch()
+
+    def do_PATCH(self) -> None:
+        self._dispatch()
+
+    def do_PUT(self) -> None:
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        url = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        self.payload = None
+        if self.body and "json" in self.headers.get("Content-Type", ""):
+            self.payload = json.loads(self.body)
+
+        segments = [segment for segment in url.path.split("/") if segment]
+        route = segments[segments.index("_apis") + 1 :]
+        request = RecordedRequest(
+            method=self.command,
+            path="/".join(route),
+            query=self.query,
+            headers=dict(self.headers.items()),
+            payload=self.payload,
+        )
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.server.count_request(request):
+            self._respond(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"message": "Request was blocked due to exceeding usage."},
+                {"Retry-After": str(self.server.retry_after)},
+            )
+            return
+        if status := self.server.fault(request):
+            self._respond(status, {"message": "Injected failure."})
+            return
+
+        for size in range(len(route), 0, -1):
+            if handler := self.routes.get((self.command, "/".join(route[:size]))):
+                getattr(self, handler)(route[size:])
+                return
+        self._respond(HTTPStatus.NOT_FOUND, {"message": f"No route for {url.path}"})
+
+    def _respond(
+        self,
+        status: HTTPStatus,
+        body: Any,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        content = json.dumps(body).encode()
+        if self.command == "GET" and status == HTTPStatus.OK:
+            etag = f'"{zlib.crc32(content):08x}"'
+            headers = (headers or {}) | {"ETag": etag}
+            if self.headers.get("If-None-Match") == etag:
+                status, content = HTTPStatus.NOT_MODIFIED, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _list(self, route: list[str]) -> None:
+        if len(route) == 1:
+            entity = self._entity(int(route[0]))
+            if "revision" in self.query:
+                entity["revision"] = int(self.query["revision"])
+            self._respond(HTTPStatus.OK, entity)
+            return
+        if route[1:] in (["refs"], ["commits"]):
+            getattr(self, f"_{route[1]}")(int(route[0]))
+            return
+        if route:
+            # Routes below an entity, e.g. git/repositories/{id}/items
+            self._content(route)
+            return
+        start = int(self.query.get("continuationToken", 0))
+        stop = min(
+            start + int(self.query.get("$top", self.server.page_size)),
+            self.server.items,
+        )
+        value = [self._entity(item_id) for item_id in range(start + 1, stop + 1)]
+        headers = (
+            {"x-ms-continuationtoken": str(stop)} if stop < self.server.items else {}
+        )
+        self._respond(HTTPStatus.OK, {"count": len(value), "value": value}, headers)
+
+    def _content(self, _: list[str]) -> None:
+        size = self.server.content_size
+        start, stop, status = 0, size, HTTPStatus.OK
+        headers = {"Content-Type": "application/octet-stream"}
+        match = _RANGE.fullmatch(self.headers.get("Range", ""))
+        if match and not self.server.ignore_range:
+            start = int(match.group(1))
+            stop = min(int(match.group(2) or size - 1) + 1, size)
+            if start >= size:
+                self._respond(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, {})
+                return
+            status = HTTPStatus.PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(stop - start))
+        self.end_headers()
+        for chunk_start in range(start, stop, _CHUNK_SIZE):
+            self.wfile.write(content(chunk_start, min(chunk_start + _CHUNK_SIZE, stop)))
+
+    def _attachment(self, route: list[str]) -> None:
+        attachment_id = route[0] if route else str(self.server.next_id())
+        if self.body:
+            self.server.count_upload(
+                attachment_id, self.headers["Content-Range"], self.body
+            )
+        self._respond(
+            HTTPStatus.CREATED,
+            {
+                "id": attachment_id,
+                "url": f"{self.server.base_url}_apis/wit/attachments/{attachment_id}",
+            },
+        )
+
+    def _entity(self, item_id: int) -> dict[str, Any]:
+        project = {"id": "00000000-0000-0000-0000-000000000000", "name": "project"}
+        return {
+            "id": item_id,
+            "name": f"entity-{item_id}",
+            "revision": self.server.revisions.get(item_id, self.server.revision),
+            "project": project,
+            "url": f"{self.server.base_url}{item_id}",
+            "isDisabled": item_id % _INACTIVE_EVERY == 0,
+            "isInMaintenance": item_id % _INACTIVE_EVERY == 1,
+            "defaultBranch": "refs/heads/main",
+            "size": item_id * 1024,
+        }
+
+    def _refs(self, repository_id: int) -> None:
+        """Paged refs: repository ``n`` has ``n`` branches and ``n % 5`` tags."""
+        names = [f"refs/heads/branch-{i}" for i in range(repository_id)] + [
+            f"refs/tags/v{i}" for i in range(repository_id % 5)
+        ]
+        start = int(self.query.get("continuationToken", 0))
+        stop = min(start + int(self.query.get("$top", _REFS_PAGE_SIZE)), len(names))
+        value = [
+            {"name": name, "objectId": f"{repository_id:040x}", "url": name}
+            for name in names[start:stop]
+        ]
+        headers = {"x-ms-continuationtoken": str(stop)} if stop < len(names) else {}
+        self._respond(HTTPStatus.OK, {"count": len(value), "value": value}, headers)
+
+    def _commits(self, repository_id: int) -> None:
+        user = {
+            "name": "stub",
+            "email": "stub@example.com",
+            "date": "2024-01-01T00:00:00Z",
+        }
+        commit = {
+            "commitId": f"{repository_id:040x}",
+            "author": user,
+            "committer": user,
+            "comment": "Commit",
+            "url": f"{self.server.base_url}{repository_id}",
+        }
+        self._respond(HTTPStatus.OK, {"count": 1, "value": [commit]})
+
+    def _permissions(self, route: list[str]) -> None:
+        self._respond(
+            HTTPStatus.OK,
+            {
+                "pipelines": [{"id": 1, "authorized": True}],
+                "resource": {"id": route[0] if route else 0, "type": "variablegroup"},
+            },
+        )
+
+    def _echo(self, _: list[str]) -> None:
+        self._respond(
+            HTTPStatus.OK, {"count": len(self.payload), "value": self.payload}
+        )
+
+    def _wiql(self, _: list[str]) -> None:
+        if match := _LINK_SOURCES.search(self.payload["query"]):
+            self._links([int(item_id) for item_id in match.group(1).split(",")])
+            return
+        match = _ID_FILTER.search(self.payload["query"])
+        start = int(match.group(1)) if match else 0
+        top = int(self.query.get("$top", self.server.items))
+        stop = min(start + top, self.server.items)
+        if (since := _CHANGED_SINCE.search(self.payload["query"])) and (
+            datetime.fromisoformat(self.server.changed_date)
+            < datetime.fromisoformat(since.group(1))
+        ):
+            stop = start  # nothing changed since
+        self._respond(
+            HTTPStatus.OK,
+            {
+                "queryType": "flat",
+                "asOf": datetime.now(UTC).isoformat(),
+                "workItems": [
+                    {"id": item_id, "url": f"{self.server.base_url}{item_id}"}
+                    for item_id in range(start + 1, stop + 1)
+                ],
+            },
+        )
+
+    def _links(self, source_ids: list[int]) -> None:
+        """One-hop links of the first queried type, forming a tree in which work item
+        ``n`` links to ``4n - 2`` to ``4n + 1``.
+        """
+        match = _LINK_TYPE.search(self.payload["query"])
+        link_type = match.group(1) if match else "System.LinkTypes.Hierarchy-Forward"
+        relations: list[dict[str, Any]] = []
+        for source_id in source_ids:
+            source = {"id": source_id, "url": f"{self.server.base_url}{source_id}"}
+            relations.append({"rel": None, "source": None, "target": source})
+            first = _LINK_FANOUT * (source_id - 1) + 2
+            relations.extend(
+                {
+                    "rel": link_type,
+                    "source": source,
+                    "target": {
+                        "id": target_id,
+                        "url": f"{self.server.base_url}{target_id}",
+                    },
+                }
+                for target_id in range(
+                    first, min(first + _LINK_FANOUT, self.server.items + 1)
+                )
+            )
+        self._respond(
+            HTTPStatus.OK,
+            {"queryType": "oneHop", "workItemRelations": relations},
+        )
+
+    def _work_item(self, route: list[str]) -> None:
+        item_id = (
+            self.server.next_id()
+            if route and route[0].startswith("$")
+            else int(route[0])
+        )
+        self._respond(
+            HTTPStatus.OK, self._work_item_response(item_id, self.payload or [])
+        )
+
+    def _work_item_response(
+        self, item_id: int, ops: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        return {
+            "id": item_id,
+            "rev": 1,
+            "fields": {
+                "System.ChangedDate": self.server.changed_date,
+                **{
+                    op["path"].removeprefix("/fields/"): op["value"]
+                    for op in ops
+                    if op["path"].startswith("/fields/")
+                },
+            },
+            "url": f"{self.server.base_url}{item_id}",
+        }
+
+    def _work_items_batch(self, _: list[str]) -> None:
+        # Ids past ``items`` are missing: null if omitted by the error policy, and
+        # otherwise failing the whole batch
+        omit = self.payload.get("errorPolicy") == "omit"
+        if not omit and max(self.payload["ids"]) > self.server.items:
+            message = "TF401232: Work item does not exist."
+            self._respond(HTTPStatus.NOT_FOUND, {"message": message})
+            return
+        value = [
+            None
+            if omit and item_id > self.server.items
+            else self._work_item_response(item_id, [])
+            for item_id in self.payload["ids"]
+        ]
+        self._respond(HTTPStatus.OK, {"count": len(value), "value": value})
+
+    def _bulk(self, _: list[str]) -> None:
+        value = [
+            {
+                "code": HTTPStatus.OK,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps(
+                    self._work_item_response(self.server.next_id(), request["body"])
+                ),
+            }
+            for request in self.payload
+        ]
+        self._respond(HTTPStatus.OK, {"count": len(value), "value": value})
@@ -0,0 +1,99 @@
+"""Compare HTTP transports head to head on the same workload.
+
+The workload runs against the local stub server with each live transport, while one
+run is recorded to a cassette that is then replayed offline, with and without the
+recorded latencies. The stub only speaks HTTP/1.1, so ``httpx`` multiplexes over
+HTTP/2 only against dev.azure.com. To replay production traffic shapes, record a
+cassette there with ``RecordingTransport`` and pass it with ``--cassette``.
+
+Usage: ``python -m benchmarks.transports [--latency SECONDS] [--items N]
+[--iterations N] [--cassette PATH]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from ado import Client
+from ado.core import ClientConfiguration
+from ado.transport import (
+    HttpxTransport,
+    RecordingTransport,
+    ReplayTransport,
+    RequestsTransport,
+    Transport,
+)
+
+from .stub_server import StubServer
+
+
+def workload(client: Client) -> None:
+    """List every build definition, then export them concurrently."""
+    client.build.definitions.list_all()
+    client.build.definitions.export(io.BytesIO(), concurrency=8)
+
+
+def measure(
+    name: str,
+    iterations: int,
+    configuration: ClientConfiguration,
+) -> None:
+    """Run the workload ``iterations`` times with a client configured with
+    ``configuration``, typically a transport, and print timings.
+    """
+    client = Client(**configuration)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        workload(client)
+    elapsed = time.perf_counter() - start
+    client.close()
+    print(f"{name:<24}{elapsed / iterations * 1000:>12.1f}")  # noqa: T201
+
+
+def main() -> None:
+    """Run the workload with every transport and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--cassette", type=Path, help="replay instead of the stub")
+    args = parser.parse_args()
+
+    os.environ.setdefault("AZURE_DEVOPS_PAT", "benchmark")
+    project = ClientConfiguration(organization="benchmark", project="benchmark")
+    print(f"{'transport':<24}{'ms/run':>12}")  # noqa: T201
+    with tempfile.TemporaryDirectory() as directory:
+        cassette = args.cassette or Path(directory, "cassette.ndjson")
+        if args.cassette is None:
+            live: dict[str, Callable[[], Transport]] = {
+                "requests": RequestsTransport,
+                "httpx": HttpxTransport,
+                "requests (recording)": lambda: RecordingTransport(
+                    RequestsTransport(),
+                    cassette,
+                ),
+            }
+            with StubServer(latency=args.latency, items=args.items) as server:
+                for name, transport in live.items():
+                    measure(
+                        name,
+                        args.iterations,
+                        project
+                        | {"transport": transport(), "base_url": server.base_url},
+                    )
+        for name, speed in {"replay": 1.0, "replay (no latency)": 0.0}.items():
+            measure(
+                name,
+                args.iterations,
+                project | {"transport": ReplayTransport(cassette, speed=speed)},
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests of the Azure DevOps SDK, run against a local stub server."""
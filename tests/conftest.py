@@ -0,0 +1,54 @@
+"""Shared fixtures: a stub Azure DevOps server and clients configured for it."""
+
+from collections.abc import Callable, Iterator
+from typing import Unpack
+
+import pytest
+
+from ado import Client
+from ado.core import ClientConfiguration
+from benchmarks.stub_server import StubServer
+
+
+ClientFactory = Callable[..., Client]
+"""Creates a client for the stub server, with extra configuration items."""
+
+
+@pytest.fixture(autouse=True)
+def _credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "test")
+
+
+@pytest.fixture
+def server() -> Iterator[StubServer]:
+    """Stub server with 250 entities per list route, in pages of 100."""
+    with StubServer(items=250, page_size=100) as server:
+        yield server
+
+
+@pytest.fixture
+def make_client(server: StubServer) -> Iterator[ClientFactory]:
+    """Factory of clients for the stub server, closed after the test."""
+    clients: list[Client] = []
+
+    def make_client(**kwargs: Unpack[ClientConfiguration]) -> Client:
+        client = Client(
+            **(
+                ClientConfiguration(
+                    organization="org", project="project", base_url=server.base_url
+                )
+                | kwargs
+            )
+        )
+        clients.append(client)
+        return client
+
+    yield make_client
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(make_client: ClientFactory) -> Client:
+    """Client for the stub server, with the default configuration."""
+    return make_client()
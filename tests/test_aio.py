@@ -0,0 +1,176 @@
+"""Tests of the asyncio client against the stub server."""
+
+import asyncio
+import io
+import zlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+
+import pytest
+
+from ado.aio import AsyncClient
+from ado.work_item_tracking.snapshot import SnapshotStore
+from ado.work_item_tracking.work_items import BulkOperation
+from benchmarks.stub_server import StubServer, content
+
+
+def _run[T](server: StubServer, scenario: Callable[[AsyncClient], Awaitable[T]]) -> T:
+    """Run ``scenario`` with an async client for the stub server."""
+
+    async def main() -> T:
+        client = AsyncClient(
+            organization="org", project="project", base_url=server.base_url
+        )
+        async with client:
+            return await scenario(client)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize(("prefetch", "requested"), [(True, 2), (False, 1)])
+def test_iter_all_prefetches_the_next_page(
+    server: StubServer, prefetch: bool, requested: int
+) -> None:
+    async def scenario(client: AsyncClient) -> tuple[int, list[int]]:
+        items = client.build.definitions.iter_all(prefetch=prefetch)
+        ids = [(await anext(items))["id"]]
+        await asyncio.sleep(0.1)
+        requested_after_first_item = len(server.received("GET", "build/definitions"))
+        ids += [item["id"] async for item in items]
+        return requested_after_first_item, ids
+
+    requested_after_first_item, ids = _run(server, scenario)
+
+    assert requested_after_first_item == requested
+    assert ids == list(range(1, 251))
+    assert len(server.received("GET", "build/definitions")) == 3
+
+
+def test_get_many_batches_ids_by_200(server: StubServer) -> None:
+    server.items = 450
+
+    items = _run(
+        server,
+        lambda client: _collect(
+            client.wit.work_items.get_many(range(1, 451), concurrency=2)
+        ),
+    )
+
+    assert [item["id"] for item in items] == list(range(1, 451))
+    batches = server.received("POST", "wit/workitemsbatch")
+    assert sorted(len(request["payload"]["ids"]) for request in batches) == [
+        50,
+        200,
+        200,
+    ]
+
+
+def test_bulk_packs_operations_into_batch_requests(server: StubServer) -> None:
+    operations = [
+        BulkOperation(item_type="Task", title=f"Task {i}") for i in range(250)
+    ]
+    operations.append(BulkOperation(work_item_id=1, title="Updated"))
+
+    results = _run(
+        server, lambda client: _collect(client.wit.work_items.bulk(operations))
+    )
+
+    assert [result["index"] for result in results] == list(range(251))
+    assert all(result["succeeded"] for result in results)
+    assert results[0]["body"]["fields"]["System.Title"] == "Task 0"
+    batches = server.received("POST", "wit/$batch")
+    assert sorted(len(request["payload"]) for request in batches) == [51, 200]
+
+
+def test_wiql_stream_pages_by_id(server: StubServer) -> None:
+    items = _run(
+        server,
+        lambda client: _collect(
+            client.wit.wiql.stream(
+                query="SELECT [System.Id] FROM WorkItems", page_size=100
+            )
+        ),
+    )
+
+    assert [item["id"] for item in items] == list(range(1, 251))
+    queries = [
+        request["payload"]["query"] for request in server.received("POST", "wit/wiql")
+    ]
+    assert [query.split("WHERE ")[1].split(" ")[:3] for query in queries] == [
+        ["[System.Id]", ">", "0"],
+        ["[System.Id]", ">", "100"],
+        ["[System.Id]", ">", "200"],
+    ]
+
+
+def test_sync_fetches_only_changes_since_watermark(
+    server: StubServer, tmp_path: Path
+) -> None:
+    store = SnapshotStore(tmp_path / "snapshot.db")
+
+    first = _run(server, lambda client: client.wit.work_items.sync(store))
+    fetched = len(server.received("POST", "wit/workitemsbatch"))
+    second = _run(server, lambda client: client.wit.work_items.sync(store))
+
+    assert first["upserted"] == len(store) == 250
+    assert second["upserted"] == 0
+    assert len(server.received("POST", "wit/workitemsbatch")) == fetched
+    store.close()
+
+
+def test_resumed_download_requests_the_missing_range(
+    server: StubServer, tmp_path: Path
+) -> None:
+    server.content_size = 300_000
+    dest = tmp_path / "log.txt"
+    dest.write_bytes(content(0, 100_000))
+
+    result = _run(
+        server,
+        lambda client: client.build.builds.download_log(1, 2, dest=dest, resume=True),
+    )
+
+    assert result == {"path": str(dest), "size": 300_000, "downloaded": 200_000}
+    assert dest.read_bytes() == content(0, 300_000)
+    (request,) = server.received("GET", "build/builds/1/logs/2")
+    assert request["headers"]["Range"] == "bytes=100000-"
+
+
+def test_parallel_download_in_parts(server: StubServer, tmp_path: Path) -> None:
+    server.content_size = 300_000
+    dest = tmp_path / "log.txt"
+
+    result = _run(
+        server,
+        lambda client: client.build.builds.download_log(
+            1, 2, dest=dest, parallel=3, part_size=128_000
+        ),
+    )
+
+    assert result == {"path": str(dest), "size": 300_000, "downloaded": 300_000}
+    assert dest.read_bytes() == content(0, 300_000)
+    assert sorted(
+        request["headers"]["Range"]
+        for request in server.received("GET", "build/builds/1/logs/2")
+    ) == ["bytes=0-127999", "bytes=128000-255999", "bytes=256000-299999"]
+
+
+def test_upload_in_chunks(server: StubServer) -> None:
+    data = content(0, 250_000)
+
+    reference = _run(
+        server,
+        lambda client: client.wit.attachments.upload(
+            io.BytesIO(data), file_name="data.bin", chunk_size=100_000, concurrency=2
+        ),
+    )
+
+    assert server.uploads[reference["id"]] == {
+        "bytes 0-99999/250000": zlib.crc32(data[:100_000]),
+        "bytes 100000-199999/250000": zlib.crc32(data[100_000:200_000]),
+        "bytes 200000-249999/250000": zlib.crc32(data[200_000:]),
+    }
+
+
+async def _collect[T](items: AsyncIterator[T]) -> list[T]:
+    return [item async for item in items]
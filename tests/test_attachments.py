@@ -0,0 +1,67 @@
+"""Tests of chunked attachment uploads."""
+
+import io
+import zlib
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+import requests
+
+from ado import Client
+from benchmarks.stub_server import StubServer, content
+
+
+def test_upload_in_chunks(client: Client, server: StubServer) -> None:
+    data = content(0, 250_000)
+
+    reference = client.wit.attachments.upload(
+        io.BytesIO(data), file_name="data.bin", chunk_size=100_000, concurrency=2
+    )
+
+    (create,) = server.received("POST", "wit/attachments")
+    assert create["query"] == {
+        "uploadType": "Chunked",
+        "fileName": "data.bin",
+        "api-version": "7.1",
+    }
+    assert server.uploads[reference["id"]] == {
+        "bytes 0-99999/250000": zlib.crc32(data[:100_000]),
+        "bytes 100000-199999/250000": zlib.crc32(data[100_000:200_000]),
+        "bytes 200000-249999/250000": zlib.crc32(data[200_000:]),
+    }
+
+
+def test_upload_file(client: Client, server: StubServer, tmp_path: Path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"notes")
+
+    reference = client.wit.attachments.upload(path)
+
+    assert server.received("POST", "wit/attachments")[0]["query"]["fileName"] == (
+        "notes.txt"
+    )
+    assert server.uploads[reference["id"]] == {"bytes 0-4/5": zlib.crc32(b"notes")}
+
+
+def test_upload_fails_with_a_failed_chunk(client: Client, server: StubServer) -> None:
+    server.fail("PUT", "wit/attachments", HTTPStatus.BAD_REQUEST, after=1)
+
+    with pytest.raises(requests.HTTPError, match="400"):
+        client.wit.attachments.upload(
+            io.BytesIO(content(0, 250_000)),
+            file_name="data.bin",
+            chunk_size=100_000,
+            concurrency=1,
+        )
+
+    assert len(server.received("PUT", "wit/attachments/251")) == 2
+
+
+def test_upload_fails_if_not_started(client: Client, server: StubServer) -> None:
+    server.fail("POST", "wit/attachments", HTTPStatus.UNAUTHORIZED)
+
+    with pytest.raises(requests.HTTPError, match="401"):
+        client.wit.attachments.upload(io.BytesIO(b"notes"), file_name="notes.txt")
+
+    assert not server.received("PUT", "wit/attachments/251")
@@ -0,0 +1,74 @@
+"""Timings of the benchmarked calls, with ``pytest-benchmark``.
+
+Run them alone with ``pytest tests/test_benchmarks.py --benchmark-only``.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import pytest
+import requests
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ado import Client
+from ado.transport import RequestsTransport, Transport, TransportResponse
+from benchmarks.run import BENCHMARKS
+from tests.conftest import ClientFactory
+
+
+class _SessionPerRequest:
+    """Sends every request with a new, unpooled session, as clients did before
+    sharing a pooled keep-alive session.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        auth: tuple[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        with requests.Session() as session:
+            return session.request(
+                method,
+                url,
+                params=params,
+                auth=auth,
+                headers=headers,
+                json=json,
+                data=data,
+                timeout=timeout,
+                stream=stream,
+            )
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_benchmark(benchmark: BenchmarkFixture, client: Client, name: str) -> None:
+    fn = BENCHMARKS[name]
+    fn(client)  # warm up connections
+    benchmark(fn, client)
+
+
+@pytest.mark.parametrize(
+    "transport_type",
+    [RequestsTransport, _SessionPerRequest],
+    ids=["pooled", "session-per-request"],
+)
+def test_benchmark_pooled_session(
+    benchmark: BenchmarkFixture,
+    make_client: ClientFactory,
+    transport_type: Callable[[], Transport],
+) -> None:
+    # Closed with the client
+    client = make_client(transport=transport_type())
+    client.build.definitions.list_all()  # warm up connections
+    benchmark(client.build.definitions.list_all)
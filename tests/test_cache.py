@@ -0,0 +1,51 @@
+"""Tests of the response cache."""
+
+import pytest
+
+from ado.cache import ResponseCache
+from benchmarks.stub_server import StubServer
+from tests.conftest import ClientFactory
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    """Cache whose entries are always stale, so every read is revalidated."""
+    return ResponseCache(ttl=0)
+
+
+def test_revalidates_with_etag(
+    make_client: ClientFactory, server: StubServer, cache: ResponseCache
+) -> None:
+    client = make_client(cache=cache)
+    first = client.build.definitions.get(1)
+    second = client.build.definitions.get(1)
+
+    assert second == first
+    requests = server.received("GET", "build/definitions/1")
+    assert "If-None-Match" not in requests[0]["headers"]
+    assert requests[1]["headers"]["If-None-Match"].startswith('"')
+    assert cache.stats == {"hits": 0, "misses": 1, "revalidated": 1}
+
+
+def test_refetches_changed_entities(
+    make_client: ClientFactory, server: StubServer, cache: ResponseCache
+) -> None:
+    client = make_client(cache=cache)
+    client.build.definitions.get(1)
+    server.revision = 2
+    changed = client.build.definitions.get(1)
+
+    assert changed["revision"] == 2
+    assert cache.stats["misses"] == 2
+
+
+def test_fresh_entries_skip_requests(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    cache = ResponseCache(ttl=60)
+    client = make_client(cache=cache)
+    assert len(client.build.definitions.list_all()) == 250
+    assert len(client.build.definitions.list_all()) == 250
+
+    assert len(server.received("GET", "build/definitions")) == 3
+    assert cache.stats["hits"] == 3
@@ -0,0 +1,38 @@
+"""Tests of request coalescing."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ado.coalesce import RequestCoalescer
+from benchmarks.stub_server import StubServer
+from tests.conftest import ClientFactory
+
+
+def test_concurrent_identical_gets_share_one_request(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    server.latency = 0.2
+    coalescer = RequestCoalescer()
+    client = make_client(coalescer=coalescer)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        definitions = list(
+            executor.map(lambda _: client.build.definitions.get(1), range(8))
+        )
+
+    assert all(definition is definitions[0] for definition in definitions)
+    assert len(server.received("GET", "build/definitions/1")) == 1
+    assert coalescer.stats == {"requests": 1, "coalesced": 7}
+
+
+def test_distinct_gets_are_not_coalesced(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    coalescer = RequestCoalescer()
+    client = make_client(coalescer=coalescer)
+
+    client.build.definitions.get(1)
+    client.build.definitions.get(1)
+    client.build.definitions.get(2)
+
+    assert len(server.received("GET", "build/definitions/1")) == 2
+    assert coalescer.stats == {"requests": 3, "coalesced": 0}
@@ -0,0 +1,69 @@
+"""Tests of child apis/endpoints and of listing with continuation tokens."""
+
+from ado import Client
+from ado.core import endpoint
+from ado.git import Git
+from ado.git.repositories import Repositories
+from benchmarks.stub_server import StubServer
+from tests.conftest import ClientFactory
+
+
+class _Repositories(Repositories):
+    pass
+
+
+class _Git(Git):
+    @endpoint
+    def repositories(self) -> _Repositories:
+        """Overridden repositories endpoint."""
+
+
+def test_endpoints_are_created_once_per_parent(make_client: ClientFactory) -> None:
+    client, other = make_client(), make_client()
+
+    assert client.wit.work_items is client.wit.work_items
+    assert client.wit is not other.wit
+    assert client.wit.work_items is not other.wit.work_items
+    assert client.wit.work_items.session is client.session
+
+
+def test_overridden_endpoints_are_memoized_separately(client: Client) -> None:
+    git = _Git(**client._configuration())
+
+    assert type(git.repositories) is _Repositories
+    assert git.repositories is git.repositories
+    assert type(Git.repositories.__get__(git, Git)) is Repositories
+    assert type(git.repositories) is _Repositories
+
+
+def test_iter_all_follows_continuation_tokens(
+    client: Client, server: StubServer
+) -> None:
+    definitions = list(client.build.definitions.iter_all())
+
+    assert [definition["id"] for definition in definitions] == list(range(1, 251))
+    assert [
+        request["query"].get("continuationToken")
+        for request in server.received("GET", "build/definitions")
+    ] == [None, "100", "200"]
+
+
+def test_iter_all_page_size_without_prefetch(
+    client: Client, server: StubServer
+) -> None:
+    definitions = client.build.definitions.iter_all(page_size=50, prefetch=False)
+
+    assert next(definitions)["id"] == 1
+    assert len(server.received("GET", "build/definitions")) == 1
+    assert len(list(definitions)) == 249
+    assert [
+        request["query"]["$top"]
+        for request in server.received("GET", "build/definitions")
+    ] == ["50"] * 5
+
+
+def test_list_all_with_filters(client: Client, server: StubServer) -> None:
+    assert len(client.build.definitions.list_all(name="entity-*")) == 250
+    assert server.received("GET", "build/definitions")[0]["query"]["name"] == (
+        "entity-*"
+    )
@@ -0,0 +1,23 @@
+"""Tests of typed decoding into msgspec structs."""
+
+import msgspec
+
+from ado.decoding import MsgspecDecoder
+from tests.conftest import ClientFactory
+
+
+def test_get_decodes_a_typed_item(make_client: ClientFactory) -> None:
+    client = make_client(decoder=MsgspecDecoder(typed=True))
+
+    definition = client.build.definitions.get(1)
+
+    assert isinstance(definition, msgspec.Struct)
+    assert definition.id == 1  # type: ignore[attr-defined]
+
+
+def test_typed_batch_omits_missing_items(make_client: ClientFactory) -> None:
+    client = make_client(decoder=MsgspecDecoder(typed=True))
+
+    items = list(client.wit.work_items.get_many([1, 251, 2], error_policy="omit"))
+
+    assert [item.id for item in items] == [1, 2]  # type: ignore[attr-defined]
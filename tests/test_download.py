@@ -0,0 +1,108 @@
+"""Tests of streamed, resumed and parallel downloads."""
+
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from ado import Client
+from ado.instrumentation import RequestEvent, RequestStart
+from benchmarks.stub_server import StubServer, content
+from tests.conftest import ClientFactory
+
+
+SIZE = 300_000
+
+
+@pytest.fixture(autouse=True)
+def _content_size(server: StubServer) -> None:
+    server.content_size = SIZE
+
+
+def test_download(client: Client, tmp_path: Path) -> None:
+    dest = tmp_path / "log.txt"
+
+    result = client.build.builds.download_log(1, 2, dest=dest, chunk_size=4096)
+
+    assert result == {"path": str(dest), "size": SIZE, "downloaded": SIZE}
+    assert dest.read_bytes() == content(0, SIZE)
+
+
+def test_resume_requests_the_missing_range(
+    client: Client, server: StubServer, tmp_path: Path
+) -> None:
+    dest = tmp_path / "log.txt"
+    dest.write_bytes(content(0, 100_000))
+
+    result = client.build.builds.download_log(1, 2, dest=dest, resume=True)
+
+    assert result == {"path": str(dest), "size": SIZE, "downloaded": 200_000}
+    assert dest.read_bytes() == content(0, SIZE)
+    (request,) = server.received("GET", "build/builds/1/logs/2")
+    assert request["headers"]["Range"] == "bytes=100000-"
+
+
+def test_resume_complete_download(client: Client, tmp_path: Path) -> None:
+    dest = tmp_path / "log.txt"
+    dest.write_bytes(content(0, SIZE))
+
+    result = client.build.builds.download_log(1, 2, dest=dest, resume=True)
+
+    assert result["downloaded"] == 0
+    assert dest.read_bytes() == content(0, SIZE)
+
+
+def test_parallel_download_in_parts(
+    client: Client, server: StubServer, tmp_path: Path
+) -> None:
+    dest = tmp_path / "log.txt"
+
+    result = client.build.builds.download_log(
+        1, 2, dest=dest, parallel=3, part_size=64_000
+    )
+
+    assert result == {"path": str(dest), "size": SIZE, "downloaded": SIZE}
+    assert dest.read_bytes() == content(0, SIZE)
+    assert sorted(
+        request["headers"]["Range"]
+        for request in server.received("GET", "build/builds/1/logs/2")
+    ) == [
+        "bytes=0-63999",
+        "bytes=128000-191999",
+        "bytes=192000-255999",
+        "bytes=256000-299999",
+        "bytes=64000-127999",
+    ]
+
+
+def test_parallel_download_without_range_support(
+    client: Client, server: StubServer, tmp_path: Path
+) -> None:
+    server.ignore_range = True
+    dest = tmp_path / "log.txt"
+
+    result = client.build.builds.download_log(
+        1, 2, dest=dest, parallel=3, part_size=64_000
+    )
+
+    assert result == {"path": str(dest), "size": SIZE, "downloaded": SIZE}
+    assert dest.read_bytes() == content(0, SIZE)
+    assert len(server.received("GET", "build/builds/1/logs/2")) == 1
+
+
+def test_parallel_download_raises_if_a_part_ignores_its_range(
+    make_client: ClientFactory, server: StubServer, tmp_path: Path
+) -> None:
+    class _IgnoreRangeAfterFirstPart:
+        def on_request_start(self, event: RequestStart, /) -> None:
+            pass
+
+        def on_request_end(self, event: RequestEvent, /) -> None:
+            server.ignore_range = event["status"] == HTTPStatus.PARTIAL_CONTENT
+
+    client = make_client(hooks=[_IgnoreRangeAfterFirstPart()])
+
+    with pytest.raises(ValueError, match="ignored the range request"):
+        client.build.builds.download_log(
+            1, 2, dest=tmp_path / "log.txt", parallel=3, part_size=64_000
+        )
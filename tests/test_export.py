@@ -0,0 +1,53 @@
+"""Tests of incremental definition exports."""
+
+import io
+import json
+from pathlib import Path
+
+from ado import Client
+from ado.build.export import DefinitionCache
+from benchmarks.stub_server import StubServer
+
+
+def _fetched(server: StubServer) -> list[str]:
+    return [
+        request["path"]
+        for request in server.history
+        if request["path"].startswith("build/definitions/")
+    ]
+
+
+def test_export_writes_one_ndjson_line_per_definition(client: Client) -> None:
+    buffer = io.BytesIO()
+
+    result = client.build.definitions.export(buffer)
+
+    lines = buffer.getvalue().splitlines()
+    assert result == {"exported": 250, "fetched": 250}
+    assert [json.loads(line)["id"] for line in lines] == list(range(1, 251))
+    assert json.loads(lines[0]) == client.build.definitions.get(1)
+
+
+def test_export_fetches_only_new_revisions(
+    client: Client, server: StubServer, tmp_path: Path
+) -> None:
+    cache = DefinitionCache(tmp_path / "definitions.db")
+    first, second, third = io.BytesIO(), io.BytesIO(), io.BytesIO()
+    client.build.definitions.export(first, cache=cache)
+    server.history.clear()
+
+    unchanged = client.build.definitions.export(second, cache=cache)
+    fetched_unchanged = _fetched(server)
+    server.revisions[7] = 2
+    edited = client.build.definitions.export(third, cache=cache)
+    cache.close()
+
+    assert unchanged == {"exported": 250, "fetched": 0}
+    assert fetched_unchanged == []
+    assert second.getvalue() == first.getvalue()
+    assert edited == {"exported": 250, "fetched": 1}
+    assert _fetched(server) == ["build/definitions/7"]
+    lines, previous = third.getvalue().splitlines(), first.getvalue().splitlines()
+    assert json.loads(lines.pop(6))["revision"] == 2
+    del previous[6]
+    assert lines == previous
@@ -0,0 +1,24 @@
+"""Tests of repository inventories."""
+
+import pytest
+
+from ado import Client
+from ado.git import repositories
+from benchmarks.stub_server import StubServer
+
+
+def test_inventory_skips_inactive_repositories_and_counts_refs_across_pages(
+    client: Client, server: StubServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(repositories, "REFS_PAGE_SIZE", 50)
+
+    stats = {row["name"]: row for row in client.git.inventory()}
+
+    # Every 50th repository is disabled, and the one after it in maintenance
+    assert len(stats) == 240
+    assert not {f"entity-{i}" for i in (1, 50, 51, 250)}.intersection(stats)
+    assert stats["entity-123"]["branches"] == 123
+    assert stats["entity-123"]["tags"] == 3
+    assert stats["entity-123"]["last_commit_id"] == f"{123:040x}"
+    assert len(server.received("GET", "git/repositories/123/refs")) == 3
+    assert len(server.received("GET", "git/repositories/50/refs")) == 0
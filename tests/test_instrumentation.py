@@ -0,0 +1,82 @@
+"""Tests of request instrumentation hooks."""
+
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+
+from ado.instrumentation import HistogramHook, OpenTelemetryHook
+from benchmarks.stub_server import StubServer
+from tests.conftest import ClientFactory
+
+
+def test_histogram_hook_summarizes_requests_by_endpoint(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    hook = HistogramHook()
+    client = make_client(hooks=[hook])
+    server.fail("GET", "build/definitions/7", HTTPStatus.NOT_FOUND)
+
+    client.build.definitions.list_all()
+    client.build.definitions.get(7)
+    client.wit.wiql.execute(query="SELECT [System.Id] FROM WorkItems")
+
+    summary = hook.summary()
+    assert summary.keys() == {"Definitions", "Wiql"}
+    definitions, wiql = summary["Definitions"], summary["Wiql"]
+    assert (definitions["count"], definitions["errors"]) == (4, 1)
+    assert 0 < definitions["p50"] <= definitions["p90"] <= definitions["p99"]
+    assert definitions["bytes_in"] > 0
+    assert definitions["bytes_out"] == 0
+    [query] = server.received("POST", "wit/wiql")
+    assert wiql["bytes_out"] == int(query["headers"]["Content-Length"])
+    assert (wiql["count"], wiql["errors"]) == (1, 0)
+
+
+class _Span:
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        self.name = name
+        self.kwargs = kwargs
+        self.status: Any = None
+        self.end_time: int | None = None
+
+    def set_status(self, status: Any) -> None:
+        self.status = status
+
+    def end(self, end_time: int) -> None:
+        self.end_time = end_time
+
+
+class _Tracer:
+    def __init__(self) -> None:
+        self.spans: list[_Span] = []
+
+    def start_span(self, name: str, **kwargs: Any) -> _Span:
+        self.spans.append(span := _Span(name, **kwargs))
+        return span
+
+
+def test_open_telemetry_hook_exports_a_span_per_attempt(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    trace = pytest.importorskip("opentelemetry.trace")
+    tracer = _Tracer()
+    client = make_client(hooks=[OpenTelemetryHook(tracer=tracer)])
+    server.fail("GET", "build/definitions/7", HTTPStatus.NOT_FOUND)
+
+    client.build.definitions.get(1)
+    client.build.definitions.get(7)
+
+    ok, failed = tracer.spans
+    assert ok.name == failed.name == "GET Definitions"
+    assert ok.kwargs["kind"] is trace.SpanKind.CLIENT
+    assert ok.kwargs["attributes"]["http.request.method"] == "GET"
+    assert ok.kwargs["attributes"]["url.full"].endswith("build/definitions/1")
+    assert ok.kwargs["attributes"]["http.response.status_code"] == HTTPStatus.OK
+    assert ok.kwargs["attributes"]["http.response.body.size"] > 0
+    assert ok.kwargs["attributes"]["ado.endpoint"] == "Definitions"
+    assert ok.end_time is not None
+    assert ok.end_time >= ok.kwargs["start_time"]
+    assert ok.status is None
+    assert failed.kwargs["attributes"]["http.response.status_code"] == 404
+    assert failed.status.status_code is trace.StatusCode.ERROR
@@ -0,0 +1,62 @@
+"""Tests of calls fanned out across projects and organizations."""
+
+import pytest
+
+from ado import Client, MultiClient
+from ado.rate_limit import RateLimiter
+from ado.transport import RequestsTransport
+from benchmarks.stub_server import StubServer
+
+
+def test_fan_out_closes_only_the_pools_it_created(
+    client: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    closed: list[RequestsTransport] = []
+
+    def close(transport: RequestsTransport) -> None:
+        closed.append(transport)
+
+    monkeypatch.setattr(RequestsTransport, "close", close)
+
+    results = list(
+        client.fan_out(
+            lambda c: len(c.build.definitions.list_all()),
+            projects=["project", ("other", "project")],
+        )
+    )
+
+    assert sorted(
+        (result["organization"], result["result"], result["error"])
+        for result in results
+    ) == [("org", 250, None), ("other", 250, None)]
+    assert len(closed) == 1
+    assert closed[0] is not client.session
+
+
+def test_multi_client_shares_a_configured_transport(server: StubServer) -> None:
+    transport = RequestsTransport()
+    with MultiClient(
+        [("org", "project"), ("other", "project")],
+        base_url=server.base_url,
+        transport=transport,
+    ) as multi:
+        results = list(multi.fan_out(lambda c: c.session))
+
+    assert [result["result"] for result in results] == [transport, transport]
+    transport.close()
+
+
+def test_multi_client_throttling_is_left_to_the_rate_limiter(
+    server: StubServer,
+) -> None:
+    server.throttle_every = 2
+    server.retry_after = 0.01
+    with MultiClient(
+        [("org", "project")],
+        base_url=server.base_url,
+        rate_limiter=RateLimiter(backoff=0.01),
+    ) as multi:
+        [result] = multi.fan_out(lambda c: len(c.build.definitions.list_all()))
+
+    assert result["result"] == 250
+    assert len(server.received("GET", "build/definitions")) == 5
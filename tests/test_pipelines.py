@@ -0,0 +1,59 @@
+"""Tests of batched pipeline permission grants."""
+
+from http import HTTPStatus
+
+import pytest
+
+from ado import Client
+from benchmarks.stub_server import StubServer
+
+
+GRANTS = {variable_group_id: [2] for variable_group_id in range(1, 151)}
+
+
+@pytest.mark.parametrize(
+    ("fetch_existing", "pipelines"),
+    [
+        (False, [{"id": 2, "authorized": True}]),
+        (True, [{"id": 2, "authorized": True}, {"id": 1, "authorized": True}]),
+    ],
+)
+def test_grant_many_patches_resources_in_batches_of_100(
+    client: Client,
+    server: StubServer,
+    fetch_existing: bool,
+    pipelines: list[dict[str, object]],
+) -> None:
+    variable_groups = client.pipelines.pipeline_permissions.variable_groups
+
+    results = variable_groups.grant_many(GRANTS, fetch_existing=fetch_existing)
+
+    batches = [
+        request["payload"]
+        for request in server.received("PATCH", "pipelines/pipelinePermissions")
+    ]
+    assert sorted(map(len, batches)) == [50, 100]
+    assert all(patch["pipelines"] == pipelines for batch in batches for patch in batch)
+    fetched = [
+        request["path"] for request in server.history if request["method"] == "GET"
+    ]
+    assert sorted(fetched) == sorted(
+        f"pipelines/pipelinePermissions/variablegroup/{variable_group_id}"
+        for variable_group_id in (GRANTS if fetch_existing else [])
+    )
+    assert results == {
+        variable_group_id: {"pipelines": pipelines, "message": None}
+        for variable_group_id in GRANTS
+    }
+
+
+def test_grant_many_reports_failed_batches_per_resource(
+    client: Client, server: StubServer
+) -> None:
+    server.fail("PATCH", "pipelines/pipelinePermissions", HTTPStatus.BAD_REQUEST)
+    variable_groups = client.pipelines.pipeline_permissions.variable_groups
+
+    results = variable_groups.grant_many(GRANTS, concurrency=1)
+
+    assert results[1] == {"pipelines": [], "message": "Injected failure."}
+    assert results[150] == {"pipelines": [], "message": "Injected failure."}
@@ -0,0 +1,73 @@
+"""Tests of throttling handled by the rate limiter."""
+
+import time
+from http import HTTPMethod, HTTPStatus
+
+import pytest
+import requests
+
+from ado.core import ClientConfiguration
+from ado.rate_limit import RateLimiter
+from benchmarks.stub_server import StubServer
+from tests.conftest import ClientFactory
+
+
+def test_retries_throttled_requests_after_retry_after(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    server.throttle_every = 2
+    server.retry_after = 0.2
+    client = make_client(rate_limiter=RateLimiter(backoff=0.01))
+
+    start = time.perf_counter()
+    definitions = client.build.definitions.list_all()
+
+    assert len(definitions) == 250
+    # Every page is throttled once, then retried once Retry-After has passed
+    assert len(server.received("GET", "build/definitions")) == 5
+    assert time.perf_counter() - start >= 0.4
+
+
+def test_throttling_slows_the_rate(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    server.throttle_every = 2
+    rate_limiter = RateLimiter(rate=50, backoff=0.01)
+    client = make_client(rate_limiter=rate_limiter)
+
+    client.build.definitions.list_all()
+
+    assert rate_limiter.rate < 50
+
+
+def test_gives_up_after_max_retries(
+    make_client: ClientFactory, server: StubServer
+) -> None:
+    server.throttle_every = 1
+    client = make_client(rate_limiter=RateLimiter(max_retries=2, backoff=0.01))
+
+    response = client.build.definitions._send(HTTPMethod.GET, 1)
+
+    assert response.status_code == 429
+    assert len(server.received("GET", "build/definitions/1")) == 3
+
+
+@pytest.mark.parametrize(
+    "configuration",
+    [
+        ClientConfiguration(rate_limiter=RateLimiter(max_retries=0)),
+        ClientConfiguration(max_retries=0),
+    ],
+    ids=["rate-limiter", "transport"],
+)
+def test_raises_once_throttled_listing_exhausts_retries(
+    make_client: ClientFactory, server: StubServer, configuration: ClientConfiguration
+) -> None:
+    server.throttle_every = 1
+    client = make_client(**configuration)
+
+    with pytest.raises(requests.HTTPError) as raised:
+        client.build.definitions.list_all()
+
+    assert raised.value.response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert len(server.received("GET", "build/definitions")) == 1
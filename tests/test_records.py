@@ -0,0 +1,30 @@
+"""Tests of records built from response items."""
+
+from typing import TypedDict
+
+from ado.records import RecordFactory
+
+
+class _Owner(TypedDict):
+    id: int
+
+
+class _Item(TypedDict):
+    name: str
+    owner: _Owner
+
+
+def test_nested_records_are_interned_up_to_a_bound() -> None:
+    records = RecordFactory(max_interned=2)
+
+    first, second = records.build_all(
+        _Item, [{"name": "a", "owner": {"id": 1}}, {"name": "b", "owner": {"id": 1}}]
+    )
+    for owner in range(2, 10):
+        records.build(_Item, {"name": "c", "owner": {"id": owner}})
+    third = records.build(_Item, {"name": "d", "owner": {"id": 1}})
+
+    assert first.owner == second.owner == third.owner == (1,)
+    assert first.owner is second.owner
+    assert third.owner is not first.owner
+    assert len(records._interned) == 2
@@ -0,0 +1,89 @@
+"""Tests of recording and replaying cassettes."""
+
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from ado.transport import (
+    RecordingTransport,
+    ReplayTransport,
+    RequestsTransport,
+    _cassette_url,
+)
+from benchmarks.stub_server import StubServer, content
+from tests.conftest import ClientFactory
+
+
+def test_replays_recorded_responses(
+    make_client: ClientFactory, server: StubServer, tmp_path: Path
+) -> None:
+    cassette = tmp_path / "cassette.jsonl"
+    recorder = make_client(transport=RecordingTransport(RequestsTransport(), cassette))
+    recorded = recorder.build.definitions.list_all()
+    recorded_work_item = recorder.wit.work_items.create("Task", title="Recorded")
+    recorder.close()
+    requests = server.requests
+
+    replayer = make_client(
+        transport=ReplayTransport(cassette, speed=0),
+        base_url="https://dev.azure.com/",
+    )
+
+    assert replayer.build.definitions.list_all() == recorded
+    assert replayer.wit.work_items.create("Task", title="Recorded") == (
+        recorded_work_item
+    )
+    assert server.requests == requests
+
+
+def test_replays_streamed_responses(
+    make_client: ClientFactory, server: StubServer, tmp_path: Path
+) -> None:
+    server.content_size = 10_000
+    cassette = tmp_path / "cassette.jsonl"
+    recorder = make_client(transport=RecordingTransport(RequestsTransport(), cassette))
+    recorder.build.builds.download_log(1, 2, dest=tmp_path / "recorded.txt")
+    recorder.close()
+
+    replayer = make_client(transport=ReplayTransport(cassette, speed=0))
+    replayer.build.builds.download_log(1, 2, dest=tmp_path / "replayed.txt")
+
+    assert (tmp_path / "replayed.txt").read_bytes() == (
+        tmp_path / "recorded.txt"
+    ).read_bytes()
+
+
+def test_unrecorded_request(make_client: ClientFactory, tmp_path: Path) -> None:
+    cassette = tmp_path / "cassette.jsonl"
+    cassette.touch()
+    client = make_client(transport=ReplayTransport(cassette, speed=0))
+
+    with pytest.raises(LookupError, match="build/definitions/1"):
+        client.build.definitions.get(1)
+
+
+def test_records_streamed_bodies_as_they_are_read(
+    server: StubServer, tmp_path: Path
+) -> None:
+    server.content_size = 10_000
+    cassette = tmp_path / "cassette.jsonl"
+    transport = RecordingTransport(RequestsTransport(), cassette)
+    url = f"{server.base_url}org/project/_apis/build/builds/1/logs/2"
+
+    with transport.request("GET", url, stream=True) as response:
+        assert cassette.read_text() == ""
+        chunks = list(response.iter_content(4096))
+    transport.close()
+
+    assert [len(chunk) for chunk in chunks] == [4096, 4096, 1808]
+    (interaction,) = map(json.loads, cassette.read_text().splitlines())
+    assert base64.b64decode(interaction["body"]) == content(0, 10_000)
+
+
+def test_cassette_urls_skip_none_params() -> None:
+    assert (
+        _cassette_url("https://example.com/a", {"b": None, "a": True, "c": 1})
+        == "https://example.com/a?a=True&c=1"
+    )
@@ -0,0 +1,180 @@
+"""Tests of batched, bulk and streamed work item requests, and of sync."""
+
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from ado import Client
+from ado.instrumentation import RequestEvent, RequestStart
+from ado.work_item_tracking.snapshot import SnapshotStore
+from ado.work_item_tracking.wiql import Wiql
+from ado.work_item_tracking.work_items import BulkOperation, WorkItemResponse
+from benchmarks.stub_server import StubServer
+from tests.conftest import ClientFactory
+
+
+def test_get_many_batches_ids_by_200(client: Client, server: StubServer) -> None:
+    server.items = 450
+    items = list(client.wit.work_items.get_many(range(1, 451), concurrency=2))
+
+    assert [item["id"] for item in items] == list(range(1, 451))
+    batches = server.received("POST", "wit/workitemsbatch")
+    assert sorted(len(request["payload"]["ids"]) for request in batches) == [
+        50,
+        200,
+        200,
+    ]
+
+
+def test_bulk_packs_operations_into_batch_requests(
+    client: Client, server: StubServer
+) -> None:
+    operations = [
+        BulkOperation(item_type="Task", title=f"Task {i}") for i in range(250)
+    ]
+    operations.append(BulkOperation(work_item_id=1, title="Updated"))
+
+    results = list(client.wit.work_items.bulk(operations))
+
+    assert [result["index"] for result in results] == list(range(251))
+    assert all(result["succeeded"] for result in results)
+    assert results[0]["body"]["fields"]["System.Title"] == "Task 0"
+    batches = server.received("POST", "wit/$batch")
+    assert sorted(len(request["payload"]) for request in batches) == [51, 200]
+    requests = [request for batch in batches for request in batch["payload"]]
+    assert {request["method"] for request in requests} == {"POST", "PATCH"}
+    assert all(
+        request["uri"].startswith("/project/_apis/wit/workitems/")
+        for request in requests
+    )
+
+
+def test_wiql_stream_pages_by_id(client: Client, server: StubServer) -> None:
+    items = list(
+        client.wit.wiql.stream(
+            query="SELECT [System.Id] FROM WorkItems WHERE [System.State] = 'Active'",
+            page_size=100,
+        )
+    )
+
+    assert [item["id"] for item in items] == list(range(1, 251))
+    requests = server.received("POST", "wit/wiql")
+    queries = [request["payload"]["query"] for request in requests]
+    assert [query.split("WHERE ")[1].split(" AND")[0] for query in queries] == [
+        "[System.Id] > 0",
+        "[System.Id] > 100",
+        "[System.Id] > 200",
+    ]
+    assert all(
+        query.endswith("([System.State] = 'Active') ORDER BY [System.Id]")
+        for query in queries
+    )
+    assert all("timePrecision" not in request["query"] for request in requests)
+
+
+def test_wiql_stream_rejects_other_orders(client: Client) -> None:
+    query = "SELECT [System.Id] FROM WorkItems ORDER BY {}"
+
+    with pytest.raises(ValueError, match="ordered by"):
+        next(client.wit.wiql.iter_ids(query=query.format("[System.ChangedDate]")))
+    assert next(client.wit.wiql.iter_ids(query=query.format("[System.Id] ASC"))) == 1
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[SnapshotStore]:
+    """Empty snapshot."""
+    store = SnapshotStore(tmp_path / "snapshot.db")
+    yield store
+    store.close()
+
+
+def test_sync_fetches_only_changes_since_watermark(
+    client: Client, server: StubServer, store: SnapshotStore
+) -> None:
+    result = client.wit.work_items.sync(store)
+    assert result["upserted"] == 250
+    assert len(store) == 250
+    watermark = store.watermark
+    assert watermark is not None
+
+    batches = len(server.received("POST", "wit/workitemsbatch"))
+    assert client.wit.work_items.sync(store)["upserted"] == 0
+    request = server.received("POST", "wit/wiql")[-1]
+    assert f"[System.ChangedDate] >= '{watermark}'" in request["payload"]["query"]
+    assert request["query"]["timePrecision"] == "True"
+    assert len(server.received("POST", "wit/workitemsbatch")) == batches
+
+    server.changed_date = "2099-01-01T00:00:00Z"
+    assert client.wit.work_items.sync(store)["upserted"] == 250
+
+
+def test_sync_skips_work_items_deleted_after_the_query(
+    make_client: ClientFactory, server: StubServer, store: SnapshotStore
+) -> None:
+    class _DeleteAfterQuery:
+        def on_request_start(self, event: RequestStart, /) -> None:
+            pass
+
+        def on_request_end(self, event: RequestEvent, /) -> None:
+            if event["endpoint"] is Wiql:
+                server.items = 200
+
+    client = make_client(hooks=[_DeleteAfterQuery()])
+
+    result = client.wit.work_items.sync(store)
+
+    assert result["upserted"] == len(store) == 200
+    assert store.watermark == result["watermark"]
+
+
+def test_sync_watermark_is_when_the_query_ran(
+    client: Client, server: StubServer, store: SnapshotStore
+) -> None:
+    # Work items changed after the first page was queried
+    server.changed_date = "2099-01-01T00:00:00Z"
+    before = datetime.now(UTC)
+
+    result = client.wit.work_items.sync(store)
+
+    assert result["watermark"] is not None
+    assert before <= datetime.fromisoformat(result["watermark"]) <= datetime.now(UTC)
+    assert store.watermark == result["watermark"]
+
+
+def test_upsert_watermark_compares_dates(store: SnapshotStore) -> None:
+    items = [
+        WorkItemResponse(
+            id=item_id, rev=1, fields={"System.ChangedDate": changed_date}, url=""
+        )
+        for item_id, changed_date in enumerate(
+            ["2024-01-01T00:00:01.5Z", "2024-01-01T00:00:01Z"]
+        )
+    ]
+
+    assert store.upsert(items)["watermark"] == "2024-01-01T00:00:01.5Z"
+
+
+def test_graph_links_of_a_type_that_was_not_followed(client: Client) -> None:
+    graph = client.wit.work_items.graph([1], depth=1, hydrate=False)
+
+    assert graph.links(1, "Child") == graph.links(1)
+    assert graph.links(1)
+    with pytest.raises(KeyError, match="only: Child"):
+        graph.links(1, "Parent")
+
+
+def test_template_adds_item_tags_to_its_static_tags(client: Client) -> None:
+    work_items = client.wit.work_items
+    template = work_items.template("Task", area="Area", tags=["imported", "shared"])
+
+    document = template.patch(title="Task", tags=["shared", "urgent"])
+
+    assert json.loads(document) == work_items._patch_operations(
+        area="Area", tags=["imported", "shared", "urgent"], title="Task"
+    )
+    assert json.loads(template.patch(title="Task")) == work_items._patch_operations(
+        area="Area", tags=["imported", "shared"], title="Task"
+    )